@@ -10,7 +10,8 @@ from typing import Dict, Any, List
 
 from ...core.base_agent import BaseAgent, BaseOrchestrator, BaseExecutor, BaseReviewer
 from ...core.types import (
-    Task, AgentRole, AgentResponse, ReviewResult, LLMRequest
+    Task, AgentRole, AgentResponse, ReviewResult, LLMRequest,
+    OrchestrationError, ExecutionError, ReviewError
 )
 from ...core.llm_client import get_llm_client
 from .prompts import (
@@ -29,6 +30,8 @@ class DomainAdvisorOrchestrator(BaseOrchestrator):
     Domain Advisor Orchestrator - Plans business requirements analysis approach.
     """
     
+    __slots__ = ()
+    
     async def _create_execution_plan(self, task: Task, context: Dict[str, Any]) -> Dict[str, Any]:
         """Create execution plan for domain analysis."""
         
@@ -56,43 +59,17 @@ class DomainAdvisorOrchestrator(BaseOrchestrator):
         
         response = await self.llm_client.generate_response(request)
         
-        if response.success:
-            try:
-                plan_data = await self.llm_client.parse_structured_response(response)
-                return plan_data.get("execution_plan", {})
-            except Exception as e:
-                logger.error(f"Failed to parse orchestration response: {e}")
-                return self._create_fallback_plan(task)
-        else:
-            logger.error(f"LLM orchestration failed: {response.error}")
-            return self._create_fallback_plan(task)
-    
-    def _create_fallback_plan(self, task: Task) -> Dict[str, Any]:
-        """Create a basic fallback execution plan."""
-        return {
-            "analysis_type": "general_analysis",
-            "focus_areas": ["domain_modeling", "requirements_analysis", "technical_specs"],
-            "extraction_steps": [
-                {
-                    "step": "domain_analysis",
-                    "description": "Extract entities, relationships, and business rules",
-                    "outputs": ["domain_model"]
-                },
-                {
-                    "step": "requirements_analysis", 
-                    "description": "Categorize and analyze requirements",
-                    "outputs": ["functional_requirements", "non_functional_requirements"]
-                },
-                {
-                    "step": "technical_specification",
-                    "description": "Create technical specifications",
-                    "outputs": ["technical_specifications"]
-                }
-            ],
-            "quality_gates": ["completeness_check", "consistency_validation"],
-            "estimated_duration": 15,
-            "required_resources": ["business_requirements", "domain_context"]
-        }
+        if not response.success:
+            raise OrchestrationError(f"LLM orchestration failed: {response.error}")
+        
+        try:
+            plan_data = await self.llm_client.parse_structured_response(response)
+        except ValueError as e:
+            raise OrchestrationError(f"Failed to parse orchestration response: {e}") from e
+        if not isinstance(plan_data, dict) or plan_data.get("parsed") is False:
+            raise OrchestrationError("Failed to parse orchestration response: no JSON object found")
+        
+        return plan_data.get("execution_plan", {})
 
 
 class DomainAdvisorExecutor(BaseExecutor):
@@ -100,6 +77,8 @@ class DomainAdvisorExecutor(BaseExecutor):
     Domain Advisor Executor - Performs the actual business requirements analysis.
     """
     
+    __slots__ = ()
+    
     async def _execute_task(self, task: Task, execution_plan: Dict[str, Any], 
                            context: Dict[str, Any]) -> Dict[str, Any]:
         """Execute domain analysis according to the plan."""
@@ -122,28 +101,23 @@ class DomainAdvisorExecutor(BaseExecutor):
             "technical_specifications": {}
         }
         
-        try:
-            # Step 1: Domain Analysis
-            logger.info(f"Performing domain analysis for task {task.task_id}")
-            domain_model = await self._perform_domain_analysis(task, context)
-            result["domain_model"] = domain_model
-            
-            # Step 2: Requirements Analysis
-            logger.info(f"Performing requirements analysis for task {task.task_id}")
-            requirements_analysis = await self._perform_requirements_analysis(task, domain_model)
-            result.update(requirements_analysis)
-            
-            # Step 3: Technical Specifications
-            logger.info(f"Creating technical specifications for task {task.task_id}")
-            technical_specs = await self._create_technical_specifications(domain_model, requirements_analysis)
-            result["technical_specifications"] = technical_specs
-            
-            logger.info(f"Domain analysis completed for task {task.task_id}")
-            return result
-            
-        except Exception as e:
-            logger.error(f"Domain analysis execution failed: {str(e)}")
-            return {"error": f"Execution failed: {str(e)}"}
+        # Step 1: Domain Analysis
+        logger.info(f"Performing domain analysis for task {task.task_id}")
+        domain_model = await self._perform_domain_analysis(task, context)
+        result["domain_model"] = domain_model
+        
+        # Step 2: Requirements Analysis
+        logger.info(f"Performing requirements analysis for task {task.task_id}")
+        requirements_analysis = await self._perform_requirements_analysis(task, domain_model)
+        result.update(requirements_analysis)
+        
+        # Step 3: Technical Specifications
+        logger.info(f"Creating technical specifications for task {task.task_id}")
+        technical_specs = await self._create_technical_specifications(domain_model, requirements_analysis)
+        result["technical_specifications"] = technical_specs
+        
+        logger.info(f"Domain analysis completed for task {task.task_id}")
+        return result
     
     async def _perform_domain_analysis(self, task: Task, context: Dict[str, Any]) -> Dict[str, Any]:
         """Perform domain modeling and entity extraction."""
@@ -178,15 +152,15 @@ class DomainAdvisorExecutor(BaseExecutor):
         
         response = await self.llm_client.generate_response(request)
         
-        if response.success:
-            try:
-                analysis = await self.llm_client.parse_structured_response(response)
-                return analysis.get("domain_model", {})
-            except Exception as e:
-                logger.error(f"Failed to parse domain analysis: {e}")
-                return self._create_fallback_domain_model(task)
-        else:
-            logger.error(f"Domain analysis LLM call failed: {response.error}")
+        if not response.success:
+            raise ExecutionError(f"Domain analysis LLM call failed: {response.error}")
+        
+        try:
+            analysis = await self.llm_client.parse_structured_response(response)
+            return analysis.get("domain_model", {})
+        except ValueError as e:
+            # Degrade to a minimal model; the reviewer decides whether to retry
+            logger.error(f"Failed to parse domain analysis: {e}")
             return self._create_fallback_domain_model(task)
     
     async def _perform_requirements_analysis(self, task: Task, domain_context: Dict[str, Any]) -> Dict[str, Any]:
@@ -206,21 +180,20 @@ class DomainAdvisorExecutor(BaseExecutor):
         
         response = await self.llm_client.generate_response(request)
         
-        if response.success:
-            try:
-                analysis = await self.llm_client.parse_structured_response(response)
-                return {
-                    "functional_requirements": analysis.get("functional_requirements", []),
-                    "non_functional_requirements": analysis.get("non_functional_requirements", []),
-                    "compliance_requirements": analysis.get("compliance_requirements", []),
-                    "user_personas": analysis.get("user_personas", []),
-                    "use_cases": analysis.get("use_cases", [])
-                }
-            except Exception as e:
-                logger.error(f"Failed to parse requirements analysis: {e}")
-                return self._create_fallback_requirements()
-        else:
-            logger.error(f"Requirements analysis LLM call failed: {response.error}")
+        if not response.success:
+            raise ExecutionError(f"Requirements analysis LLM call failed: {response.error}")
+        
+        try:
+            analysis = await self.llm_client.parse_structured_response(response)
+            return {
+                "functional_requirements": analysis.get("functional_requirements", []),
+                "non_functional_requirements": analysis.get("non_functional_requirements", []),
+                "compliance_requirements": analysis.get("compliance_requirements", []),
+                "user_personas": analysis.get("user_personas", []),
+                "use_cases": analysis.get("use_cases", [])
+            }
+        except ValueError as e:
+            logger.error(f"Failed to parse requirements analysis: {e}")
             return self._create_fallback_requirements()
     
     async def _create_technical_specifications(self, domain_model: Dict[str, Any], 
@@ -241,15 +214,14 @@ class DomainAdvisorExecutor(BaseExecutor):
         
         response = await self.llm_client.generate_response(request)
         
-        if response.success:
-            try:
-                specs = await self.llm_client.parse_structured_response(response)
-                return specs.get("technical_specifications", {})
-            except Exception as e:
-                logger.error(f"Failed to parse technical specifications: {e}")
-                return self._create_fallback_technical_specs()
-        else:
-            logger.error(f"Technical specifications LLM call failed: {response.error}")
+        if not response.success:
+            raise ExecutionError(f"Technical specifications LLM call failed: {response.error}")
+        
+        try:
+            specs = await self.llm_client.parse_structured_response(response)
+            return specs.get("technical_specifications", {})
+        except ValueError as e:
+            logger.error(f"Failed to parse technical specifications: {e}")
             return self._create_fallback_technical_specs()
     
     def _create_fallback_domain_model(self, task: Task) -> Dict[str, Any]:
@@ -287,51 +259,45 @@ class DomainAdvisorReviewer(BaseReviewer):
     Domain Advisor Reviewer - Validates the quality and completeness of domain analysis.
     """
     
+    __slots__ = ()
+    
     async def _review_result(self, task: Task, execution_result: Dict[str, Any], 
                            context: Dict[str, Any]) -> ReviewResult:
         """Review the domain analysis result for quality and completeness."""
         
         analysis_result = execution_result.get("result", {})
         
-        try:
-            # Perform completeness review
-            completeness_review = await self._review_completeness(task, analysis_result)
-            
-            # Perform technical validation
-            technical_review = await self._review_technical_specifications(task, analysis_result)
-            
-            # Combine reviews
-            overall_score = (completeness_review["confidence_score"] + technical_review["alignment_score"]) / 2
-            all_issues = completeness_review.get("issues", []) + technical_review.get("issues", [])
-            
-            # Determine approval
-            critical_issues = [issue for issue in all_issues if issue.get("severity") == "critical"]
-            approved = len(critical_issues) == 0 and overall_score >= 0.7
-            
-            return ReviewResult(
-                approved=approved,
-                score=overall_score,
-                issues=[issue.get("issue", str(issue)) for issue in all_issues],
-                suggestions=completeness_review.get("improvement_suggestions", []) + 
-                           technical_review.get("improvement_recommendations", []),
-                strengths=completeness_review.get("strengths", []),
-                metadata={
-                    "completeness_review": completeness_review,
-                    "technical_review": technical_review,
-                    "critical_issues_count": len(critical_issues)
-                }
-            )
-            
-        except Exception as e:
-            logger.error(f"Review failed for task {task.task_id}: {str(e)}")
-            return ReviewResult(
-                approved=False,
-                score=0.0,
-                issues=[f"Review process failed: {str(e)}"],
-                suggestions=["Retry the review process"],
-                strengths=[],
-                metadata={"error": str(e)}
-            )
+        # Perform completeness review
+        completeness_review = await self._review_completeness(task, analysis_result)
+        
+        # Perform technical validation
+        technical_review = await self._review_technical_specifications(task, analysis_result)
+        
+        scores = (completeness_review.get("confidence_score"), technical_review.get("alignment_score"))
+        if not all(isinstance(score, (int, float)) for score in scores):
+            raise ReviewError("Review response is missing its confidence or alignment score")
+        
+        # Combine reviews
+        overall_score = sum(scores) / 2
+        all_issues = completeness_review.get("issues", []) + technical_review.get("issues", [])
+        
+        # Determine approval
+        critical_issues = [issue for issue in all_issues if issue.get("severity") == "critical"]
+        approved = len(critical_issues) == 0 and overall_score >= 0.7
+        
+        return ReviewResult(
+            approved=approved,
+            score=overall_score,
+            issues=[issue.get("issue", str(issue)) for issue in all_issues],
+            suggestions=completeness_review.get("improvement_suggestions", []) + 
+                       technical_review.get("improvement_recommendations", []),
+            strengths=completeness_review.get("strengths", []),
+            metadata={
+                "completeness_review": completeness_review,
+                "technical_review": technical_review,
+                "critical_issues_count": len(critical_issues)
+            }
+        )
     
     async def _review_completeness(self, task: Task, analysis_result: Dict[str, Any]) -> Dict[str, Any]:
         """Review analysis for completeness."""
@@ -348,18 +314,19 @@ class DomainAdvisorReviewer(BaseReviewer):
             temperature=0.2  # Low temperature for consistent evaluation
         )
         
-        response = await self.llm_client.generate_response(request)
+        response = await self.llm_client.generate_batched(request)
         
-        if response.success:
-            try:
-                review = await self.llm_client.parse_structured_response(response)
-                return review.get("review_result", {})
-            except Exception as e:
-                logger.error(f"Failed to parse completeness review: {e}")
-                return self._create_fallback_review()
-        else:
-            logger.error(f"Completeness review LLM call failed: {response.error}")
-            return self._create_fallback_review()
+        if not response.success:
+            raise ReviewError(f"Completeness review LLM call failed: {response.error}")
+        
+        try:
+            review = await self.llm_client.parse_structured_response(response)
+        except ValueError as e:
+            raise ReviewError(f"Failed to parse completeness review: {e}") from e
+        if not isinstance(review, dict) or review.get("parsed") is False:
+            raise ReviewError("Failed to parse completeness review: no JSON object found")
+        
+        return review.get("review_result", {})
     
     async def _review_technical_specifications(self, task: Task, analysis_result: Dict[str, Any]) -> Dict[str, Any]:
         """Review technical specifications for validity."""
@@ -378,42 +345,19 @@ class DomainAdvisorReviewer(BaseReviewer):
             temperature=0.2
         )
         
-        response = await self.llm_client.generate_response(request)
+        response = await self.llm_client.generate_batched(request)
         
-        if response.success:
-            try:
-                review = await self.llm_client.parse_structured_response(response)
-                return review.get("validation_result", {})
-            except Exception as e:
-                logger.error(f"Failed to parse technical validation: {e}")
-                return self._create_fallback_technical_review()
-        else:
-            logger.error(f"Technical validation LLM call failed: {response.error}")
-            return self._create_fallback_technical_review()
-    
-    def _create_fallback_review(self) -> Dict[str, Any]:
-        """Create fallback completeness review."""
-        return {
-            "approved": True,
-            "confidence_score": 0.5,
-            "completeness_score": 0.5,
-            "accuracy_score": 0.5,
-            "issues": [],
-            "strengths": ["Analysis completed"],
-            "missing_elements": [],
-            "improvement_suggestions": []
-        }
-    
-    def _create_fallback_technical_review(self) -> Dict[str, Any]:
-        """Create fallback technical review."""
-        return {
-            "approved": True,
-            "alignment_score": 0.5,
-            "feasibility_score": 0.5,
-            "issues": [],
-            "compliance_coverage": [],
-            "improvement_recommendations": []
-        }
+        if not response.success:
+            raise ReviewError(f"Technical validation LLM call failed: {response.error}")
+        
+        try:
+            review = await self.llm_client.parse_structured_response(response)
+        except ValueError as e:
+            raise ReviewError(f"Failed to parse technical validation: {e}") from e
+        if not isinstance(review, dict) or review.get("parsed") is False:
+            raise ReviewError("Failed to parse technical validation: no JSON object found")
+        
+        return review.get("validation_result", {})
 
 
 class DomainAdvisorAgent(BaseAgent):
@@ -424,6 +368,8 @@ class DomainAdvisorAgent(BaseAgent):
     that can be used by other agents in the system.
     """
     
+    __slots__ = ()
+    
     def __init__(self, agent_id: str = "domain_advisor_001"):
         """Initialize the Domain Advisor Agent."""
         super().__init__(agent_id, AgentRole.DOMAIN_ADVISOR)
@@ -431,15 +377,46 @@ class DomainAdvisorAgent(BaseAgent):
     
     def _create_orchestrator(self) -> BaseOrchestrator:
         """Create the orchestrator component."""
-        return DomainAdvisorOrchestrator(self.agent_id)
+        return DomainAdvisorOrchestrator(self.agent_id, self.llm_client)
     
     def _create_executor(self) -> BaseExecutor:
         """Create the executor component."""
-        return DomainAdvisorExecutor(self.agent_id)
+        return DomainAdvisorExecutor(self.agent_id, self.llm_client)
     
     def _create_reviewer(self) -> BaseReviewer:
         """Create the reviewer component."""
-        return DomainAdvisorReviewer(self.agent_id)
+        return DomainAdvisorReviewer(self.agent_id, self.llm_client)
+    
+    async def _run_workflow(self, task: Task, context: Dict[str, Any] = None) -> AgentResponse:
+        """
+        Run a task through the agent workflow. A task without requirements
+        has nothing to analyze, so it gets an empty analysis without any LLM calls.
+        """
+        if task.requirements:
+            return await super()._run_workflow(task, context)
+        
+        logger.info(f"Task {task.task_id} has no requirements, returning an empty analysis")
+        return AgentResponse(
+            success=True,
+            result={
+                "analysis_type": "empty_input",
+                "domain_model": {},
+                "functional_requirements": [],
+                "non_functional_requirements": [],
+                "compliance_requirements": [],
+                "user_personas": [],
+                "use_cases": [],
+                "technical_specifications": {}
+            },
+            confidence=1.0,
+            execution_time=0.0,
+            metadata={
+                "agent_id": self.agent_id,
+                "agent_role": self.role.value,
+                "task_id": task.task_id,
+                "fast_path": "empty_input"
+            }
+        )
     
     async def analyze_business_requirements(self, requirements: List[str], 
                                           domain: str = "general",
@@ -457,12 +434,34 @@ class DomainAdvisorAgent(BaseAgent):
         Returns:
             AgentResponse with structured analysis results
         """
+        task = self._requirements_task(requirements, domain, stakeholders, compliance_needs)
+        return await self.process_task(task)
+    
+    async def analyze_business_requirements_batch(self, cases: List[Dict[str, Any]],
+                                                max_in_flight: int = 8) -> List[AgentResponse]:
+        """
+        Analyze several independent sets of business requirements concurrently.
+        
+        Args:
+            cases: Keyword arguments for analyze_business_requirements, one dict per case
+            max_in_flight: Maximum number of cases processed at once
+            
+        Returns:
+            AgentResponses in the order of ``cases``
+        """
+        tasks = [self._requirements_task(**case) for case in cases]
+        return await self.process_tasks(tasks, max_in_flight=max_in_flight)
+    
+    def _requirements_task(self, requirements: List[str], domain: str = "general",
+                           stakeholders: List[str] = None,
+                           compliance_needs: List[str] = None) -> Task:
+        """Build the analysis task for a set of business requirements."""
         if stakeholders is None:
             stakeholders = []
         if compliance_needs is None:
             compliance_needs = []
         
-        task = Task(
+        return Task(
             title="Business Requirements Analysis",
             description=f"Analyze business requirements for {domain} domain",
             requirements=requirements,
@@ -472,6 +471,4 @@ class DomainAdvisorAgent(BaseAgent):
                 "stakeholders": stakeholders,
                 "compliance_needs": compliance_needs
             }
-        )
-        
-        return await self.process_task(task)
\ No newline at end of file
+        )
\ No newline at end of file
@@ -5,12 +5,12 @@ Handles priority-based message routing and delivery.
 
 import asyncio
 import logging
+import sys
 import time
 from collections import defaultdict, deque
 from typing import Dict, Any, List, Optional, Callable, Set
-from dataclasses import asdict
 
-from ..core.types import Message, MessageType, TaskPriority, AgentRole
+from ..core.types import Message, MessageType, TaskPriority, AgentRole, PRIORITY_NAMES
 
 
 logger = logging.getLogger(__name__)
@@ -93,6 +93,8 @@ class MessageBus:
     
     def register_agent(self, agent_id: str, message_handler: Callable[[Message], Any]):
         """Register an agent with its message handler."""
+        # Interned to match the sender/recipient strings on protocol messages
+        agent_id = sys.intern(agent_id)
         self.agents[agent_id] = message_handler
         logger.info(f"Agent registered: {agent_id}")
     
@@ -135,8 +137,8 @@ class MessageBus:
             "message_id": message.message_id,
             "sender": message.sender,
             "recipient": message.recipient,
-            "message_type": message.message_type.value,
-            "priority": message.priority.value,
+            "message_type": message.message_type._value_,
+            "priority": PRIORITY_NAMES[message.priority],
             "timestamp": message.timestamp,
             "status": "queued"
         })
@@ -232,11 +234,10 @@ class MessageBus:
         """Get the next highest priority message for an agent."""
         queues = self.message_queues[agent_id]
         
-        # Check in priority order
-        for priority in [TaskPriority.CRITICAL, TaskPriority.HIGH, 
-                        TaskPriority.MEDIUM, TaskPriority.LOW]:
-            if queues[priority]:
-                return queues[priority].popleft()
+        # Queues are kept in priority order, most urgent first
+        for queue in queues.values():
+            if queue:
+                return queue.popleft()
         
         return None
     
@@ -7,15 +7,79 @@ import json
 import logging
 from typing import Dict, Any, Optional, List
 from datetime import datetime
+from enum import Enum
 
 from ..core.types import (
     Message, MessageType, TaskPriority, Task, AgentResponse,
-    AgentRole, WorkflowStep, ServiceRequest
+    AgentRole, WorkflowStep, ServiceRequest, PRIORITY_NAMES
 )
 
 
 logger = logging.getLogger(__name__)
 
+# Messages larger than this (approximate JSON bytes) trigger a size warning
+MAX_MESSAGE_SIZE = 100000  # 100KB
+
+
+def _estimate_size(obj: Any, limit: int = MAX_MESSAGE_SIZE) -> int:
+    """
+    Approximate the JSON-encoded size of a value without serializing it.
+    Stops walking as soon as the running total exceeds ``limit``.
+    """
+    size = 0
+    stack = [obj]
+    
+    while stack:
+        item = stack.pop()
+        
+        if isinstance(item, str):
+            size += len(item) + 2  # quotes
+        elif isinstance(item, dict):
+            size += 2 + 4 * len(item)  # braces, key quotes, separators
+            for key, value in item.items():
+                size += len(str(key))
+                stack.append(value)
+        elif isinstance(item, (list, tuple)):
+            size += 2 + 2 * len(item)  # brackets, separators
+            stack.extend(item)
+        elif item is None or isinstance(item, bool):
+            size += 5
+        else:
+            size += len(str(item))
+        
+        if size > limit:
+            break
+    
+    return size
+
+
+def _json_default(obj: Any) -> Any:
+    """JSON encoder hook for raw values kept in message content."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    # Anything else is stringified so serialization never raises
+    return str(obj)
+
+
+def _as_time_ns(value: Any) -> int:
+    """Accept epoch nanoseconds, a datetime, or its ISO string form."""
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return int(value.timestamp() * 1_000_000_000)
+
+
+def _as_datetime(value: Any) -> Optional[datetime]:
+    """Accept either a datetime or its ISO string form."""
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
 
 class ProtocolHelper:
     """Helper class for creating standardized messages between agents."""
@@ -31,26 +95,21 @@ class ProtocolHelper:
                 "title": task.title,
                 "description": task.description,
                 "requirements": task.requirements,
-                "priority": task.priority.value,
-                "required_agent_role": task.required_agent_role.value if task.required_agent_role else None,
+                "priority": PRIORITY_NAMES[task.priority],
+                "required_agent_role": task.required_agent_role,
                 "dependencies": task.dependencies,
                 "metadata": task.metadata,
                 "context": task.context,
-                "created_at": task.created_at.isoformat(),
-                "deadline": task.deadline.isoformat() if task.deadline else None
+                "created_at": task.created_at,
+                "deadline": task.deadline
             },
             "message_version": "1.0",
             "protocol": "task_request"
         }
         
-        return Message(
-            message_type=MessageType.TASK_REQUEST,
-            sender=sender,
-            recipient=recipient,
-            content=content,
-            priority=priority,
-            correlation_id=correlation_id,
-            requires_response=True
+        return Message._fast_new(
+            MessageType.TASK_REQUEST, sender, recipient, content,
+            priority, correlation_id, True
         )
     
     @staticmethod
@@ -74,12 +133,9 @@ class ProtocolHelper:
             "protocol": "task_response"
         }
         
-        return Message(
-            message_type=MessageType.TASK_RESPONSE,
-            sender=sender,
-            recipient=recipient,
-            content=content,
-            correlation_id=correlation_id
+        return Message._fast_new(
+            MessageType.TASK_RESPONSE, sender, recipient, content,
+            TaskPriority.MEDIUM, correlation_id
         )
     
     @staticmethod
@@ -91,17 +147,14 @@ class ProtocolHelper:
             "status": status,
             "details": details or {},
             "task_id": task_id,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now(),
             "message_version": "1.0",
             "protocol": "status_update"
         }
         
-        return Message(
-            message_type=MessageType.STATUS_UPDATE,
-            sender=sender,
-            recipient=recipient,
-            content=content,
-            priority=TaskPriority.LOW
+        return Message._fast_new(
+            MessageType.STATUS_UPDATE, sender, recipient, content,
+            TaskPriority.LOW
         )
     
     @staticmethod
@@ -113,17 +166,14 @@ class ProtocolHelper:
             "error": error,
             "context": context or {},
             "task_id": task_id,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now(),
             "message_version": "1.0",
             "protocol": "error_report"
         }
         
-        return Message(
-            message_type=MessageType.ERROR_REPORT,
-            sender=sender,
-            recipient=recipient,
-            content=content,
-            priority=TaskPriority.HIGH
+        return Message._fast_new(
+            MessageType.ERROR_REPORT, sender, recipient, content,
+            TaskPriority.HIGH
         )
     
     @staticmethod
@@ -135,18 +185,14 @@ class ProtocolHelper:
         content = {
             "collaboration_type": collaboration_type,
             "data": data,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now(),
             "message_version": "1.0",
             "protocol": "collaboration_request"
         }
         
-        return Message(
-            message_type=MessageType.COLLABORATION_REQUEST,
-            sender=sender,
-            recipient=recipient,
-            content=content,
-            priority=priority,
-            requires_response=True
+        return Message._fast_new(
+            MessageType.COLLABORATION_REQUEST, sender, recipient, content,
+            priority, None, True
         )
     
     @staticmethod
@@ -157,19 +203,25 @@ class ProtocolHelper:
         content = {
             "command": command,
             "workflow_data": workflow_data,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now(),
             "message_version": "1.0",
             "protocol": "workflow_control"
         }
         
-        return Message(
-            message_type=MessageType.WORKFLOW_CONTROL,
-            sender=sender,
-            recipient=recipient,
-            content=content,
-            priority=priority
+        return Message._fast_new(
+            MessageType.WORKFLOW_CONTROL, sender, recipient, content,
+            priority
         )
     
+    @staticmethod
+    def serialize_content(content: Dict[str, Any]) -> str:
+        """
+        Serialize message content to JSON.
+        Content holds raw datetimes and enums; they are converted here rather
+        than when the message is created.
+        """
+        return json.dumps(content, default=_json_default)
+    
     @staticmethod
     def extract_task_from_message(message: Message) -> Optional[Task]:
         """Extract a Task object from a task request message."""
@@ -179,13 +231,11 @@ class ProtocolHelper:
         try:
             task_data = message.content.get("task", {})
             
-            # Parse datetime fields
-            created_at = datetime.fromisoformat(task_data["created_at"])
-            deadline = None
-            if task_data.get("deadline"):
-                deadline = datetime.fromisoformat(task_data["deadline"])
+            # Parse time fields (raw in-process, ISO strings once serialized)
+            created_at = _as_time_ns(task_data["created_at"])
+            deadline = _as_datetime(task_data.get("deadline"))
             
-            # Parse enum fields
+            # Parse enum fields (accepts members or their string values)
             priority = TaskPriority(task_data.get("priority", "medium"))
             required_agent_role = None
             if task_data.get("required_agent_role"):
@@ -269,19 +319,16 @@ class ProtocolHelper:
                 issues.append("Task response missing success flag")
         
         # Check message size (warn if large)
-        try:
-            message_size = len(json.dumps(message.content))
-            if message_size > 100000:  # 100KB
-                warnings.append(f"Large message size: {message_size} bytes")
-        except:
-            warnings.append("Could not determine message size")
+        message_size = _estimate_size(message.content)
+        if message_size > MAX_MESSAGE_SIZE:
+            warnings.append(f"Large message size: {message_size} bytes")
         
         return {
             "valid": len(issues) == 0,
             "issues": issues,
             "warnings": warnings,
             "message_id": message.message_id,
-            "message_type": message.message_type.value
+            "message_type": message.message_type._value_
         }
     
     @staticmethod
@@ -291,17 +338,14 @@ class ProtocolHelper:
         content = {
             "type": "heartbeat",
             "status": status or {"state": "active"},
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now(),
             "message_version": "1.0",
             "protocol": "heartbeat"
         }
         
-        return Message(
-            message_type=MessageType.STATUS_UPDATE,
-            sender=sender,
-            recipient=recipient,
-            content=content,
-            priority=TaskPriority.LOW
+        return Message._fast_new(
+            MessageType.STATUS_UPDATE, sender, recipient, content,
+            TaskPriority.LOW
         )
     
     @staticmethod
@@ -322,13 +366,9 @@ class ProtocolHelper:
             "protocol": "service_request"
         }
         
-        return Message(
-            message_type=MessageType.COLLABORATION_REQUEST,
-            sender=sender,
-            recipient=recipient,
-            content=content,
-            priority=priority,
-            requires_response=True
+        return Message._fast_new(
+            MessageType.COLLABORATION_REQUEST, sender, recipient, content,
+            priority, None, True
         )
 
 
@@ -341,7 +381,7 @@ class MessageValidator:
         issues = []
         
         # Check for potentially dangerous content
-        content_str = json.dumps(content).lower()
+        content_str = ProtocolHelper.serialize_content(content).lower()
         
         dangerous_patterns = [
             "eval(",
@@ -372,22 +412,29 @@ class MessageValidator:
     def sanitize_content(content: Dict[str, Any]) -> Dict[str, Any]:
         """Sanitize message content by removing or escaping dangerous elements."""
         # This is a basic implementation - in production, use proper sanitization
-        sanitized = {}
-        
-        for key, value in content.items():
-            if isinstance(value, str):
-                # Basic sanitization - remove potential script tags
-                sanitized[key] = value.replace("<script", "&lt;script").replace("</script>", "&lt;/script&gt;")
-            elif isinstance(value, dict):
-                sanitized[key] = MessageValidator.sanitize_content(value)
-            elif isinstance(value, list):
-                sanitized[key] = [
-                    MessageValidator.sanitize_content(item) if isinstance(item, dict)
-                    else str(item).replace("<script", "&lt;script") if isinstance(item, str)
-                    else item
-                    for item in value
-                ]
-            else:
-                sanitized[key] = value
-        
-        return sanitized
\ No newline at end of file
+        return _sanitize_dict(content)
+
+
+def _sanitize_dict(content: Dict[str, Any]) -> Dict[str, Any]:
+    """Recursive worker for MessageValidator.sanitize_content."""
+    sanitized = {}
+    
+    for key, value in content.items():
+        if isinstance(value, str):
+            # Basic sanitization - remove potential script tags
+            if "<" in value:
+                value = value.replace("<script", "&lt;script").replace("</script>", "&lt;/script&gt;")
+            sanitized[key] = value
+        elif isinstance(value, dict):
+            sanitized[key] = _sanitize_dict(value)
+        elif isinstance(value, list):
+            sanitized[key] = [
+                _sanitize_dict(item) if isinstance(item, dict)
+                else item.replace("<script", "&lt;script") if isinstance(item, str) and "<" in item
+                else item
+                for item in value
+            ]
+        else:
+            sanitized[key] = value
+    
+    return sanitized
@@ -4,6 +4,8 @@ Each agent has Orchestrator, Executor, and Reviewer components.
 """
 
 import asyncio
+import functools
+import json
 import logging
 import time
 from abc import ABC, abstractmethod
@@ -11,23 +13,92 @@ from typing import Dict, Any, Optional, List
 
 from .types import (
     Task, AgentResponse, AgentRole, ReviewResult, 
-    LLMRequest, TaskStatus, ImprovementContext
+    LLMRequest, TaskStatus, ImprovementContext,
+    OrchestrationError, ExecutionError, ReviewError
 )
-from .llm_client import get_llm_client
+from .llm_client import LLMClient, get_llm_client
+from .plan_cache import get_plan_cache
 
 
 logger = logging.getLogger(__name__)
 
+# Deterministic, compact JSON for embedding structures in prompts; stable
+# output keeps prompt prefixes byte-identical across calls
+_canonical_json = functools.partial(json.dumps, sort_keys=True, separators=(",", ":"), default=str)
+
+# Static prompt scaffolding for plan validation/revision. Instructions come
+# first so every call shares the same leading bytes (server-side prefix caching)
+_VALIDATE_PREFIX = """Review this execution plan for completeness and feasibility.
+
+Evaluate:
+1. Does the plan address all requirements?
+2. Are the steps logical and achievable?
+3. Are there any missing elements?
+4. Are the estimated durations realistic?
+
+Respond with JSON:
+{
+    "valid": boolean,
+    "confidence": float (0-1),
+    "issues": ["list of issues if any"],
+    "suggestions": ["list of improvements"]
+}
+
+Task: """
+
+_REVISE_PREFIX = """Revise this execution plan to address the identified issues.
+Provide an improved execution plan as JSON.
+
+Original Plan:
+"""
+
+
+def enable_eager_task_factory(loop: Optional[asyncio.AbstractEventLoop] = None) -> bool:
+    """
+    Install asyncio's eager task factory on the event loop (Python 3.12+).
+    Coroutines wrapped in tasks (e.g. by asyncio.gather) then run inline until
+    they first suspend, skipping a scheduling round-trip on fast paths.
+    Call from the coroutine that starts the agent runtime. On older Pythons
+    this is a no-op and returns False.
+    """
+    factory = getattr(asyncio, "eager_task_factory", None)
+    if factory is None:
+        return False
+    
+    if loop is None:
+        loop = asyncio.get_running_loop()
+    loop.set_task_factory(factory)
+    return True
+
+
+def install_uvloop() -> bool:
+    """
+    Switch asyncio to uvloop's libuv-based event loop if it is installed.
+    Must run before the event loop is created (i.e. before asyncio.run).
+    Falls back to the stdlib loop and returns False when uvloop is missing.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        logger.debug("uvloop not installed, using the default asyncio event loop")
+        return False
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
 
 class BaseOrchestrator(ABC):
     """
     Base class for agent orchestrators.
     Responsible for analyzing tasks and creating execution plans.
+    Subclasses adding instance attributes must declare their own __slots__.
     """
     
-    def __init__(self, agent_id: str):
+    __slots__ = ("agent_id", "llm_client")
+    
+    def __init__(self, agent_id: str, llm_client: Optional[LLMClient] = None):
         self.agent_id = agent_id
-        self.llm_client = get_llm_client()
+        self.llm_client = llm_client if llm_client is not None else get_llm_client()
     
     async def orchestrate(self, task: Task, context: Dict[str, Any] = None) -> Dict[str, Any]:
         """
@@ -38,19 +109,31 @@ class BaseOrchestrator(ABC):
             context = {}
         
         try:
-            # Create execution plan using LLM
-            execution_plan = await self._create_execution_plan(task, context)
-            
-            # Validate the plan
-            validation_result = await self._validate_execution_plan(execution_plan, task)
+            # Reuse the plan of a previously approved identical task if we have one
+            execution_plan = None
+            if context.get("use_plan_cache", True):
+                execution_plan = get_plan_cache().get(type(self).__name__, task)
             
-            if not validation_result["valid"]:
-                # Revise plan if validation failed
-                execution_plan = await self._revise_execution_plan(
-                    execution_plan, validation_result["issues"], task, context
-                )
-            
-            logger.info(f"Orchestrator {self.agent_id} created execution plan for task {task.task_id}")
+            if execution_plan is not None:
+                logger.info("Orchestrator %s reused cached execution plan for task %s", self.agent_id, task.task_id)
+            else:
+                # Create execution plan using LLM
+                execution_plan = await self._create_execution_plan(task, context)
+                
+                # Cheap local check first; only ask the LLM to validate when the
+                # plan looks malformed or strict validation was requested
+                structural_issues = self._structural_check(execution_plan)
+                
+                if structural_issues or context.get("strict_validation"):
+                    validation_result = await self._validate_execution_plan(execution_plan, task)
+                    
+                    if structural_issues or not validation_result["valid"]:
+                        # Revise plan if validation failed
+                        execution_plan = await self._revise_execution_plan(
+                            execution_plan, structural_issues + validation_result.get("issues", []), task, context
+                        )
+                
+                logger.info("Orchestrator %s created execution plan for task %s", self.agent_id, task.task_id)
             
             return {
                 "execution_plan": execution_plan,
@@ -60,45 +143,67 @@ class BaseOrchestrator(ABC):
                 "quality_gates": execution_plan.get("quality_gates", [])
             }
             
+        except OrchestrationError as e:
+            logger.error("Orchestration failed for task %s: %s", task.task_id, e)
+            error = e
         except Exception as e:
-            logger.error(f"Orchestration failed for task {task.task_id}: {str(e)}")
-            return {
-                "execution_plan": {"error": f"Orchestration failed: {str(e)}"},
-                "estimated_duration": 0,
-                "success": False
-            }
+            # Unexpected component failures still produce a failed plan
+            logger.exception("Unexpected orchestration failure for task %s", task.task_id)
+            error = e
+        
+        return {
+            "execution_plan": {"error": f"Orchestration failed: {str(error)}"},
+            "estimated_duration": 0,
+            "success": False
+        }
+    
+    def cache_plan(self, task: Task, execution_plan: Dict[str, Any]):
+        """Remember an approved plan so identical tasks can skip planning."""
+        get_plan_cache().put(type(self).__name__, task, execution_plan)
     
     @abstractmethod
     async def _create_execution_plan(self, task: Task, context: Dict[str, Any]) -> Dict[str, Any]:
         """Create detailed execution plan for the task."""
         pass
     
+    def _structural_check(self, plan: Dict[str, Any]) -> List[str]:
+        """
+        Check the shape of an execution plan without calling the LLM.
+        Returns a list of issues; an empty list means the plan looks usable.
+        """
+        if not isinstance(plan, dict) or not plan:
+            return ["Execution plan is empty"]
+        
+        issues = []
+        
+        if "error" in plan:
+            issues.append(f"Execution plan reports an error: {plan['error']}")
+        
+        duration = plan.get("estimated_duration")
+        if duration is not None and not isinstance(duration, (int, float)):
+            issues.append("estimated_duration must be a number")
+        
+        for key in ("success_criteria", "quality_gates", "required_resources"):
+            if key in plan and not isinstance(plan[key], list):
+                issues.append(f"{key} must be a list")
+        
+        if not any(isinstance(value, list) and value
+                   for key, value in plan.items() if key.endswith("steps")):
+            issues.append("Execution plan has no steps")
+        
+        return issues
+    
     async def _validate_execution_plan(self, plan: Dict[str, Any], task: Task) -> Dict[str, Any]:
         """Validate the execution plan using LLM."""
-        validation_prompt = f"""
-        Review this execution plan for completeness and feasibility:
-        
-        Task: {task.title}
-        Description: {task.description}
-        Requirements: {task.requirements}
-        
-        Execution Plan:
-        {plan}
-        
-        Evaluate:
-        1. Does the plan address all requirements?
-        2. Are the steps logical and achievable?
-        3. Are there any missing elements?
-        4. Are the estimated durations realistic?
-        
-        Respond with JSON:
-        {{
-            "valid": boolean,
-            "confidence": float (0-1),
-            "issues": ["list of issues if any"],
-            "suggestions": ["list of improvements"]
-        }}
-        """
+        plan_json = _canonical_json(plan)
+        requirements_json = _canonical_json(task.requirements)
+        
+        validation_prompt = "".join((
+            _VALIDATE_PREFIX, task.title,
+            "\nDescription: ", task.description,
+            "\nRequirements: ", requirements_json,
+            "\n\nExecution Plan:\n", plan_json, "\n"
+        ))
         
         request = LLMRequest(
             prompt=validation_prompt,
@@ -106,12 +211,12 @@ class BaseOrchestrator(ABC):
             max_tokens=1000
         )
         
-        response = await self.llm_client.generate_response(request)
+        response = await self.llm_client.generate_batched(request)
         
         if response.success:
             try:
                 return await self.llm_client.parse_structured_response(response)
-            except:
+            except ValueError:
                 return {"valid": True, "confidence": 0.5, "issues": [], "suggestions": []}
         else:
             return {"valid": True, "confidence": 0.5, "issues": [], "suggestions": []}
@@ -120,22 +225,17 @@ class BaseOrchestrator(ABC):
                                    issues: List[str], task: Task, 
                                    context: Dict[str, Any]) -> Dict[str, Any]:
         """Revise execution plan based on validation issues."""
-        revision_prompt = f"""
-        Revise this execution plan to address the identified issues:
-        
-        Original Plan:
-        {original_plan}
-        
-        Issues to Address:
-        {issues}
-        
-        Task Context:
-        Title: {task.title}
-        Description: {task.description}
-        Requirements: {task.requirements}
+        plan_json = _canonical_json(original_plan)
+        issues_json = _canonical_json(issues)
+        requirements_json = _canonical_json(task.requirements)
         
-        Provide an improved execution plan as JSON.
-        """
+        revision_prompt = "".join((
+            _REVISE_PREFIX, plan_json,
+            "\n\nIssues to Address:\n", issues_json,
+            "\n\nTask Context:\nTitle: ", task.title,
+            "\nDescription: ", task.description,
+            "\nRequirements: ", requirements_json, "\n"
+        ))
         
         request = LLMRequest(
             prompt=revision_prompt,
@@ -143,13 +243,13 @@ class BaseOrchestrator(ABC):
             max_tokens=2000
         )
         
-        response = await self.llm_client.generate_response(request)
+        response = await self.llm_client.generate_batched(request)
         
         if response.success:
             try:
                 revised_plan = await self.llm_client.parse_structured_response(response)
                 return revised_plan
-            except:
+            except ValueError:
                 return original_plan
         else:
             return original_plan
@@ -159,11 +259,14 @@ class BaseExecutor(ABC):
     """
     Base class for agent executors.
     Responsible for executing the plan and coordinating with services.
+    Subclasses adding instance attributes must declare their own __slots__.
     """
     
-    def __init__(self, agent_id: str):
+    __slots__ = ("agent_id", "llm_client")
+    
+    def __init__(self, agent_id: str, llm_client: Optional[LLMClient] = None):
         self.agent_id = agent_id
-        self.llm_client = get_llm_client()
+        self.llm_client = llm_client if llm_client is not None else get_llm_client()
     
     async def execute(self, task: Task, execution_plan: Dict[str, Any], 
                      context: Dict[str, Any] = None,
@@ -184,19 +287,20 @@ class BaseExecutor(ABC):
         # Add improvement context to the execution context if provided
         if improvement_context:
             context['improvement_context'] = improvement_context
-            logger.info(f"Executor {self.agent_id} attempting retry #{improvement_context.attempt_number} "
-                       f"with {len(improvement_context.reviewer_feedback)} feedback items")
+            logger.info("Executor %s attempting retry #%d with %d feedback items",
+                       self.agent_id, improvement_context.attempt_number,
+                       len(improvement_context.reviewer_feedback))
         
         try:
-            start_time = time.time()
+            start_time = time.perf_counter()
             
             # Execute the main task logic
             result = await self._execute_task(task, execution_plan, context)
             
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             
-            logger.info(f"Executor {self.agent_id} completed task {task.task_id} "
-                       f"in {execution_time:.2f}s")
+            logger.info("Executor %s completed task %s in %.2fs",
+                       self.agent_id, task.task_id, execution_time)
             
             return {
                 "result": result,
@@ -209,15 +313,21 @@ class BaseExecutor(ABC):
                 }
             }
             
+        except ExecutionError as e:
+            logger.error("Execution failed for task %s: %s", task.task_id, e)
+            error = e
         except Exception as e:
-            logger.error(f"Execution failed for task {task.task_id}: {str(e)}")
-            return {
-                "result": {},
-                "execution_time": 0,
-                "success": False,
-                "error": str(e),
-                "metadata": {"agent_id": self.agent_id, "task_id": task.task_id}
-            }
+            # Unexpected component failures still produce a failed result
+            logger.exception("Unexpected execution failure for task %s", task.task_id)
+            error = e
+        
+        return {
+            "result": {},
+            "execution_time": 0,
+            "success": False,
+            "error": str(error),
+            "metadata": {"agent_id": self.agent_id, "task_id": task.task_id}
+        }
     
     @abstractmethod
     async def _execute_task(self, task: Task, execution_plan: Dict[str, Any], 
@@ -230,11 +340,14 @@ class BaseReviewer(ABC):
     """
     Base class for agent reviewers.
     Responsible for validating outputs and ensuring quality.
+    Subclasses adding instance attributes must declare their own __slots__.
     """
     
-    def __init__(self, agent_id: str):
+    __slots__ = ("agent_id", "llm_client")
+    
+    def __init__(self, agent_id: str, llm_client: Optional[LLMClient] = None):
         self.agent_id = agent_id
-        self.llm_client = get_llm_client()
+        self.llm_client = llm_client if llm_client is not None else get_llm_client()
     
     async def review(self, task: Task, execution_result: Dict[str, Any], 
                     context: Dict[str, Any] = None) -> ReviewResult:
@@ -246,12 +359,31 @@ class BaseReviewer(ABC):
             context = {}
         
         try:
+            # Cheap automated checks first: if approval is already impossible,
+            # skip the LLM review entirely
+            automated_checks = await self._perform_automated_checks(execution_result)
+            
+            if (not automated_checks["checks_performed"]["has_result"]
+                    or automated_checks["score"] == 0):
+                logger.info("Reviewer %s rejected task %s on automated checks, skipping LLM review",
+                           self.agent_id, task.task_id)
+                return ReviewResult(
+                    approved=False,
+                    score=automated_checks["score"],
+                    issues=automated_checks["issues"],
+                    suggestions=automated_checks["suggestions"],
+                    strengths=[],
+                    metadata={
+                        "reviewer_id": self.agent_id,
+                        "task_id": task.task_id,
+                        "llm_review": None,
+                        "automated_checks": automated_checks
+                    }
+                )
+            
             # Perform the review using LLM
             review_result = await self._review_result(task, execution_result, context)
             
-            # Additional automated checks
-            automated_checks = await self._perform_automated_checks(execution_result)
-            
             # Combine results
             final_score = (review_result.score + automated_checks.get("score", 1.0)) / 2
             
@@ -272,21 +404,27 @@ class BaseReviewer(ABC):
                 }
             )
             
-            logger.info(f"Reviewer {self.agent_id} completed review for task {task.task_id}: "
-                       f"approved={final_result.approved}, score={final_result.score:.2f}")
+            logger.info("Reviewer %s completed review for task %s: approved=%s, score=%.2f",
+                       self.agent_id, task.task_id, final_result.approved, final_result.score)
             
             return final_result
             
+        except ReviewError as e:
+            logger.error("Review failed for task %s: %s", task.task_id, e)
+            error = e
         except Exception as e:
-            logger.error(f"Review failed for task {task.task_id}: {str(e)}")
-            return ReviewResult(
-                approved=False,
-                score=0.0,
-                issues=[f"Review process failed: {str(e)}"],
-                suggestions=["Retry the review process"],
-                strengths=[],
-                metadata={"error": str(e)}
-            )
+            # Unexpected component failures still produce a rejecting review
+            logger.exception("Unexpected review failure for task %s", task.task_id)
+            error = e
+        
+        return ReviewResult(
+            approved=False,
+            score=0.0,
+            issues=[f"Review process failed: {str(error)}"],
+            suggestions=["Retry the review process"],
+            strengths=[],
+            metadata={"error": str(error)}
+        )
     
     @abstractmethod
     async def _review_result(self, task: Task, execution_result: Dict[str, Any], 
@@ -297,18 +435,26 @@ class BaseReviewer(ABC):
     async def _perform_automated_checks(self, execution_result: Dict[str, Any]) -> Dict[str, Any]:
         """Perform automated quality checks."""
         checks = {
-            "has_result": len(execution_result.get("result", {})) > 0,
+            "has_result": bool(execution_result.get("result")),
             "has_success_flag": "success" in execution_result,
             "no_errors": execution_result.get("error") is None
         }
         
-        score = sum(checks.values()) / len(checks)
-        issues = [f"Failed check: {check}" for check, passed in checks.items() if not passed]
+        passed = checks["has_result"] + checks["has_success_flag"] + checks["no_errors"]
+        
+        # Common case: everything passed, nothing to format
+        if passed == 3:
+            return {
+                "score": 1.0,
+                "issues": [],
+                "suggestions": [],
+                "checks_performed": checks
+            }
         
         return {
-            "score": score,
-            "issues": issues,
-            "suggestions": ["Address failed automated checks"] if issues else [],
+            "score": passed / 3,
+            "issues": [f"Failed check: {check}" for check, ok in checks.items() if not ok],
+            "suggestions": ["Address failed automated checks"],
             "checks_performed": checks
         }
 
@@ -317,13 +463,23 @@ class BaseAgent(ABC):
     """
     Base class for all agents in the system.
     Implements the hierarchical agent pattern with orchestrator, executor, and reviewer.
+    Subclasses adding instance attributes must declare their own __slots__.
     """
     
+    __slots__ = ("agent_id", "role", "status", "_in_flight", "created_at", "_created_perf", "llm_client",
+                 "max_retry_attempts", "retry_backoff_factor",
+                 "orchestrator", "executor", "reviewer")
+    
     def __init__(self, agent_id: str, role: AgentRole):
         self.agent_id = agent_id
         self.role = role
         self.status = TaskStatus.PENDING
-        self.created_at = time.time()
+        self._in_flight = 0  # Tasks currently inside process_task
+        self.created_at = time.time()  # Wall-clock creation time
+        self._created_perf = time.perf_counter()  # Monotonic reference for uptime
+        
+        # Shared by all components; resolved once per agent
+        self.llm_client = get_llm_client()
         
         # Retry configuration
         self.max_retry_attempts = 2
@@ -334,7 +490,7 @@ class BaseAgent(ABC):
         self.executor = self._create_executor()
         self.reviewer = self._create_reviewer()
         
-        logger.info(f"Initialized {role.value} agent: {agent_id}")
+        logger.info("Initialized %s agent: %s", role.value, agent_id)
     
     @abstractmethod
     def _create_orchestrator(self) -> BaseOrchestrator:
@@ -355,23 +511,41 @@ class BaseAgent(ABC):
         """
         Process a task through the complete agent workflow:
         Orchestrator -> Executor -> Reviewer
+        Tasks may overlap; ``status`` stays IN_PROGRESS until the last one
+        finishes and then reflects that task's outcome.
         """
+        self._in_flight += 1
+        self.status = TaskStatus.IN_PROGRESS
+        response = None
+        
+        try:
+            response = await self._run_workflow(task, context)
+            return response
+        finally:
+            self._in_flight -= 1
+            if not self._in_flight:
+                self.status = (TaskStatus.COMPLETED if response is not None and response.success
+                               else TaskStatus.FAILED)
+    
+    async def _run_workflow(self, task: Task, context: Optional[Dict[str, Any]]) -> AgentResponse:
+        """Run one task through the workflow; keeps all per-task state in locals."""
         if context is None:
             context = {}
         
-        start_time = time.time()
-        self.status = TaskStatus.IN_PROGRESS
+        start_time = time.perf_counter()
         
         try:
             # Phase 1: Orchestration
-            logger.info(f"Agent {self.agent_id} starting orchestration for task {task.task_id}")
+            logger.info("Agent %s starting orchestration for task %s", self.agent_id, task.task_id)
             orchestration_result = await self.orchestrator.orchestrate(task, context)
             
-            if not orchestration_result.get("execution_plan"):
+            if (not orchestration_result.get("execution_plan")
+                    or orchestration_result.get("success") is False):
                 return AgentResponse(
                     success=False,
-                    error="Orchestration failed to create execution plan",
-                    execution_time=time.time() - start_time
+                    error=(orchestration_result.get("execution_plan") or {}).get(
+                        "error", "Orchestration failed to create execution plan"),
+                    execution_time=time.perf_counter() - start_time
                 )
             
             # Phase 2 & 3: Execution and Review with Retry Loop
@@ -381,8 +555,8 @@ class BaseAgent(ABC):
             
             for attempt in range(self.max_retry_attempts + 1):
                 # Phase 2: Execution
-                logger.info(f"Agent {self.agent_id} starting execution for task {task.task_id} "
-                           f"(attempt {attempt + 1}/{self.max_retry_attempts + 1})")
+                logger.info("Agent %s starting execution for task %s (attempt %d/%d)",
+                           self.agent_id, task.task_id, attempt + 1, self.max_retry_attempts + 1)
                 
                 execution_result = await self.executor.execute(
                     task, orchestration_result["execution_plan"], context, improvement_context
@@ -393,40 +567,45 @@ class BaseAgent(ABC):
                     return AgentResponse(
                         success=False,
                         error=execution_result.get("error", "Execution failed"),
-                        execution_time=time.time() - start_time,
+                        execution_time=time.perf_counter() - start_time,
                         metadata={
                             "agent_id": self.agent_id,
                             "agent_role": self.role.value,
                             "task_id": task.task_id,
-                            "attempts": attempt + 1,
+                            "attempts": attempt + 1
+                        },
+                        _trace={
+                            "orchestration": orchestration_result,
                             "execution_results": execution_results
                         }
                     )
                 
                 # Phase 3: Review
-                logger.info(f"Agent {self.agent_id} starting review for task {task.task_id}")
+                logger.info("Agent %s starting review for task %s", self.agent_id, task.task_id)
                 review_result = await self.reviewer.review(task, execution_result, context)
                 review_results.append(review_result)
                 
                 if review_result.approved:
                     # Success! Exit the retry loop
-                    logger.info(f"Agent {self.agent_id} passed review on attempt {attempt + 1}")
+                    logger.info("Agent %s passed review on attempt %d", self.agent_id, attempt + 1)
                     break
                     
                 elif attempt < self.max_retry_attempts:
                     # Failed review but have retries left
-                    logger.warning(f"Agent {self.agent_id} failed review on attempt {attempt + 1}, "
-                                 f"will retry with feedback. Score: {review_result.score:.2f}")
+                    logger.warning("Agent %s failed review on attempt %d, will retry with feedback. Score: %.2f",
+                                 self.agent_id, attempt + 1, review_result.score)
                     
                     # Create improvement context for next attempt
                     if improvement_context is None:
                         improvement_context = ImprovementContext(
                             attempt_number=1,
-                            previous_results=[execution_result.get("result", {})],
                             reviewer_feedback=review_result.issues,
                             reviewer_suggestions=review_result.suggestions,
-                            quality_scores=[review_result.score],
-                            improvement_history=[f"Attempt 1 failed with score {review_result.score:.2f}"]
+                            quality_scores=[review_result.score]
+                        )
+                        improvement_context.previous_results.append(execution_result.get("result", {}))
+                        improvement_context.improvement_history.append(
+                            f"Attempt 1 failed with score {review_result.score:.2f}"
                         )
                     else:
                         improvement_context.attempt_number += 1
@@ -440,16 +619,18 @@ class BaseAgent(ABC):
                     
                     # Add backoff delay before retry
                     backoff_delay = (self.retry_backoff_factor ** attempt) * 2
-                    logger.info(f"Waiting {backoff_delay:.1f}s before retry...")
+                    logger.info("Waiting %.1fs before retry...", backoff_delay)
                     await asyncio.sleep(backoff_delay)
                 else:
                     # No more retries
-                    logger.error(f"Agent {self.agent_id} exhausted all {self.max_retry_attempts} retries")
+                    logger.error("Agent %s exhausted all %d retries", self.agent_id, self.max_retry_attempts)
             
             # Use the last review result for final response
             final_review = review_results[-1]
-            total_time = time.time() - start_time
-            self.status = TaskStatus.COMPLETED if final_review.approved else TaskStatus.FAILED
+            total_time = time.perf_counter() - start_time
+            
+            if final_review.approved and context.get("use_plan_cache", True):
+                self.orchestrator.cache_plan(task, orchestration_result["execution_plan"])
             
             # Compile final response
             response = AgentResponse(
@@ -463,50 +644,62 @@ class BaseAgent(ABC):
                     "agent_id": self.agent_id,
                     "agent_role": self.role.value,
                     "task_id": task.task_id,
-                    "orchestration": orchestration_result,
                     "total_attempts": len(execution_results),
-                    "execution_results": execution_results,
-                    "review_results": [
-                        {
-                            "approved": r.approved,
-                            "score": r.score,
-                            "issues": r.issues,
-                            "suggestions": r.suggestions
-                        } for r in review_results
-                    ],
-                    "improvement_context": improvement_context.__dict__ if improvement_context else None,
                     "workflow_times": {
                         "total": total_time,
                         "execution": execution_result.get("execution_time", 0)
                     }
                 },
-                suggestions=final_review.suggestions
+                suggestions=final_review.suggestions,
+                # Heavy per-phase results, only formatted on full_trace()
+                _trace={
+                    "orchestration": orchestration_result,
+                    "execution_results": execution_results,
+                    "review_results": review_results,
+                    "improvement_context": improvement_context
+                }
             )
             
-            logger.info(f"Agent {self.agent_id} completed task {task.task_id}: "
-                       f"success={response.success}, confidence={response.confidence:.2f}, "
-                       f"attempts={len(execution_results)}")
+            logger.info("Agent %s completed task %s: success=%s, confidence=%.2f, attempts=%d",
+                       self.agent_id, task.task_id, response.success, response.confidence,
+                       len(execution_results))
             
             return response
             
         except Exception as e:
-            self.status = TaskStatus.FAILED
-            logger.error(f"Agent {self.agent_id} failed processing task {task.task_id}: {str(e)}")
+            # Single traceback for unexpected errors raised anywhere in the workflow
+            logger.exception("Agent %s failed processing task %s", self.agent_id, task.task_id)
             
             return AgentResponse(
                 success=False,
                 error=f"Agent processing failed: {str(e)}",
-                execution_time=time.time() - start_time,
+                execution_time=time.perf_counter() - start_time,
                 metadata={"agent_id": self.agent_id, "task_id": task.task_id}
             )
-    
+
+    async def process_tasks(self, tasks: List[Task], max_in_flight: int = 8,
+                            context: Dict[str, Any] = None) -> List[AgentResponse]:
+        """
+        Process several tasks concurrently, overlapping one task's orchestration
+        with another's execution and review. At most ``max_in_flight`` tasks run
+        at once; responses are returned in the order of ``tasks``.
+        """
+        semaphore = asyncio.Semaphore(max(1, max_in_flight))
+
+        async def run(task: Task) -> AgentResponse:
+            async with semaphore:
+                # The executor adds per-attempt entries, so each task gets its own context
+                return await self.process_task(task, dict(context) if context else None)
+
+        return list(await asyncio.gather(*(run(task) for task in tasks)))
+
     def get_status(self) -> Dict[str, Any]:
         """Get current agent status and metrics."""
         return {
             "agent_id": self.agent_id,
             "role": self.role.value,
             "status": self.status.value,
-            "uptime": time.time() - self.created_at,
+            "uptime": time.perf_counter() - self._created_perf,
             "components": {
                 "orchestrator": type(self.orchestrator).__name__,
                 "executor": type(self.executor).__name__,
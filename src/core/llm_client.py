@@ -6,17 +6,184 @@ Provides unified interface with error handling, retries, and response parsing.
 import asyncio
 import json
 import logging
+import os
+import random
+import re
+import threading
 import time
-from typing import Dict, Any, Optional, List
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Set, Tuple, Callable, Awaitable
 import httpx
-from dataclasses import asdict
+from dataclasses import replace
 
 from .types import LLMRequest, LLMResponse
 from .ollama_client import OllamaProvider
+from .response_cache import ResponseCache, LRUMemoryBackend, DiskBackend, SemanticCache
 
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    _json_loads = orjson.loads  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    _json_dumps_bytes = orjson.dumps
+    
+    def _json_dumps_indented(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+    
+    def _json_dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+    
+    def _json_dumps_indented(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
+# Responses longer than this that are not plain JSON are scanned in a worker
+# thread so repeated candidate decoding does not stall the event loop
+_INLINE_EXTRACT_LIMIT = 4096
+
+# HTTP/2 needs the h2 package (httpx[http2]); fall back to HTTP/1.1 without it
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+_JSON_FENCE_RE = re.compile(r"```(?:json|JSON)?\s*(.+?)```", re.DOTALL)
+_json_decoder = json.JSONDecoder()
+
+
+class LLMRequestBatcher:
+    """
+    Coalesces LLM requests issued concurrently by different agents.
+    Pending requests are dispatched together once ``max_batch_size`` is reached
+    or ``max_wait`` seconds have elapsed; identical requests share one call.
+    While no batch is in flight, requests are sent without the ``max_wait`` delay.
+    """
+    
+    def __init__(self, send: Callable[[LLMRequest], Awaitable[LLMResponse]],
+                 max_batch_size: int = 16, max_wait: float = 0.02):
+        """Initialize the batcher around a single-request send function."""
+        self._send = send
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._pending: List[Tuple[LLMRequest, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.Handle] = None
+        # Running dispatches; holding them keeps the tasks from being collected
+        self._dispatches: Set[asyncio.Task] = set()
+    
+    async def submit(self, request: LLMRequest) -> LLMResponse:
+        """Queue a request and wait for its response."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((request, future))
+        
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            if self._dispatches:
+                self._flush_handle = loop.call_later(self.max_wait, self._flush)
+            else:
+                # Nothing in flight: only wait for callers already scheduled
+                # in this loop iteration
+                self._flush_handle = loop.call_soon(self._flush)
+        
+        return await future
+    
+    def _flush(self):
+        """Dispatch everything queued so far."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._dispatch(batch))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatch_done)
+    
+    def _dispatch_done(self, task: asyncio.Task):
+        """Forget a finished dispatch and surface errors not delivered to a waiter."""
+        self._dispatches.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"LLM batch dispatch failed: {task.exception()!r}")
+    
+    async def _dispatch(self, batch: List[Tuple[LLMRequest, asyncio.Future]]):
+        """Send one call per distinct request and fan results back out."""
+        groups: Dict[tuple, List[Tuple[LLMRequest, asyncio.Future]]] = {}
+        for request, future in batch:
+            key = (request.model, request.system_prompt, request.prompt,
+                   request.max_tokens, request.temperature, request.stop_at_json_end)
+            groups.setdefault(key, []).append((request, future))
+        
+        try:
+            results = await asyncio.gather(
+                *(self._send(members[0][0]) for members in groups.values()),
+                return_exceptions=True
+            )
+            
+            for members, result in zip(groups.values(), results):
+                for request, future in members:
+                    if future.done():
+                        continue
+                    if isinstance(result, BaseException):
+                        future.set_exception(result)
+                    else:
+                        # Responses may be shared (cache hits), so each waiter gets its own copy
+                        future.set_result(replace(result, request_id=request.request_id))
+        except BaseException as e:
+            # Never leave a waiter hanging, whatever went wrong
+            for _, future in batch:
+                if not future.done():
+                    if isinstance(e, asyncio.CancelledError):
+                        future.cancel()
+                    else:
+                        future.set_exception(e)
+            raise
+
+
+class AsyncRateLimiter:
+    """
+    Leaky-bucket rate limiter allowing ``max_rate`` acquisitions per
+    ``time_period`` seconds. Waiters are admitted one at a time in arrival
+    order as capacity drains, so requests are spread out instead of being
+    released together when a window rolls over.
+    """
+    
+    def __init__(self, max_rate: float, time_period: float = 60.0):
+        """Initialize the limiter with an empty bucket."""
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._drain_rate = max_rate / time_period
+        self._level = 0.0
+        self._last_check = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    def _drain(self):
+        now = time.monotonic()
+        self._level = max(0.0, self._level - (now - self._last_check) * self._drain_rate)
+        self._last_check = now
+    
+    async def acquire(self):
+        """Wait until a request may be sent."""
+        async with self._lock:
+            self._drain()
+            while self._level + 1 > self.max_rate:
+                wait_time = (self._level + 1 - self.max_rate) / self._drain_rate
+                logger.debug(f"Rate limiting: waiting {wait_time:.2f}s")
+                await asyncio.sleep(wait_time)
+                self._drain()
+            self._level += 1
+    
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        pass
+
 
 class LLMClient:
     """
@@ -24,27 +191,126 @@ class LLMClient:
     Handles authentication, rate limiting, retries, and response parsing.
     """
     
+    # Created on first use by generate_batched
+    _batcher: Optional[LLMRequestBatcher] = None
+    # Long-lived HTTP clients keyed by base URL, created on first use
+    _http_clients: Optional[Dict[str, httpx.AsyncClient]] = None
+    # Exact-match cache for temperature-0 requests; None disables caching
+    response_cache: Optional[ResponseCache] = None
+    # Embedding-similarity cache consulted after an exact-match miss
+    semantic_cache: Optional[SemanticCache] = None
+    
     def __init__(self, config: Dict[str, Any]):
-        """Initialize LLM client with configuration."""
+        """
+        Initialize LLM client with configuration.
+        
+        HTTP connection pools are sized by ``http_max_connections`` (default 500),
+        ``http_max_keepalive`` (default 200) and ``http_keepalive_expiry``
+        (seconds, default 60.0). Anthropic and OpenAI use HTTP/2 when the h2
+        package is installed, unless ``http2`` is False.
+        
+        Temperature-0 responses are cached unless ``enable_response_cache`` is
+        False; tune with ``cache_max_entries`` and ``cache_ttl`` (seconds).
+        With ``cache_dir`` (or LLM_CACHE=1 in the environment, which uses
+        .cache/llm) the cache is kept on disk across runs and, by default,
+        also covers requests with temperature up to 0.1; override with
+        ``cache_max_temperature``.
+        LLM_CACHE=golden serves recorded responses, at any temperature, from
+        ``golden_dir`` (default tests/goldens) so tests can run without a
+        model. A request with no recording raises MissingGoldenError; run once
+        with UPDATE_GOLDENS=1 against a live model to (re-)record them.
+        Setting ``enable_semantic_cache`` adds a similarity tier that embeds
+        prompts with the Ollama ``embedding_model`` and reuses responses above
+        ``semantic_threshold`` (default 0.92).
+        """
         self.config = config
         self.anthropic_api_key = config.get("anthropic_api_key")
         self.openai_api_key = config.get("openai_api_key")
         self.ollama_base_url = config.get("ollama_base_url", "http://localhost:11434")
         self.default_provider = config.get("default_provider", "anthropic")
         
-        # Initialize Ollama provider if needed
-        if self.default_provider == "ollama" or config.get("enable_ollama", False):
-            self.ollama_provider = OllamaProvider(self.ollama_base_url)
+        # Ollama provider; its HTTP pool opens no connections until first use
+        self.ollama_provider = OllamaProvider(self.ollama_base_url, limits=self._http_limits())
         self.max_retries = config.get("max_retries", 3)
         self.retry_delay = config.get("retry_delay", 1.0)
+        self.retry_delay_max = config.get("retry_delay_max", 30.0)
         self.timeout = config.get("timeout", 60.0)
         
         # Rate limiting
         self.rate_limit_requests_per_minute = config.get("rate_limit_rpm", 50)
-        self.last_request_time = 0
-        self.request_count = 0
-        self.rate_limit_window_start = time.time()
+        self._rate_limiter = AsyncRateLimiter(self.rate_limit_requests_per_minute, 60.0)
+        
+        if config.get("enable_response_cache", True):
+            cache_mode = os.environ.get("LLM_CACHE")
+            cache_dir = config.get("cache_dir")
+            cache_ttl = config.get("cache_ttl", 3600.0)
+            golden = cache_mode == "golden"
+            recording = golden and os.environ.get("UPDATE_GOLDENS") == "1"
+            if golden:
+                # Recorded test fixtures: they never expire and are re-recorded on demand
+                cache_dir, cache_ttl = config.get("golden_dir", "tests/goldens"), None
+            elif not cache_dir and cache_mode == "1":
+                cache_dir = ".cache/llm"
+            if cache_dir:
+                backend = DiskBackend(cache_dir)
+            else:
+                backend = LRUMemoryBackend(config.get("cache_max_entries", 1024))
+            self.response_cache = ResponseCache(
+                backend,
+                ttl=cache_ttl,
+                max_temperature=(float("inf") if golden
+                                 else config.get("cache_max_temperature", 0.1 if cache_dir else 0.0)),
+                refresh=recording,
+                strict=golden and not recording
+            )
+            
+            if config.get("enable_semantic_cache", False):
+                self.semantic_cache = SemanticCache(
+                    self._embed,
+                    threshold=config.get("semantic_threshold", 0.92),
+                    max_entries=config.get("cache_max_entries", 1024),
+                    ttl=config.get("cache_ttl", 3600.0)
+                )
+        
+    async def __aenter__(self) -> "LLMClient":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
+    async def aclose(self):
+        """Close pooled HTTP connections held by this client and its providers."""
+        clients, self._http_clients = self._http_clients or {}, None
+        for client in clients.values():
+            await client.aclose()
+        
+        await self.ollama_provider.aclose()
+    
+    def _http_limits(self) -> httpx.Limits:
+        """Build connection-pool limits from configuration."""
+        return httpx.Limits(
+            max_connections=self.config.get("http_max_connections", 500),
+            max_keepalive_connections=self.config.get("http_max_keepalive", 200),
+            keepalive_expiry=self.config.get("http_keepalive_expiry", 60.0)
+        )
+    
+    def _get_http_client(self, base_url: str, http2: bool = False) -> httpx.AsyncClient:
+        """
+        Return the shared HTTP client for a host, creating it on first use.
+        One pool per host keeps connections alive between requests; with
+        ``http2`` concurrent requests are multiplexed over one connection.
+        """
+        if self._http_clients is None:
+            self._http_clients = {}
         
+        client = self._http_clients.get(base_url)
+        if client is None:
+            client = httpx.AsyncClient(base_url=base_url, timeout=self.timeout,
+                                       limits=self._http_limits(),
+                                       http2=http2 and _HTTP2_AVAILABLE and self.config.get("http2", True))
+            self._http_clients[base_url] = client
+        return client
+    
     async def generate_response(self, request: LLMRequest) -> LLMResponse:
         """
         Generate a response using the specified LLM.
@@ -52,8 +318,20 @@ class LLMClient:
         """
         provider = self._determine_provider(request.model)
         
+        cache = self.response_cache if self.response_cache and self.response_cache.is_cacheable(request) else None
+        embedding = None
+        if cache is not None:
+            cached = await cache.get(request)
+            if cached is None and self.semantic_cache is not None:
+                try:
+                    cached, embedding = await self.semantic_cache.lookup(request)
+                except Exception as e:
+                    logger.warning(f"Semantic cache lookup failed: {str(e)}")
+            if cached is not None:
+                return cached
+        
         # Apply rate limiting
-        await self._apply_rate_limiting()
+        await self._rate_limiter.acquire()
         
         # Attempt request with retries
         for attempt in range(self.max_retries):
@@ -75,24 +353,78 @@ class LLMClient:
                 logger.info(f"LLM request successful: {request.request_id}, "
                            f"provider: {provider}, time: {response.response_time:.2f}s")
                 
+                if cache is not None:
+                    await cache.set(request, response)
+                    if embedding is not None:
+                        self.semantic_cache.store(request, embedding, response)
+                
                 return response
                 
             except Exception as e:
                 logger.warning(f"LLM request attempt {attempt + 1} failed: {str(e)}")
                 
-                if attempt == self.max_retries - 1:
+                if attempt == self.max_retries - 1 or not self._is_retryable(e):
                     # Final attempt failed
                     return LLMResponse(
                         content="",
                         model=request.model,
                         provider=provider,
                         success=False,
-                        error=f"Failed after {self.max_retries} attempts: {str(e)}",
+                        error=f"Failed after {attempt + 1} attempts: {str(e)}",
                         request_id=request.request_id
                     )
                 
-                # Wait before retry
-                await asyncio.sleep(self.retry_delay * (2 ** attempt))
+                # Wait before retry; full jitter keeps concurrent clients from retrying in lockstep
+                delay = min(self.retry_delay * (2 ** attempt), self.retry_delay_max)
+                await asyncio.sleep(random.uniform(0, delay))
+    
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        """
+        Whether a failed call may succeed if retried: timeouts (408), rate
+        limits (429), server errors and network failures. Other 4xx responses
+        and configuration errors fail immediately.
+        """
+        if isinstance(error, httpx.HTTPStatusError):
+            status = error.response.status_code
+            return status in (408, 429) or status >= 500
+        if isinstance(error, (ValueError, KeyError)):
+            return False
+        return True
+    
+    async def generate_batched(self, request: LLMRequest) -> LLMResponse:
+        """
+        Generate a response through the shared request batcher.
+        Intended for validation and review prompts that many agents issue
+        concurrently; tune with ``batch_max_size`` and ``batch_max_wait_ms``.
+        """
+        if self._batcher is None:
+            self._batcher = LLMRequestBatcher(
+                self.generate_response,
+                max_batch_size=self.config.get("batch_max_size", 16),
+                max_wait=self.config.get("batch_max_wait_ms", 20) / 1000
+            )
+        
+        return await self._batcher.submit(request)
+    
+    async def generate_many(self, requests: List[LLMRequest],
+                            max_in_flight: Optional[int] = None) -> List[LLMResponse]:
+        """
+        Send several independent requests concurrently so their network and
+        inference latency overlap. At most ``max_in_flight`` (config
+        ``max_parallel_requests``, default 4) are outstanding at once; match it
+        to the server's parallelism (e.g. Ollama's OLLAMA_NUM_PARALLEL).
+        Responses are returned in the order of ``requests``.
+        """
+        if max_in_flight is None:
+            max_in_flight = self.config.get("max_parallel_requests", 4)
+        semaphore = asyncio.Semaphore(max(1, max_in_flight))
+        
+        async def run(request: LLMRequest) -> LLMResponse:
+            async with semaphore:
+                return await self.generate_response(request)
+        
+        return list(await asyncio.gather(*(run(request) for request in requests)))
     
     async def _call_anthropic(self, request: LLMRequest) -> LLMResponse:
         """Call Anthropic Claude API."""
@@ -116,25 +448,30 @@ class LLMClient:
         }
         
         if request.system_prompt:
-            payload["system"] = request.system_prompt
+            if request.cache_system_prompt:
+                # Mark the system prompt as a cacheable prefix; usage then reports
+                # cache_creation_input_tokens / cache_read_input_tokens
+                payload["system"] = [{
+                    "type": "text",
+                    "text": request.system_prompt,
+                    "cache_control": {"type": "ephemeral"}
+                }]
+            else:
+                payload["system"] = request.system_prompt
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                "https://api.anthropic.com/v1/messages",
-                headers=headers,
-                json=payload
-            )
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            return LLMResponse(
-                content=data["content"][0]["text"],
-                model=data["model"],
-                provider="anthropic",
-                usage=data.get("usage", {}),
-                success=True
-            )
+        client = self._get_http_client("https://api.anthropic.com", http2=True)
+        response = await client.post("/v1/messages", headers=headers, content=_json_dumps_bytes(payload))
+        response.raise_for_status()
+        
+        data = response.json()
+        
+        return LLMResponse(
+            content=data["content"][0]["text"],
+            model=data["model"],
+            provider="anthropic",
+            usage=data.get("usage", {}),
+            success=True
+        )
     
     async def _call_openai(self, request: LLMRequest) -> LLMResponse:
         """Call OpenAI GPT API."""
@@ -159,63 +496,43 @@ class LLMClient:
             "temperature": request.temperature
         }
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                "https://api.openai.com/v1/chat/completions",
-                headers=headers,
-                json=payload
-            )
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            return LLMResponse(
-                content=data["choices"][0]["message"]["content"],
-                model=data["model"],
-                provider="openai", 
-                usage=data.get("usage", {}),
-                success=True
-            )
+        client = self._get_http_client("https://api.openai.com", http2=True)
+        response = await client.post("/v1/chat/completions", headers=headers,
+                                     content=_json_dumps_bytes(payload))
+        response.raise_for_status()
+        
+        data = response.json()
+        
+        return LLMResponse(
+            content=data["choices"][0]["message"]["content"],
+            model=data["model"],
+            provider="openai", 
+            usage=data.get("usage", {}),
+            success=True
+        )
     
     async def _call_ollama(self, request: LLMRequest) -> LLMResponse:
         """Call Ollama API."""
-        if not hasattr(self, 'ollama_provider'):
-            self.ollama_provider = OllamaProvider(self.ollama_base_url)
-        
         return await self.ollama_provider.generate_response(request)
     
+    async def _embed(self, text: str) -> List[float]:
+        """Embed text for the semantic cache."""
+        return await self.ollama_provider.embed(
+            text, self.config.get("embedding_model", "nomic-embed-text")
+        )
+    
     def _determine_provider(self, model: str) -> str:
         """Determine which provider to use based on model name."""
-        if "claude" in model.lower():
+        lowered = model.lower()
+        if "claude" in lowered:
             return "anthropic"
-        elif "gpt" in model.lower():
+        elif "gpt" in lowered:
             return "openai"
-        elif "qwen" in model.lower() or "ollama" in model.lower():
+        elif "qwen" in lowered or "ollama" in lowered:
             return "ollama"
         else:
             return self.default_provider
     
-    async def _apply_rate_limiting(self):
-        """Apply rate limiting to prevent exceeding API limits."""
-        current_time = time.time()
-        
-        # Reset window if needed
-        if current_time - self.rate_limit_window_start >= 60:
-            self.request_count = 0
-            self.rate_limit_window_start = current_time
-        
-        # Check if we need to wait
-        if self.request_count >= self.rate_limit_requests_per_minute:
-            wait_time = 60 - (current_time - self.rate_limit_window_start)
-            if wait_time > 0:
-                logger.info(f"Rate limiting: waiting {wait_time:.1f}s")
-                await asyncio.sleep(wait_time)
-                self.request_count = 0
-                self.rate_limit_window_start = time.time()
-        
-        self.request_count += 1
-        self.last_request_time = current_time
-    
     async def parse_structured_response(self, response: LLMResponse, 
                                       expected_format: str = "json") -> Dict[str, Any]:
         """
@@ -228,6 +545,11 @@ class LLMClient:
         content = response.content.strip()
         
         if expected_format == "json":
+            if len(content) > _INLINE_EXTRACT_LIMIT:
+                try:
+                    return _json_loads(content)
+                except json.JSONDecodeError:
+                    return await asyncio.to_thread(self._extract_json_from_response, content)
             return self._extract_json_from_response(content)
         else:
             raise ValueError(f"Unsupported format: {expected_format}")
@@ -236,80 +558,36 @@ class LLMClient:
         """Extract JSON from LLM response content."""
         # First try direct JSON parsing
         try:
-            return json.loads(content)
+            return _json_loads(content)
         except json.JSONDecodeError:
             pass
         
-        # Try to extract JSON from markdown code blocks
-        json_start = content.find("```json")
-        if json_start != -1:
-            json_start += len("```json")
-            json_end = content.find("```", json_start)
-            if json_end != -1:
-                json_content = content[json_start:json_end].strip()
+        # Try to extract JSON from markdown code blocks (the decoders skip
+        # surrounding whitespace, so the block is not stripped first)
+        for match in _JSON_FENCE_RE.finditer(content):
+            try:
+                return _json_loads(match.group(1))
+            except json.JSONDecodeError:
+                continue
+        
+        # Common case: a single object wrapped in prose, decoded in one fast pass
+        start, end = content.find("{"), content.rfind("}")
+        if start != -1 and end > start:
+            try:
+                return _json_loads(content[start:end + 1])
+            except json.JSONDecodeError:
+                pass
+        
+        # Decode the first complete value starting at a candidate position,
+        # preferring objects over arrays
+        for opener in "{[":
+            index = content.find(opener)
+            while index != -1:
                 try:
-                    return json.loads(json_content)
+                    value, _ = _json_decoder.raw_decode(content, index)
+                    return value
                 except json.JSONDecodeError:
-                    pass
-        
-        # Try to find complete JSON object (prioritize objects over arrays)
-        # Look for main JSON object starting with {
-        brace_start = content.find("{")
-        if brace_start != -1:
-            bracket_count = 0
-            start_found = False
-            in_string = False
-            escape_next = False
-            
-            for i, char in enumerate(content[brace_start:], brace_start):
-                if escape_next:
-                    escape_next = False
-                    continue
-                    
-                if char == "\\" and in_string:
-                    escape_next = True
-                    continue
-                    
-                if char == '"' and not escape_next:
-                    in_string = not in_string
-                    continue
-                    
-                if not in_string:
-                    if char == "{":
-                        if not start_found:
-                            start_found = True
-                        bracket_count += 1
-                    elif char == "}":
-                        bracket_count -= 1
-                        if bracket_count == 0 and start_found:
-                            json_content = content[brace_start:i+1]
-                            try:
-                                return json.loads(json_content)
-                            except json.JSONDecodeError:
-                                # Continue looking for another complete JSON object
-                                bracket_count = 0
-                                start_found = False
-                                continue
-        
-        # If no object found, try arrays
-        array_start = content.find("[")
-        if array_start != -1:
-            bracket_count = 0
-            start_found = False
-            
-            for i, char in enumerate(content[array_start:], array_start):
-                if char == "[":
-                    if not start_found:
-                        start_found = True
-                    bracket_count += 1
-                elif char == "]":
-                    bracket_count -= 1
-                    if bracket_count == 0 and start_found:
-                        json_content = content[array_start:i+1]
-                        try:
-                            return json.loads(json_content)
-                        except json.JSONDecodeError:
-                            break
+                    index = content.find(opener, index + 1)
         
         # If all else fails, return the content as a string result
         return {"content": content, "parsed": False}
@@ -320,18 +598,11 @@ class LLMClient:
         Generate response that conforms to a specific schema.
         Includes schema validation and retry logic.
         """
-        # Add schema instruction to prompt
-        schema_instruction = f"\n\nPlease respond with valid JSON that matches this schema:\n{json.dumps(schema, indent=2)}"
-        
-        enhanced_request = LLMRequest(
-            prompt=request.prompt + schema_instruction,
-            model=request.model,
-            max_tokens=request.max_tokens,
-            temperature=request.temperature,
-            system_prompt=request.system_prompt,
-            context=request.context,
-            request_id=request.request_id
-        )
+        # Put the schema in the system prompt so it forms a stable, cacheable prefix
+        schema_instruction = f"Always respond with valid JSON that matches this schema:\n{_json_dumps_indented(schema)}"
+        system_prompt = f"{request.system_prompt}\n\n{schema_instruction}" if request.system_prompt else schema_instruction
+        
+        enhanced_request = replace(request, system_prompt=system_prompt)
         
         response = await self.generate_response(enhanced_request)
         
@@ -349,17 +620,77 @@ class LLMClient:
 
 # Global LLM client instance
 _llm_client: Optional[LLMClient] = None
+_llm_client_lock = threading.Lock()
 
 
 def initialize_llm_client(config: Dict[str, Any]) -> LLMClient:
-    """Initialize the global LLM client."""
+    """
+    Initialize the global LLM client.
+    The client can be used as an async context manager to close its
+    connection pools on exit.
+    """
     global _llm_client
-    _llm_client = LLMClient(config)
-    return _llm_client
+    with _llm_client_lock:
+        _llm_client = LLMClient(config)
+        return _llm_client
 
 
 def get_llm_client() -> LLMClient:
     """Get the global LLM client instance."""
     if _llm_client is None:
         raise RuntimeError("LLM client not initialized. Call initialize_llm_client() first.")
-    return _llm_client
\ No newline at end of file
+    return _llm_client
+
+
+# Shared clients per event loop, keyed by frozen configuration. Clients hold
+# pools and locks bound to their loop, so a later asyncio.run() gets new ones;
+# entries for closed loops are dropped on the next lookup.
+_shared_clients: "Dict[asyncio.AbstractEventLoop, OrderedDict[Any, LLMClient]]" = {}
+_SHARED_CLIENTS_PER_LOOP = 4
+
+
+def _freeze_config(value: Any) -> Any:
+    """Turn a configuration value into a hashable cache key."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze_config(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_config(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze_config(item) for item in value)
+    try:
+        hash(value)
+    except TypeError:
+        raise TypeError(f"Unsupported config value of type {type(value).__name__}: {value!r}") from None
+    return value
+
+
+def get_client(config: Dict[str, Any]) -> LLMClient:
+    """
+    Get a client shared by callers with the same configuration, so they reuse
+    one client and its connection pools. Must be called from a running event
+    loop; each loop gets its own clients, and up to four configurations are
+    kept per loop. A client evicted to make room is not closed, since earlier
+    callers may still hold it. Nested dicts, lists and sets in the
+    configuration are compared by value; other unhashable values raise
+    TypeError.
+    """
+    loop = asyncio.get_running_loop()
+    key = _freeze_config(config)
+    
+    for stale in [other for other in _shared_clients if other.is_closed()]:
+        del _shared_clients[stale]
+    
+    clients = _shared_clients.get(loop)
+    if clients is None:
+        clients = _shared_clients[loop] = OrderedDict()
+    
+    client = clients.get(key)
+    if client is None:
+        client = clients[key] = LLMClient(dict(config))
+        # Evicted clients may still be in use, so they are only forgotten here;
+        # closing them is up to their holders
+        while len(clients) > _SHARED_CLIENTS_PER_LOOP:
+            clients.popitem(last=False)
+    else:
+        clients.move_to_end(key)
+    return client
\ No newline at end of file
@@ -3,33 +3,178 @@ Ollama integration for the LLM client.
 Provides support for local Ollama models.
 """
 
+import asyncio
 import json
 import logging
-from typing import Dict, Any, Optional, List
+import re
+import time
+from typing import Dict, Any, Optional, List, Tuple, AsyncIterator
 import httpx
 
 from .types import LLMRequest, LLMResponse
 
+try:
+    import orjson
+    _json_loads = orjson.loads  # orjson.JSONDecodeError subclasses ValueError
+except ImportError:
+    _json_loads = json.loads
+
 
 logger = logging.getLogger(__name__)
 
+# Prompt scaffolding for requests with a system prompt (Qwen models respond well to this format)
+_SYSTEM_PREFIX = "System: "
+_USER_PREFIX = "\n\nUser: "
+_ASSISTANT_SUFFIX = "\n\nAssistant:"
+
+# Everything up to the end of a closed thinking block
+_THINK_RE = re.compile(r"\A.*?</think>", re.DOTALL)
+# Unclosed thinking block at the start: drop lines until the first one that is
+# not blank, a Chinese preamble, or a note about returning JSON
+_UNCLOSED_THINK_RE = re.compile(
+    r"\A(?:[^\n]*(?:\n|\Z))*?"
+    r"(?=\Z|(?!好的|用户)(?![^\n]*<think>)(?![^\n]*JSON[^\n]*返回)(?![^\n]*返回[^\n]*JSON)[^\n]*\S)"
+)
+# Chinese preamble lines before the first JSON line or substantial (>10 chars) line
+_CN_PREFIX_RE = re.compile(
+    r"\A(?:[^\n]*\n)*?(?=[ \t]*(?:[{\[]|(?!好的|用户)\S[^\n]{10}))"
+)
+
+# Characters that can change the brace scanner's state; everything between
+# them is skipped by the regex engine rather than the interpreter loop
+_STRUCTURAL_RE = re.compile(r'[{}"\\]')
+
+# Generations take long enough that httpx's default 5s keep-alive lets the
+# connection lapse between calls; keep idle connections around for a minute
+_DEFAULT_LIMITS = httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60.0)
+
+
+class _JsonEndTracker:
+    """
+    Watches streamed text for the end of the first complete top-level JSON
+    object, skipping a leading <think> block. Braces inside strings are
+    ignored, and a balanced span that does not decode is treated as prose.
+    """
+    __slots__ = ("_thinking", "_pending", "_unscanned", "_depth", "_in_string", "_escape", "_parts", "json_text")
+    
+    def __init__(self):
+        self._thinking: Optional[bool] = None  # unknown until the first text arrives
+        self._pending = ""
+        self._unscanned: List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._parts: List[str] = []
+        self.json_text: Optional[str] = None  # the object, once complete
+    
+    def feed(self, text: str) -> bool:
+        """Consume the next chunk; True once a complete JSON object has been seen."""
+        if self._thinking is not False:
+            self._pending += text
+            head = self._pending.lstrip()
+            if self._thinking is None:
+                if len(head) < 7 and "<think>".startswith(head):
+                    return False  # too short to tell yet
+                self._thinking = head.startswith("<think>")
+            if self._thinking:
+                end = self._pending.find("</think>")
+                if end == -1:
+                    return False
+                self._thinking = False
+                text = self._pending[end + 8:]
+            else:
+                text = self._pending
+            self._pending = ""
+        
+        # An object can only end at a closing brace; until one arrives, chunks
+        # (typically a single token each) are batched and scanned together
+        if "}" not in text:
+            self._unscanned.append(text)
+            return False
+        if self._unscanned:
+            self._unscanned.append(text)
+            text = "".join(self._unscanned)
+            self._unscanned.clear()
+        return self._scan(text)
+    
+    def _scan(self, text: str) -> bool:
+        # Only structural characters are visited. An escape covers the
+        # character right after the backslash, which need not be structural,
+        # so it is tracked by position; the state is stored back at the end.
+        depth, in_string = self._depth, self._in_string
+        escaped_at = 0 if self._escape else -1
+        start = 0
+        for match in _STRUCTURAL_RE.finditer(text):
+            index = match.start()
+            char = match.group()
+            if in_string:
+                if index == escaped_at:
+                    continue
+                if char == "\\":
+                    escaped_at = index + 1
+                elif char == '"':
+                    in_string = False
+            elif char == "{":
+                if not depth:
+                    start = index
+                depth += 1
+            elif not depth:
+                continue  # prose before the object
+            elif char == '"':
+                in_string = True
+            elif char == "}":
+                depth -= 1
+                if not depth:
+                    self._parts.append(text[start:index + 1])
+                    candidate, self._parts = "".join(self._parts), []
+                    try:
+                        _json_loads(candidate)
+                    except ValueError:
+                        continue
+                    self._depth, self._in_string, self._escape = depth, in_string, False
+                    self.json_text = candidate
+                    return True
+        if depth:
+            self._parts.append(text[start:])
+        self._depth, self._in_string = depth, in_string
+        self._escape = escaped_at == len(text)
+        return False
+
 
 class OllamaProvider:
     """Provider for Ollama local models."""
     
     def __init__(self, base_url: str = "http://localhost:11434", 
-                 default_model: str = "qwen3:14b"):
-        """Initialize Ollama provider."""
+                 default_model: str = "qwen3:14b",
+                 limits: Optional[httpx.Limits] = None):
+        """Initialize Ollama provider, optionally with custom connection-pool limits."""
         self.base_url = base_url
         self.default_model = default_model
         self.timeout = 300.0  # Much longer timeout for large models
+        # Ollama only speaks HTTP/1.1
+        self._client = httpx.AsyncClient(base_url=base_url, timeout=self.timeout,
+                                         limits=limits or _DEFAULT_LIMITS, http2=False)
+        
+        # Installed models, refreshed at most every _models_ttl seconds
+        self._models_cache: Tuple[float, List[str]] = (0.0, [])
+        self._models_ttl = 30.0
+        self._models_lock = asyncio.Lock()
+    
+    async def __aenter__(self) -> "OllamaProvider":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
+    async def aclose(self):
+        """Close the pooled HTTP connections to the Ollama server."""
+        await self._client.aclose()
         
     async def check_health(self) -> bool:
         """Check if Ollama is running and accessible."""
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(f"{self.base_url}/api/tags")
-                return response.status_code == 200
+            response = await self._client.get("/api/tags", timeout=5.0)
+            return response.status_code == 200
         except Exception as e:
             logger.error(f"Ollama health check failed: {e}")
             return False
@@ -37,64 +182,132 @@ class OllamaProvider:
     async def list_models(self) -> List[str]:
         """List available models in Ollama."""
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(f"{self.base_url}/api/tags")
-                response.raise_for_status()
-                data = response.json()
-                return [model["name"] for model in data.get("models", [])]
+            response = await self._client.get("/api/tags", timeout=5.0)
+            response.raise_for_status()
+            data = response.json()
+            return [model["name"] for model in data.get("models", [])]
         except Exception as e:
             logger.error(f"Failed to list Ollama models: {e}")
             return []
     
-    async def generate_response(self, request: LLMRequest) -> LLMResponse:
-        """Generate response using Ollama."""
+    async def _cached_models(self) -> List[str]:
+        """List available models, reusing a recent result when possible."""
+        if time.monotonic() - self._models_cache[0] <= self._models_ttl:
+            return self._models_cache[1]
         
+        async with self._models_lock:
+            # Another coroutine may have refreshed while we waited
+            if time.monotonic() - self._models_cache[0] > self._models_ttl:
+                self._models_cache = (time.monotonic(), await self.list_models())
+            return self._models_cache[1]
+    
+    async def embed(self, text: str, model: str = "nomic-embed-text") -> List[float]:
+        """Embed text with an Ollama embedding model."""
+        response = await self._client.post("/api/embeddings", json={"model": model, "prompt": text})
+        response.raise_for_status()
+        return response.json()["embedding"]
+    
+    async def warmup(self, model: Optional[str] = None, keep_alive: str = "30m") -> bool:
+        """
+        Load a model into memory ahead of time so the first real request does
+        not pay for it. Ollama loads the model for an empty prompt without
+        generating anything.
+        """
+        try:
+            response = await self._client.post("/api/generate", json={
+                "model": model or self.default_model,
+                "prompt": "",
+                "keep_alive": keep_alive
+            })
+            response.raise_for_status()
+            return True
+        except Exception as e:
+            logger.warning(f"Ollama warmup failed: {e}")
+            return False
+    
+    async def _resolve_model(self, request: LLMRequest) -> str:
+        """Pick the Ollama model to use for a request."""
         # Use model from request or default
         model = request.model if request.model != "claude-3-sonnet-20240229" else self.default_model
         
         # Check if model contains 'qwen', otherwise use default
-        if 'qwen' not in model.lower() and model not in await self.list_models():
+        if 'qwen' not in model.lower() and model not in await self._cached_models():
             logger.warning(f"Model {model} not found, using default: {self.default_model}")
             model = self.default_model
         
-        # Prepare the request payload
+        return model
+    
+    async def _stream_chunks(self, request: LLMRequest, model: str) -> AsyncIterator[Dict[str, Any]]:
+        """Stream generation chunks from Ollama as they are produced."""
         payload = {
             "model": model,
             "prompt": self._format_prompt(request),
-            "stream": False,
+            "stream": True,
             "options": {
                 "temperature": request.temperature,
                 "num_predict": request.max_tokens
             }
         }
         
+        async with self._client.stream("POST", "/api/generate", json=payload) as response:
+            if response.status_code >= 400:
+                await response.aread()  # Make the error body available to callers
+            response.raise_for_status()
+            
+            async for line in response.aiter_lines():
+                if line:
+                    yield _json_loads(line)
+    
+    async def generate_stream(self, request: LLMRequest) -> AsyncIterator[str]:
+        """
+        Yield raw response text as Ollama generates it.
+        Thinking tokens are not stripped; use generate_response for cleaned output.
+        """
+        model = await self._resolve_model(request)
+        async for chunk in self._stream_chunks(request, model):
+            text = chunk.get("response", "")
+            if text:
+                yield text
+    
+    async def generate_response(self, request: LLMRequest) -> LLMResponse:
+        """Generate response using Ollama."""
+        model = await self._resolve_model(request)
+        
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/api/generate",
-                    json=payload
-                )
-                response.raise_for_status()
-                
-                data = response.json()
-                
+            # Stream so bytes flow as tokens are generated instead of after the full response
+            content_parts = []
+            data: Dict[str, Any] = {}
+            tracker = _JsonEndTracker() if request.stop_at_json_end else None
+            async for chunk in self._stream_chunks(request, model):
+                text = chunk.get("response", "")
+                content_parts.append(text)
+                if chunk.get("done"):
+                    data = chunk
+                elif tracker is not None and tracker.feed(text):
+                    # Leaving the stream closes the connection, which stops generation
+                    break
+            
+            if tracker is not None and tracker.json_text is not None:
+                # The caller only wants the object; thinking and prose around it
+                # need no cleaning and no longer stand between the parser and it
+                cleaned_content = tracker.json_text
+            else:
                 # Clean the response content
-                content = data.get("response", "")
-                cleaned_content = self._clean_response_content(content)
-                
-                return LLMResponse(
-                    content=cleaned_content,
-                    model=model,
-                    provider="ollama",
-                    usage={
-                        "prompt_tokens": data.get("prompt_eval_count", 0),
-                        "completion_tokens": data.get("eval_count", 0),
-                        "total_tokens": data.get("prompt_eval_count", 0) + data.get("eval_count", 0)
-                    },
-                    success=True,
-                    response_time=data.get("total_duration", 0) / 1e9  # Convert nanoseconds to seconds
-                )
-                
+                cleaned_content = self._clean_response_content("".join(content_parts))
+            
+            return LLMResponse(
+                content=cleaned_content,
+                model=model,
+                provider="ollama",
+                usage={
+                    "prompt_tokens": data.get("prompt_eval_count", 0),
+                    "completion_tokens": data.get("eval_count", 0),
+                    "total_tokens": data.get("prompt_eval_count", 0) + data.get("eval_count", 0)
+                },
+                success=True,
+                response_time=data.get("total_duration", 0) / 1e9  # Convert nanoseconds to seconds
+            )
+            
         except httpx.HTTPStatusError as e:
             logger.error(f"Ollama HTTP error: {e}")
             return LLMResponse(
@@ -117,12 +330,8 @@ class OllamaProvider:
     def _format_prompt(self, request: LLMRequest) -> str:
         """Format prompt for Ollama, including system prompt if provided."""
         if request.system_prompt:
-            # Qwen models respond well to this format
-            return f"""System: {request.system_prompt}
-
-User: {request.prompt}
-
-Assistant:"""
+            return "".join((_SYSTEM_PREFIX, request.system_prompt, _USER_PREFIX,
+                            request.prompt, _ASSISTANT_SUFFIX))
         else:
             return request.prompt
     
@@ -133,41 +342,16 @@ Assistant:"""
         
         # Remove thinking tokens that some Qwen models produce
         if "<think>" in content:
-            # Find the end of thinking section
-            think_end = content.find("</think>")
-            if think_end != -1:
-                content = content[think_end + 8:].strip()
-            else:
-                # If no closing tag, remove everything from <think> onwards until we find actual content
-                think_start = content.find("<think>")
-                if think_start == 0:
-                    # Thinking is at the start, try to find where actual content begins
-                    lines = content.split('\n')
-                    clean_lines = []
-                    in_thinking = True
-                    for line in lines:
-                        if "<think>" in line:
-                            in_thinking = True
-                            continue
-                        if in_thinking and (line.strip() == "" or line.startswith("好的") or line.startswith("用户") or "JSON" in line and "返回" in line):
-                            continue
-                        if line.strip() and not line.startswith("好的") and not line.startswith("用户"):
-                            in_thinking = False
-                        if not in_thinking:
-                            clean_lines.append(line)
-                    content = '\n'.join(clean_lines).strip()
+            if "</think>" in content:
+                content = _THINK_RE.sub("", content, count=1).strip()
+            elif content.startswith("<think>"):
+                content = _UNCLOSED_THINK_RE.sub("", content, count=1).strip()
         
         # Remove other common artifacts
         content = content.strip()
         
-        # If content still starts with Chinese thinking text, try to extract JSON or meaningful content
-        if content and (content.startswith("好的") or content.startswith("用户")):
-            lines = content.split('\n')
-            for i, line in enumerate(lines):
-                line = line.strip()
-                if line and (line.startswith('{') or line.startswith('[') or 
-                           (not line.startswith("好的") and not line.startswith("用户") and len(line) > 10)):
-                    content = '\n'.join(lines[i:]).strip()
-                    break
+        # If content still starts with Chinese thinking text, skip to JSON or meaningful content
+        if content.startswith(("好的", "用户")):
+            content = _CN_PREFIX_RE.sub("", content, count=1).strip()
         
         return content
\ No newline at end of file
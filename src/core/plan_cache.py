@@ -0,0 +1,97 @@
+"""
+Execution plan cache for agent orchestrators.
+Reuses plans from previously approved tasks so recurring tasks skip LLM planning.
+Only exact repeats are matched; a reworded task is planned from scratch.
+"""
+
+import copy
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+
+from .types import Task
+
+
+class PlanCache:
+    """
+    LRU cache of approved execution plans keyed by a task fingerprint.
+    Entries expire after ``ttl`` seconds.
+    
+    Lookups are exact: the fingerprint only ignores case, surrounding
+    whitespace and requirement order, so any other change in wording or
+    metadata is a miss. There is no similarity matching between tasks.
+    """
+    
+    def __init__(self, max_entries: int = 256, ttl: float = 7 * 24 * 3600):
+        """Initialize the plan cache."""
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def fingerprint(namespace: str, task: Task) -> str:
+        """Compute a stable key from the parts of a task that shape its plan."""
+        normalized = json.dumps(
+            [
+                namespace,
+                task.title.strip().lower(),
+                task.description.strip().lower(),
+                sorted(task.requirements),
+                task.metadata
+            ],
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+    
+    def get(self, namespace: str, task: Task) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached plan for the task, or None on a miss."""
+        key = self.fingerprint(namespace, task)
+        entry = self._entries.get(key)
+        
+        if entry is None or time.monotonic() - entry[0] > self.ttl:
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return copy.deepcopy(entry[1])
+    
+    def put(self, namespace: str, task: Task, plan: Dict[str, Any]):
+        """Store an approved plan, evicting the least recently used entry if full."""
+        key = self.fingerprint(namespace, task)
+        self._entries[key] = (time.monotonic(), copy.deepcopy(plan))
+        self._entries.move_to_end(key)
+        
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def clear(self):
+        """Drop all cached plans."""
+        self._entries.clear()
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get cache size and hit/miss counters."""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+
+# Global plan cache instance
+_plan_cache: Optional[PlanCache] = None
+
+
+def get_plan_cache() -> PlanCache:
+    """Get the global plan cache instance."""
+    global _plan_cache
+    if _plan_cache is None:
+        _plan_cache = PlanCache()
+    return _plan_cache
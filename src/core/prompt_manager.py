@@ -4,39 +4,66 @@ Prompt Management System for configurable and tunable prompts.
 
 import yaml
 import os
-from typing import Dict, Any, Optional
+import threading
+import time
+from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
 
+# Prefer the libyaml C implementation when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
 
 class PromptManager:
     """Manages configurable prompts for agents."""
     
-    def __init__(self, config_dir: str = None):
-        """Initialize prompt manager."""
+    def __init__(self, config_dir: str = None, reload_check_interval: float = 5.0):
+        """
+        Initialize prompt manager.
+        Prompt files are re-checked for changes at most every
+        ``reload_check_interval`` seconds (0 checks on every load).
+        """
         if config_dir is None:
             # Default to config directory relative to project root
             project_root = Path(__file__).parent.parent.parent
             config_dir = project_root / "config"
         
         self.config_dir = Path(config_dir)
-        self._prompt_cache = {}
+        self.reload_check_interval = reload_check_interval
+        # agent_name -> (file mtime, prompts)
+        self._prompt_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        # agent_name -> monotonic time of the last mtime check
+        self._last_checked: Dict[str, float] = {}
     
     def load_prompts(self, agent_name: str) -> Dict[str, Any]:
         """Load prompts for a specific agent."""
+        cached = self._prompt_cache.get(agent_name)
+        now = time.monotonic()
+        
+        # Skip the stat entirely if the file was checked very recently
+        if cached and now - self._last_checked.get(agent_name, 0.0) < self.reload_check_interval:
+            return cached[1]
+        
         config_file = self.config_dir / f"{agent_name}_prompts.yaml"
         
-        if not config_file.exists():
+        try:
+            mtime = config_file.stat().st_mtime
+        except FileNotFoundError:
+            self._prompt_cache.pop(agent_name, None)
             raise FileNotFoundError(f"Prompt configuration not found: {config_file}")
         
-        # Cache prompts to avoid re-reading
-        cache_key = f"{agent_name}_{config_file.stat().st_mtime}"
-        if cache_key in self._prompt_cache:
-            return self._prompt_cache[cache_key]
+        self._last_checked[agent_name] = now
+        
+        # Reuse cached prompts unless the file changed
+        if cached and cached[0] == mtime:
+            return cached[1]
         
         with open(config_file, 'r', encoding='utf-8') as f:
-            prompts = yaml.safe_load(f)
+            prompts = yaml.load(f, Loader=_YamlLoader)
         
-        self._prompt_cache[cache_key] = prompts
+        self._prompt_cache[agent_name] = (mtime, prompts)
         return prompts
     
     def get_system_prompt(self, agent_name: str, variant: str = "default") -> str:
@@ -97,11 +124,11 @@ class PromptManager:
         self.config_dir.mkdir(parents=True, exist_ok=True)
         
         with open(config_file, 'w', encoding='utf-8') as f:
-            yaml.safe_dump(prompts, f, default_flow_style=False, allow_unicode=True)
+            yaml.dump(prompts, f, Dumper=_YamlDumper, default_flow_style=False, allow_unicode=True)
         
         # Clear cache for this agent
-        self._prompt_cache = {k: v for k, v in self._prompt_cache.items() 
-                            if not k.startswith(f"{agent_name}_")}
+        self._prompt_cache.pop(agent_name, None)
+        self._last_checked.pop(agent_name, None)
     
     def list_available_variants(self, agent_name: str) -> list:
         """List available prompt variants for an agent."""
@@ -114,13 +141,16 @@ class PromptManager:
 
 # Global prompt manager instance
 _global_prompt_manager = None
+_global_prompt_manager_lock = threading.Lock()
 
 
 def get_prompt_manager(config_dir: str = None) -> PromptManager:
     """Get global prompt manager instance."""
     global _global_prompt_manager
     if _global_prompt_manager is None:
-        _global_prompt_manager = PromptManager(config_dir)
+        with _global_prompt_manager_lock:
+            if _global_prompt_manager is None:
+                _global_prompt_manager = PromptManager(config_dir)
     return _global_prompt_manager
 
 
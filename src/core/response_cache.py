@@ -0,0 +1,361 @@
+"""
+Response caches for LLM requests.
+Serves repeated temperature-0 requests without another provider round-trip,
+with an optional embedding-similarity tier for paraphrased prompts.
+"""
+
+import asyncio
+import hashlib
+import json
+import math
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Protocol, Tuple, List, Callable, Awaitable
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .types import LLMRequest, LLMResponse
+
+
+class MissingGoldenError(LookupError):
+    """Raised in golden replay mode when no response was recorded for a request."""
+
+
+class CacheBackend(Protocol):
+    """Storage interface for cached LLM responses."""
+    
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        ...
+    
+    async def set(self, key: str, value: Dict[str, Any], ttl: Optional[float] = None):
+        ...
+    
+    async def delete(self, key: str):
+        ...
+    
+    async def clear(self):
+        ...
+
+
+class LRUMemoryBackend:
+    """
+    In-process LRU backend. Entries expire after their ttl (if given) and the
+    least recently used entry is evicted once ``max_entries`` is exceeded.
+    """
+    
+    def __init__(self, max_entries: int = 1024):
+        """Initialize the memory backend."""
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Optional[float], Dict[str, Any]]]" = OrderedDict()
+    
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, value = entry
+        if expires_at is not None and time.monotonic() > expires_at:
+            del self._entries[key]
+            return None
+        
+        self._entries.move_to_end(key)
+        return value
+    
+    async def set(self, key: str, value: Dict[str, Any], ttl: Optional[float] = None):
+        expires_at = time.monotonic() + ttl if ttl else None
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    async def delete(self, key: str):
+        self._entries.pop(key, None)
+    
+    async def clear(self):
+        self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DiskBackend:
+    """
+    JSON-file backend keeping one file per key under ``directory``, so cached
+    responses survive across runs. Expiry uses wall-clock time.
+    """
+    
+    def __init__(self, directory: str = ".cache/llm"):
+        """Initialize the disk backend; the directory is created on first write."""
+        self.directory = directory
+    
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+    
+    def _read(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                entry = json.loads(f.read())
+        except (OSError, ValueError):
+            return None
+        
+        expires_at = entry.get("expires_at")
+        if expires_at is not None and time.time() > expires_at:
+            self._remove(path)
+            return None
+        return entry["value"]
+    
+    def _write(self, key: str, value: Dict[str, Any], ttl: Optional[float]):
+        os.makedirs(self.directory, exist_ok=True)
+        # A temp file per write: concurrent writers of one key each rename a
+        # complete file into place, and readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(prefix=f"{key}.", suffix=".tmp", dir=self.directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"expires_at": time.time() + ttl if ttl else None, "value": value}, f)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            self._remove(tmp_path)
+            raise
+    
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    
+    def _clear(self):
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return
+        for name in names:
+            if name.endswith(".json"):
+                self._remove(os.path.join(self.directory, name))
+    
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return await asyncio.to_thread(self._read, key)
+    
+    async def set(self, key: str, value: Dict[str, Any], ttl: Optional[float] = None):
+        await asyncio.to_thread(self._write, key, value, ttl)
+    
+    async def delete(self, key: str):
+        await asyncio.to_thread(self._remove, self._path(key))
+    
+    async def clear(self):
+        await asyncio.to_thread(self._clear)
+
+
+class ResponseCache:
+    """
+    Exact-match cache of successful LLM responses.
+    Only (near-)deterministic requests, with temperature at most
+    ``max_temperature``, are cached. With ``refresh`` every lookup misses,
+    so stored responses are replaced by fresh ones. With ``strict`` a miss
+    raises MissingGoldenError instead of falling through to the provider.
+    """
+    
+    def __init__(self, backend: Optional[CacheBackend] = None, ttl: Optional[float] = 3600.0,
+                 max_temperature: float = 0.0, refresh: bool = False, strict: bool = False):
+        """Initialize the cache, defaulting to an in-memory LRU backend."""
+        self.backend = backend if backend is not None else LRUMemoryBackend()
+        self.ttl = ttl
+        self.max_temperature = max_temperature
+        self.refresh = refresh
+        self.strict = strict
+        self.hits = 0
+        self.misses = 0
+    
+    def is_cacheable(self, request: LLMRequest) -> bool:
+        """Whether the request is deterministic enough to reuse a response."""
+        return request.temperature <= self.max_temperature
+    
+    @staticmethod
+    def key_for(request: LLMRequest) -> str:
+        """Compute the cache key from the fields that determine the output."""
+        normalized = json.dumps(
+            {
+                "model": request.model,
+                "system_prompt": request.system_prompt,
+                "prompt": request.prompt,
+                "max_tokens": request.max_tokens,
+                "temperature": request.temperature,
+                # Requests stopped at the end of the JSON object get truncated content
+                "stop_at_json_end": request.stop_at_json_end
+            },
+            sort_keys=True
+        )
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+    
+    async def get(self, request: LLMRequest) -> Optional[LLMResponse]:
+        """Return the cached response for the request, or None on a miss."""
+        if self.refresh:
+            self.misses += 1
+            return None
+        
+        key = self.key_for(request)
+        cached = await self.backend.get(key)
+        if cached is None:
+            self.misses += 1
+            if self.strict:
+                location = getattr(self.backend, "directory", "the cache backend")
+                raise MissingGoldenError(
+                    f"No recorded response {key} in {location} for {request.model} prompt "
+                    f"{request.prompt[:60]!r}; record it with LLM_CACHE=golden UPDATE_GOLDENS=1 "
+                    f"against a running model"
+                )
+            return None
+        
+        self.hits += 1
+        response = LLMResponse(**cached)
+        response.cached = True
+        response.request_id = request.request_id
+        return response
+    
+    async def set(self, request: LLMRequest, response: LLMResponse):
+        """Store a successful response."""
+        if not response.success:
+            return
+        
+        value = {
+            "content": response.content,
+            "model": response.model,
+            "provider": response.provider,
+            "usage": dict(response.usage),
+            "response_time": response.response_time
+        }
+        await self.backend.set(self.key_for(request), value, ttl=self.ttl)
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get hit/miss counters."""
+        return {"hits": self.hits, "misses": self.misses}
+
+
+class SemanticCache:
+    """
+    Second-tier cache matching prompts by embedding cosine similarity.
+    Entries are partitioned by model, system prompt and max_tokens so only
+    the user prompt is compared, and expire after ``ttl`` seconds. At
+    ``max_entries`` the oldest entry makes way for the new one. Uses numpy
+    for the similarity scan when it is installed.
+    """
+    
+    def __init__(self, embed: Callable[[str], Awaitable[List[float]]],
+                 threshold: float = 0.92, max_entries: int = 1024,
+                 ttl: Optional[float] = 3600.0):
+        """Initialize the cache around an async text-embedding function."""
+        self._embed = embed
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # partition key -> (unit embeddings, cached response dicts, store times)
+        self._partitions: Dict[str, Tuple[List[List[float]], List[Dict[str, Any]], List[float]]] = {}
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def _partition_key(request: LLMRequest) -> str:
+        return json.dumps([request.model, request.system_prompt, request.max_tokens])
+    
+    @staticmethod
+    def _normalize(vector: List[float]) -> List[float]:
+        norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+        return [x / norm for x in vector]
+    
+    def _best_match(self, vectors: List[List[float]], query: List[float]) -> Tuple[int, float]:
+        """Index and cosine similarity of the closest stored vector."""
+        if np is not None:
+            sims = np.asarray(vectors) @ np.asarray(query)
+            index = int(sims.argmax())
+            return index, float(sims[index])
+        
+        sims = [sum(a * b for a, b in zip(vector, query)) for vector in vectors]
+        index = max(range(len(sims)), key=sims.__getitem__)
+        return index, sims[index]
+    
+    def _expire(self, partition: Tuple[List[List[float]], List[Dict[str, Any]], List[float]]):
+        """Drop expired entries; store times are ascending, so they are a prefix."""
+        vectors, values, stored_at = partition
+        cutoff = time.monotonic() - self.ttl
+        expired = 0
+        while expired < len(stored_at) and stored_at[expired] < cutoff:
+            expired += 1
+        if expired:
+            del vectors[:expired], values[:expired], stored_at[:expired]
+            self._size -= expired
+    
+    def _make_room(self):
+        """Drop expired entries, or else the oldest entry across all partitions."""
+        if self.ttl is not None:
+            for partition in self._partitions.values():
+                self._expire(partition)
+        
+        if self._size >= self.max_entries:
+            # Each partition's oldest entry is its first
+            vectors, values, stored_at = min(
+                (partition for partition in self._partitions.values() if partition[2]),
+                key=lambda partition: partition[2][0]
+            )
+            del vectors[0], values[0], stored_at[0]
+            self._size -= 1
+        
+        for key in [key for key, partition in self._partitions.items() if not partition[2]]:
+            del self._partitions[key]
+    
+    async def lookup(self, request: LLMRequest) -> Tuple[Optional[LLMResponse], Optional[List[float]]]:
+        """
+        Find a cached response for a similar prompt.
+        Returns the response (or None) and the prompt embedding for a later store().
+        """
+        query = self._normalize(await self._embed(request.prompt))
+        partition = self._partitions.get(self._partition_key(request))
+        if partition and self.ttl is not None:
+            self._expire(partition)
+        
+        if partition and partition[0]:
+            index, similarity = self._best_match(partition[0], query)
+            if similarity >= self.threshold:
+                self.hits += 1
+                response = LLMResponse(**partition[1][index])
+                response.cached = True
+                response.request_id = request.request_id
+                return response, query
+        
+        self.misses += 1
+        return None, query
+    
+    def store(self, request: LLMRequest, embedding: List[float], response: LLMResponse):
+        """Remember a successful response under the prompt's embedding."""
+        if not response.success or self.max_entries <= 0:
+            return
+        if self._size >= self.max_entries:
+            self._make_room()
+        
+        vectors, values, stored_at = self._partitions.setdefault(self._partition_key(request), ([], [], []))
+        vectors.append(embedding)
+        stored_at.append(time.monotonic())
+        values.append({
+            "content": response.content,
+            "model": response.model,
+            "provider": response.provider,
+            "usage": dict(response.usage),
+            "response_time": response.response_time
+        })
+        self._size += 1
+    
+    def clear(self):
+        """Drop all cached responses."""
+        self._partitions.clear()
+        self._size = 0
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get size and hit/miss counters."""
+        return {"entries": self._size, "hits": self.hits, "misses": self.misses}
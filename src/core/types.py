@@ -2,11 +2,111 @@
 Core data types and structures for the multi-agent system.
 """
 
-from dataclasses import dataclass, field
-from enum import Enum
-from typing import Dict, Any, List, Optional, Union
+from dataclasses import dataclass, field, fields, is_dataclass
+from enum import Enum, IntEnum
+from typing import Deque, Dict, Any, List, Mapping, Optional, Sequence, Union, get_args, get_origin
 from datetime import datetime
-import uuid
+import collections
+import collections.abc
+import itertools
+import operator
+import os
+import sys
+import threading
+import time
+
+
+# Shared read-only defaults for response fields that are usually left empty;
+# writers go through the copy-on-write helpers below
+class _FrozenDict(dict):
+    """Read-only dict; hashable so dataclasses accept it as a field default."""
+    
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("shared empty default is read-only")
+    
+    __setitem__ = __delitem__ = update = setdefault = pop = popitem = clear = _readonly
+    __ior__ = _readonly
+    
+    def __hash__(self):
+        return hash(frozenset(self.items()))
+
+
+_EMPTY_LIST: tuple = ()
+_EMPTY_DICT: Mapping[str, Any] = _FrozenDict()
+
+
+# Random bytes for IDs are read from the OS in bulk instead of 16 at a time
+_UUID_POOL_SIZE = 4096
+_uuid_pool = bytearray()
+_uuid_offset = _UUID_POOL_SIZE
+_uuid_lock = threading.Lock()
+
+# Single-process IDs: process id prefix plus a per-process counter
+_id_counter = itertools.count()
+_id_prefix = f"{os.getpid():x}-"
+
+
+def _after_fork():
+    # A forked child must not reuse the parent's remaining bytes or ID prefix
+    global _uuid_offset, _id_counter, _id_prefix
+    _uuid_offset = _UUID_POOL_SIZE
+    _id_counter = itertools.count()
+    _id_prefix = f"{os.getpid():x}-"
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork)
+
+
+def _random_id() -> str:
+    """
+    Return a random 128-bit ID as 32 hex characters, drawing bytes from a
+    shared pool. IDs are opaque, so the UUID version bits and hyphens are skipped.
+    """
+    global _uuid_pool, _uuid_offset
+    with _uuid_lock:
+        if _uuid_offset >= _UUID_POOL_SIZE:
+            _uuid_pool = bytearray(os.urandom(_UUID_POOL_SIZE))
+            _uuid_offset = 0
+        start = _uuid_offset
+        _uuid_offset += 16
+        return _uuid_pool[start:start + 16].hex()
+
+
+def _counter_id() -> str:
+    """Return an ID unique within this process: ``<pid>-<counter>`` in hex."""
+    return f"{_id_prefix}{next(_id_counter):x}"
+
+
+# IDs only need to be globally unique once agents run in several processes
+# (MAS_DISTRIBUTED=1); otherwise a counter avoids the random bytes entirely
+_fast_id = _random_id if os.environ.get("MAS_DISTRIBUTED") == "1" else _counter_id
+
+
+# Pre-bound for Message._fast_new, which runs once per protocol message
+_new_object = object.__new__
+_intern = sys.intern
+_time_ns = time.time_ns
+
+
+def _id_identity(attr: str):
+    """
+    Build __eq__/__hash__ that compare instances by their unique ID field
+    instead of field-by-field (which means deep dict equality on content).
+    """
+    get_id = operator.attrgetter(attr)
+    
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if type(other) is not type(self):
+            return NotImplemented
+        return get_id(self) == get_id(other)
+    
+    def __hash__(self):
+        return hash(get_id(self))
+    
+    return __eq__, __hash__
 
 
 class AgentRole(Enum):
@@ -22,12 +122,27 @@ class AgentRole(Enum):
     MASTER_ORCHESTRATOR = "master_orchestrator"
 
 
-class TaskPriority(Enum):
-    """Priority levels for task processing."""
-    CRITICAL = "critical"
-    HIGH = "high"
-    MEDIUM = "medium"
-    LOW = "low"
+class TaskPriority(IntEnum):
+    """
+    Priority levels for task processing.
+    Lower values are more urgent, so priorities sort and compare as ints.
+    """
+    CRITICAL = 0
+    HIGH = 1
+    MEDIUM = 2
+    LOW = 3
+    
+    @classmethod
+    def _missing_(cls, value):
+        # Accept the lowercase names used by earlier string-valued serializations
+        if isinstance(value, str):
+            return cls.__members__.get(value.upper())
+        return None
+
+
+# Wire names for priorities. Serialized messages and the bus history carry
+# these strings ("high", "low", ...); the int values only order in-process.
+PRIORITY_NAMES: Dict[TaskPriority, str] = {priority: priority.name.lower() for priority in TaskPriority}
 
 
 class TaskStatus(Enum):
@@ -49,10 +164,10 @@ class MessageType(Enum):
     WORKFLOW_CONTROL = "workflow_control"
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Task:
     """Represents a task to be processed by an agent."""
-    task_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    task_id: str = field(default_factory=_fast_id)
     title: str = ""
     description: str = ""
     requirements: List[str] = field(default_factory=list)
@@ -60,25 +175,77 @@ class Task:
     required_agent_role: Optional[AgentRole] = None
     dependencies: List[str] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: int = field(default_factory=time.time_ns)  # Epoch nanoseconds
     deadline: Optional[datetime] = None
     context: Dict[str, Any] = field(default_factory=dict)
+    
+    @property
+    def created_at_dt(self) -> datetime:
+        """Creation time as a local datetime, for display."""
+        return datetime.fromtimestamp(self.created_at / 1e9)
+    
+    __eq__, __hash__ = _id_identity("task_id")
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentResponse:
     """Response from an agent after processing a task."""
     success: bool
-    result: Dict[str, Any] = field(default_factory=dict)
+    result: Mapping[str, Any] = _EMPTY_DICT
     error: Optional[str] = None
-    feedback: List[str] = field(default_factory=list)
+    feedback: Sequence[str] = _EMPTY_LIST
     confidence: float = 1.0
     execution_time: Optional[float] = None
-    metadata: Dict[str, Any] = field(default_factory=dict)
-    suggestions: List[str] = field(default_factory=list)
-
-
-@dataclass
+    metadata: Mapping[str, Any] = _EMPTY_DICT
+    suggestions: Sequence[str] = _EMPTY_LIST
+    _trace: Optional[Dict[str, Any]] = field(default=None, repr=False, compare=False)
+    
+    def add_feedback(self, item: str):
+        """Append a feedback item, copying the shared empty default first."""
+        if self.feedback is _EMPTY_LIST:
+            self.feedback = []
+        self.feedback.append(item)
+    
+    def add_suggestion(self, item: str):
+        """Append a suggestion, copying the shared empty default first."""
+        if self.suggestions is _EMPTY_LIST:
+            self.suggestions = []
+        self.suggestions.append(item)
+    
+    def update_metadata(self, **values: Any):
+        """Merge values into metadata, copying the shared empty default first."""
+        if self.metadata is _EMPTY_DICT:
+            self.metadata = {}
+        self.metadata.update(values)
+    
+    def full_trace(self) -> Dict[str, Any]:
+        """
+        Get the detailed workflow trace (orchestration result, per-attempt
+        execution and review results, improvement context).
+        Kept out of ``metadata`` so it is only materialized when requested.
+        """
+        if not self._trace:
+            return {}
+        
+        trace = dict(self._trace)
+        
+        if "review_results" in trace:
+            trace["review_results"] = [
+                {
+                    "approved": r.approved,
+                    "score": r.score,
+                    "issues": r.issues,
+                    "suggestions": r.suggestions
+                } for r in trace["review_results"]
+            ]
+        
+        if trace.get("improvement_context") is not None:
+            trace["improvement_context"] = trace["improvement_context"].to_dict()
+        
+        return trace
+
+
+@dataclass(slots=True)
 class ReviewResult:
     """Result of a quality review process."""
     approved: bool
@@ -89,21 +256,51 @@ class ReviewResult:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Message:
     """Inter-agent communication message."""
-    message_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    message_id: str = field(default_factory=_fast_id)
     message_type: MessageType = MessageType.TASK_REQUEST
     sender: str = ""
     recipient: str = ""
     content: Dict[str, Any] = field(default_factory=dict)
     priority: TaskPriority = TaskPriority.MEDIUM
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: int = field(default_factory=time.time_ns)  # Epoch nanoseconds
     correlation_id: Optional[str] = None
     requires_response: bool = False
-
-
-@dataclass
+    
+    @property
+    def timestamp_dt(self) -> datetime:
+        """Send time as a local datetime, for display."""
+        return datetime.fromtimestamp(self.timestamp / 1e9)
+    
+    @classmethod
+    def _fast_new(cls, message_type: MessageType, sender: str, recipient: str,
+                  content: Dict[str, Any], priority: TaskPriority = TaskPriority.MEDIUM,
+                  correlation_id: Optional[str] = None,
+                  requires_response: bool = False) -> "Message":
+        """
+        Positional constructor for protocol hot paths.
+        Fills the slots directly instead of going through the generated __init__;
+        must stay in sync with the field defaults above.
+        Agent ids are interned so routing compares and hashes hit the fast path.
+        """
+        message = _new_object(cls)
+        message.message_id = _fast_id()
+        message.message_type = message_type
+        message.sender = _intern(sender)
+        message.recipient = _intern(recipient)
+        message.content = content
+        message.priority = priority
+        message.timestamp = _time_ns()
+        message.correlation_id = correlation_id
+        message.requires_response = requires_response
+        return message
+    
+    __eq__, __hash__ = _id_identity("message_id")
+
+
+@dataclass(slots=True, frozen=True, eq=False)
 class LLMRequest:
     """Request to LLM provider."""
     prompt: str
@@ -112,10 +309,14 @@ class LLMRequest:
     temperature: float = 0.7
     system_prompt: Optional[str] = None
     context: Dict[str, Any] = field(default_factory=dict)
-    request_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    request_id: str = field(default_factory=_fast_id)
+    cache_system_prompt: bool = True  # Ask providers to cache the system prompt prefix
+    stop_at_json_end: bool = False  # Streaming providers stop once a complete JSON object arrived
+    
+    __eq__, __hash__ = _id_identity("request_id")
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMResponse:
     """Response from LLM provider."""
     content: str
@@ -126,9 +327,10 @@ class LLMResponse:
     error: Optional[str] = None
     response_time: Optional[float] = None
     request_id: Optional[str] = None
+    cached: bool = False  # Served from the response cache
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class ServiceRequest:
     """Request to a specialized service."""
     service_type: str
@@ -136,24 +338,32 @@ class ServiceRequest:
     data: Dict[str, Any] = field(default_factory=dict)
     context: Dict[str, Any] = field(default_factory=dict)
     requester_id: str = ""
-    request_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    request_id: str = field(default_factory=_fast_id)
+    
+    __eq__, __hash__ = _id_identity("request_id")
 
 
-@dataclass
+@dataclass(slots=True)
 class ServiceResponse:
     """Response from a specialized service."""
     success: bool
-    result: Dict[str, Any] = field(default_factory=dict)
+    result: Mapping[str, Any] = _EMPTY_DICT
     error: Optional[str] = None
     service_id: str = ""
     execution_time: Optional[float] = None
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Mapping[str, Any] = _EMPTY_DICT
+    
+    def update_metadata(self, **values: Any):
+        """Merge values into metadata, copying the shared empty default first."""
+        if self.metadata is _EMPTY_DICT:
+            self.metadata = {}
+        self.metadata.update(values)
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class WorkflowStep:
     """Represents a step in a workflow."""
-    step_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    step_id: str = field(default_factory=_fast_id)
     name: str = ""
     agent_role: AgentRole = AgentRole.DOMAIN_ADVISOR
     inputs: List[str] = field(default_factory=list)
@@ -162,32 +372,113 @@ class WorkflowStep:
     parallel_group: Optional[str] = None
     estimated_duration: Optional[int] = None  # minutes
     status: TaskStatus = TaskStatus.PENDING
+    
+    __eq__, __hash__ = _id_identity("step_id")
+
+
+# Retry history entries kept per task; older entries are dropped
+IMPROVEMENT_HISTORY_LIMIT = 100
 
 
-@dataclass
+@dataclass(slots=True)
 class ImprovementContext:
     """Context passed to executors when retrying after review failure."""
     attempt_number: int
-    previous_results: List[Dict[str, Any]] = field(default_factory=list)
+    previous_results: Deque[Dict[str, Any]] = field(default_factory=collections.deque)
     reviewer_feedback: List[str] = field(default_factory=list)
     reviewer_suggestions: List[str] = field(default_factory=list)
     quality_scores: List[float] = field(default_factory=list)
-    improvement_history: List[str] = field(default_factory=list)
+    improvement_history: Deque[str] = field(
+        default_factory=lambda: collections.deque(maxlen=IMPROVEMENT_HISTORY_LIMIT)
+    )
     delegation_candidates: List[AgentRole] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass  
+@dataclass(slots=True, eq=False)
 class Workflow:
     """Represents a complete workflow with multiple steps."""
-    workflow_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    workflow_id: str = field(default_factory=_fast_id)
     name: str = ""
     description: str = ""
-    steps: List[WorkflowStep] = field(default_factory=list)
+    steps: Deque[WorkflowStep] = field(default_factory=collections.deque)
     current_step: Optional[str] = None
     status: TaskStatus = TaskStatus.PENDING
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: int = field(default_factory=time.time_ns)  # Epoch nanoseconds
     metadata: Dict[str, Any] = field(default_factory=dict)
+    
+    @property
+    def created_at_dt(self) -> datetime:
+        """Creation time as a local datetime, for display."""
+        return datetime.fromtimestamp(self.created_at / 1e9)
+    
+    __eq__, __hash__ = _id_identity("workflow_id")
+
+
+class AgentError(Exception):
+    """Base class for recoverable failures inside an agent component."""
+
+
+class OrchestrationError(AgentError):
+    """Raised when an orchestrator cannot produce an execution plan."""
+
+
+class ExecutionError(AgentError):
+    """Raised when an executor cannot complete a task."""
+
+
+class ReviewError(AgentError):
+    """Raised when a reviewer cannot assess an execution result."""
+
+
+def _gen_to_dict(cls):
+    """
+    Attach a generated ``to_dict()`` to a dataclass: a straight-line dict
+    literal built from the known fields, instead of asdict()'s generic
+    recursion and deepcopy. Containers are copied one level deep and nested
+    dataclasses (or lists of them) are converted through their own to_dict().
+    """
+    items = []
+    for f in fields(cls):
+        attr = f"self.{f.name}"
+        origin = get_origin(f.type)
+        args = get_args(f.type)
+        if is_dataclass(f.type):
+            expr = f"{attr}.to_dict()"
+        elif origin in (list, collections.deque, collections.abc.Sequence) and args and is_dataclass(args[0]):
+            expr = f"[item.to_dict() for item in {attr}]"
+        elif origin in (list, collections.deque, collections.abc.Sequence):
+            expr = f"list({attr})"
+        elif origin in (dict, collections.abc.Mapping):
+            expr = f"dict({attr})"
+        else:
+            expr = attr
+        items.append(f"{f.name!r}: {expr}")
+    
+    source = "def to_dict(self):\n    return {" + ", ".join(items) + "}\n"
+    namespace: Dict[str, Any] = {}
+    exec(source, namespace)
+    to_dict = namespace["to_dict"]
+    to_dict.__qualname__ = f"{cls.__qualname__}.to_dict"
+    to_dict.__doc__ = f"Convert this {cls.__name__} to a plain dict."
+    cls.to_dict = to_dict
+    return cls
+
+
+for _cls in (Task, AgentResponse, ReviewResult, Message, LLMRequest, LLMResponse,
+             ServiceRequest, ServiceResponse, WorkflowStep, ImprovementContext, Workflow):
+    _gen_to_dict(_cls)
+del _cls
+
+
+# Enum values are used as dict keys and compared throughout the message bus;
+# make sure they are interned even if a value is not identifier-like (the
+# compiler only interns those). Field names are identifiers and already are.
+for _enum in (AgentRole, TaskPriority, TaskStatus, MessageType):
+    for _member in _enum:
+        if isinstance(_member._value_, str):
+            _member._value_ = sys.intern(_member._value_)
+del _enum, _member
 
 
 # Type aliases for common patterns
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Test one agent processing overlapping tasks: its status only settles once
+every task has finished, and process_tasks() gives each task its own context.
+"""
+import asyncio
+import sys
+
+from src.agents.domain_advisor.domain_advisor import DomainAdvisorAgent
+from src.core import llm_client as llm_module
+from src.core.llm_client import LLMClient
+from src.core.types import AgentResponse, Task, TaskStatus
+
+
+class GatedAgent(DomainAdvisorAgent):
+    """Agent whose workflow waits for a per-task gate and fails tasks titled 'fails'."""
+
+    __slots__ = ("gates", "contexts")
+
+    def __init__(self):
+        super().__init__("gated")
+        self.gates = {}
+        self.contexts = []
+
+    async def _run_workflow(self, task, context):
+        self.contexts.append(context)
+        if context is not None:
+            # The executor stores per-attempt state in the context like this
+            context["improvement_context"] = task.title
+        await self.gates.setdefault(task.title, asyncio.Event()).wait()
+        return AgentResponse(success=task.title != "fails")
+
+
+def _agent():
+    llm_module._llm_client = LLMClient({})
+    return GatedAgent()
+
+
+def test_status_waits_for_overlapping_tasks():
+    """A task finishing early does not mark the agent done while another runs."""
+    async def run():
+        agent = _agent()
+        first = asyncio.ensure_future(agent.process_task(Task(title="fails")))
+        second = asyncio.ensure_future(agent.process_task(Task(title="slow")))
+        await asyncio.sleep(0)
+
+        agent.gates["fails"].set()
+        await first
+        assert agent.status is TaskStatus.IN_PROGRESS, f"status settled early: {agent.status}"
+
+        agent.gates["slow"].set()
+        await second
+        assert agent.status is TaskStatus.COMPLETED, f"expected COMPLETED, got {agent.status}"
+
+    asyncio.run(run())
+
+
+def test_process_tasks_copies_context():
+    """Concurrent tasks never write into one shared context dict."""
+    async def run():
+        agent = _agent()
+        for title in ("a", "b"):
+            agent.gates[title] = asyncio.Event()
+            agent.gates[title].set()
+        shared = {"use_plan_cache": False}
+
+        responses = await agent.process_tasks([Task(title="a"), Task(title="b")], context=shared)
+
+        assert all(response.success for response in responses)
+        assert shared == {"use_plan_cache": False}, f"shared context was modified: {shared}"
+        assert [context["improvement_context"] for context in agent.contexts] == ["a", "b"]
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    tests = [value for name, value in list(globals().items()) if name.startswith("test_")]
+    failures = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failures += 1
+            print(f"❌ {test.__name__}: {e}")
+    print(f"\nResult: {'✅ PASS' if not failures else '❌ FAIL'}")
+    sys.exit(1 if failures else 0)
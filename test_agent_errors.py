@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Test that LLM and parsing failures surface as the typed agent errors and end
+up as failed results, not as unexpected crashes.
+"""
+import asyncio
+import logging
+import sys
+
+from src.agents.domain_advisor.domain_advisor import (
+    DomainAdvisorAgent, DomainAdvisorExecutor, DomainAdvisorOrchestrator, DomainAdvisorReviewer
+)
+from src.core import llm_client as llm_module
+from src.core.llm_client import LLMClient
+from src.core.types import LLMRequest, LLMResponse, Task
+
+
+class CannedLLMClient(LLMClient):
+    """LLM client that answers every request with the same canned response."""
+
+    def __init__(self, content: str = "", error: str = None):
+        super().__init__({"enable_response_cache": False})
+        self.canned = LLMResponse(content=content, model="test", provider="test",
+                                  success=error is None, error=error)
+        self.calls = 0
+
+    async def generate_response(self, request: LLMRequest) -> LLMResponse:
+        self.calls += 1
+        return self.canned
+
+    async def generate_batched(self, request: LLMRequest) -> LLMResponse:
+        return await self.generate_response(request)
+
+
+class TracebackCounter(logging.Handler):
+    """Counts log records carrying a traceback, i.e. logger.exception() calls."""
+
+    def __init__(self):
+        super().__init__()
+        self.tracebacks = 0
+
+    def emit(self, record):
+        self.tracebacks += record.exc_info is not None
+
+
+def _task():
+    return Task(title="Booking system", description="Let customers book rooms",
+                requirements=["Customers can book rooms"])
+
+
+def _expect_typed_failure(coro):
+    """Run a component call and check it failed without an unexpected-crash traceback."""
+    counter = TracebackCounter()
+    logging.getLogger("src").addHandler(counter)
+    try:
+        result = asyncio.run(coro)
+    finally:
+        logging.getLogger("src").removeHandler(counter)
+    assert counter.tracebacks == 0, "failure was logged as an unexpected crash"
+    return result
+
+
+def test_failed_llm_call_fails_orchestration():
+    """A failed LLM response is an OrchestrationError, not a fallback plan."""
+    orchestrator = DomainAdvisorOrchestrator("test", CannedLLMClient(error="connection refused"))
+    result = _expect_typed_failure(orchestrator.orchestrate(_task(), {"use_plan_cache": False}))
+
+    assert result["success"] is False
+    assert "LLM orchestration failed: connection refused" in result["execution_plan"]["error"]
+
+
+def test_unparseable_plan_fails_orchestration():
+    """An orchestration response without JSON is an OrchestrationError."""
+    orchestrator = DomainAdvisorOrchestrator("test", CannedLLMClient("I cannot plan this."))
+    result = _expect_typed_failure(orchestrator.orchestrate(_task(), {"use_plan_cache": False}))
+
+    assert "Failed to parse orchestration response" in result["execution_plan"]["error"]
+
+
+def test_failed_llm_call_fails_execution():
+    """A failed LLM response during analysis is an ExecutionError."""
+    executor = DomainAdvisorExecutor("test", CannedLLMClient(error="model not found"))
+    result = _expect_typed_failure(executor.execute(_task(), {}))
+
+    assert result["success"] is False
+    assert result["error"] == "Domain analysis LLM call failed: model not found"
+
+
+def test_unparseable_review_is_rejected():
+    """A review the LLM answered without JSON is a ReviewError and rejects the result."""
+    reviewer = DomainAdvisorReviewer("test", CannedLLMClient("Looks fine to me."))
+    execution_result = {"result": {"domain_model": {"entities": []}}, "success": True}
+    review = _expect_typed_failure(reviewer.review(_task(), execution_result))
+
+    assert not review.approved
+    assert "Failed to parse completeness review" in review.issues[0]
+
+
+def test_failed_orchestration_stops_the_workflow():
+    """process_task returns the orchestration error without executing."""
+    client = CannedLLMClient(error="connection refused")
+    llm_module._llm_client = client
+    agent = DomainAdvisorAgent("test")
+
+    response = _expect_typed_failure(agent.process_task(_task(), {"use_plan_cache": False}))
+
+    assert not response.success
+    assert "LLM orchestration failed" in response.error
+    assert client.calls == 1, f"expected only the orchestration call, got {client.calls}"
+
+
+if __name__ == "__main__":
+    tests = [value for name, value in list(globals().items()) if name.startswith("test_")]
+    failures = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failures += 1
+            print(f"❌ {test.__name__}: {e}")
+    print(f"\nResult: {'✅ PASS' if not failures else '❌ FAIL'}")
+    sys.exit(1 if failures else 0)
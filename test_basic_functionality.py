@@ -4,17 +4,216 @@ Tests core components without requiring API keys.
 """
 
 import asyncio
-import sys
-import os
-
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+import json
+import pickle
+import re
+import traceback
 
 from src.core.types import Task, AgentRole, TaskPriority, LLMRequest, LLMResponse
+from src.core.base_agent import enable_eager_task_factory, install_uvloop
 from src.core.llm_client import LLMClient, initialize_llm_client
-from src.communication.message_bus import MessageBus, initialize_message_bus
-from src.communication.protocols import ProtocolHelper
-from src.agents.domain_advisor.domain_advisor import DomainAdvisorAgent
+
+try:
+    import orjson
+    _json_loads = orjson.loads  # raises a json.JSONDecodeError subclass
+except ImportError:
+    _json_loads = json.loads
+
+
+_PLAN_JSON = '''{
+    "execution_plan": {
+        "analysis_type": "user_requirements_analysis",
+        "focus_areas": ["domain_modeling", "requirements_analysis"],
+        "extraction_steps": [
+            {
+                "step": "domain_analysis",
+                "description": "Extract entities and relationships",
+                "outputs": ["domain_model"]
+            }
+        ],
+        "quality_gates": ["completeness_check"],
+        "estimated_duration": 10,
+        "required_resources": ["business_requirements"]
+    }
+}'''
+
+_DOMAIN_JSON = '''{
+    "domain_model": {
+        "entities": [
+            {
+                "name": "User",
+                "description": "System user",
+                "attributes": ["id", "name", "email"],
+                "constraints": ["unique email"]
+            },
+            {
+                "name": "Task",
+                "description": "User task item",
+                "attributes": ["id", "title", "description", "status"],
+                "constraints": ["valid status"]
+            }
+        ],
+        "relationships": [
+            {
+                "from_entity": "User",
+                "to_entity": "Task",
+                "relationship_type": "one-to-many",
+                "description": "Users can have multiple tasks"
+            }
+        ],
+        "business_rules": [
+            {
+                "rule": "Users can only edit their own tasks",
+                "category": "authorization",
+                "entities_affected": ["User", "Task"],
+                "priority": "high"
+            }
+        ],
+        "processes": [
+            {
+                "name": "Task Creation",
+                "description": "Process for creating new tasks",
+                "steps": ["validate input", "create task", "notify user"],
+                "entities_involved": ["User", "Task"],
+                "triggers": ["user creates task"]
+            }
+        ]
+    }
+}'''
+
+_REQS_JSON = '''{
+    "functional_requirements": [
+        {
+            "id": "FR001",
+            "requirement": "Users can create tasks",
+            "priority": "must-have",
+            "user_story": "As a user I want to create tasks so that I can track my work",
+            "acceptance_criteria": ["Task form validation", "Task saved to database"]
+        }
+    ],
+    "non_functional_requirements": [
+        {
+            "category": "performance",
+            "requirement": "System responds within 2 seconds",
+            "measurable_criteria": "95% of requests under 2s",
+            "priority": "high"
+        }
+    ],
+    "compliance_requirements": [
+        {
+            "standard": "GDPR",
+            "requirements": ["data consent", "right to deletion"],
+            "impact": "User data handling must comply with GDPR"
+        }
+    ],
+    "user_personas": [
+        {
+            "name": "Task Manager",
+            "role": "Project Manager",
+            "goals": ["track team progress", "manage deadlines"],
+            "pain_points": ["scattered task information"],
+            "technical_proficiency": "medium"
+        }
+    ],
+    "use_cases": [
+        {
+            "name": "Create Task",
+            "actor": "Task Manager",
+            "description": "Manager creates a new task",
+            "preconditions": ["user logged in"],
+            "main_flow": ["open task form", "fill details", "save task"],
+            "alternate_flows": ["validation errors"],
+            "postconditions": ["task saved", "user notified"]
+        }
+    ]
+}'''
+
+_SPECS_JSON = '''{
+    "technical_specifications": {
+        "authentication": {
+            "method": "JWT",
+            "requirements": ["secure token storage", "token refresh"],
+            "considerations": ["token expiry", "secure transmission"]
+        },
+        "authorization": {
+            "model": "RBAC",
+            "roles": [
+                {
+                    "role": "user",
+                    "permissions": ["create_task", "view_own_tasks"],
+                    "description": "Standard user role"
+                }
+            ],
+            "policies": ["users can only access own data"]
+        },
+        "data_handling": {
+            "storage_requirements": ["encrypted at rest"],
+            "processing_requirements": ["input validation"],
+            "security_requirements": ["data anonymization"],
+            "retention_policies": ["delete after 7 years"]
+        },
+        "integration": {
+            "external_systems": ["email service"],
+            "apis_needed": ["notification API"],
+            "data_exchange": ["JSON REST APIs"]
+        },
+        "security": {
+            "measures": ["HTTPS", "input sanitization"],
+            "compliance_mappings": ["GDPR compliance through data controls"],
+            "risk_assessments": ["data breach mitigation"]
+        }
+    }
+}'''
+
+_REVIEW_JSON = '''{
+    "review_result": {
+        "approved": true,
+        "confidence_score": 0.85,
+        "completeness_score": 0.9,
+        "accuracy_score": 0.8,
+        "issues": [],
+        "strengths": ["comprehensive domain model", "clear requirements"],
+        "missing_elements": [],
+        "improvement_suggestions": ["add more detailed acceptance criteria"]
+    }
+}'''
+
+_VALIDATION_JSON = '''{
+    "validation_result": {
+        "approved": true,
+        "alignment_score": 0.85,
+        "feasibility_score": 0.9,
+        "issues": [],
+        "compliance_coverage": [
+            {
+                "requirement": "GDPR",
+                "addressed": true,
+                "how": "Data handling specifications include GDPR controls"
+            }
+        ],
+        "improvement_recommendations": ["consider additional security measures"]
+    }
+}'''
+
+# Prompt keywords in precedence order, matched in a single regex pass
+_PROMPT_KEYWORDS = ("execution plan", "domain analysis", "requirements analysis",
+                    "technical specifications", "review")
+_PROMPT_PATTERN = re.compile("|".join(map(re.escape, _PROMPT_KEYWORDS)))
+_KEYWORD_RANK = {keyword: rank for rank, keyword in enumerate(_PROMPT_KEYWORDS)}
+_RESPONSES = {
+    "execution plan": _PLAN_JSON,
+    "domain analysis": _DOMAIN_JSON,
+    "requirements analysis": _REQS_JSON,
+    "technical specifications": _SPECS_JSON
+}
+
+# Canned payloads parsed once at import. Callers mutate parsed results, so each
+# parse returns a fresh copy; unpickling a snapshot is cheaper than both
+# json.loads and copy.deepcopy for these structures.
+_PARSED_SNAPSHOTS = {
+    payload: pickle.dumps(json.loads(payload))
+    for payload in (_PLAN_JSON, _DOMAIN_JSON, _REQS_JSON, _SPECS_JSON, _REVIEW_JSON, _VALIDATION_JSON)
+}
 
 
 class MockLLMClient(LLMClient):
@@ -29,183 +228,18 @@ class MockLLMClient(LLMClient):
         """Generate mock response based on prompt content."""
         
         # Simple mock responses based on prompt keywords
-        if "execution plan" in request.prompt.lower():
-            content = '''{
-                "execution_plan": {
-                    "analysis_type": "user_requirements_analysis",
-                    "focus_areas": ["domain_modeling", "requirements_analysis"],
-                    "extraction_steps": [
-                        {
-                            "step": "domain_analysis",
-                            "description": "Extract entities and relationships",
-                            "outputs": ["domain_model"]
-                        }
-                    ],
-                    "quality_gates": ["completeness_check"],
-                    "estimated_duration": 10,
-                    "required_resources": ["business_requirements"]
-                }
-            }'''
-            
-        elif "domain analysis" in request.prompt.lower():
-            content = '''{
-                "domain_model": {
-                    "entities": [
-                        {
-                            "name": "User",
-                            "description": "System user",
-                            "attributes": ["id", "name", "email"],
-                            "constraints": ["unique email"]
-                        },
-                        {
-                            "name": "Task",
-                            "description": "User task item",
-                            "attributes": ["id", "title", "description", "status"],
-                            "constraints": ["valid status"]
-                        }
-                    ],
-                    "relationships": [
-                        {
-                            "from_entity": "User",
-                            "to_entity": "Task",
-                            "relationship_type": "one-to-many",
-                            "description": "Users can have multiple tasks"
-                        }
-                    ],
-                    "business_rules": [
-                        {
-                            "rule": "Users can only edit their own tasks",
-                            "category": "authorization",
-                            "entities_affected": ["User", "Task"],
-                            "priority": "high"
-                        }
-                    ],
-                    "processes": [
-                        {
-                            "name": "Task Creation",
-                            "description": "Process for creating new tasks",
-                            "steps": ["validate input", "create task", "notify user"],
-                            "entities_involved": ["User", "Task"],
-                            "triggers": ["user creates task"]
-                        }
-                    ]
-                }
-            }'''
-            
-        elif "requirements analysis" in request.prompt.lower():
-            content = '''{
-                "functional_requirements": [
-                    {
-                        "id": "FR001",
-                        "requirement": "Users can create tasks",
-                        "priority": "must-have",
-                        "user_story": "As a user I want to create tasks so that I can track my work",
-                        "acceptance_criteria": ["Task form validation", "Task saved to database"]
-                    }
-                ],
-                "non_functional_requirements": [
-                    {
-                        "category": "performance",
-                        "requirement": "System responds within 2 seconds",
-                        "measurable_criteria": "95% of requests under 2s",
-                        "priority": "high"
-                    }
-                ],
-                "compliance_requirements": [
-                    {
-                        "standard": "GDPR",
-                        "requirements": ["data consent", "right to deletion"],
-                        "impact": "User data handling must comply with GDPR"
-                    }
-                ],
-                "user_personas": [
-                    {
-                        "name": "Task Manager",
-                        "role": "Project Manager",
-                        "goals": ["track team progress", "manage deadlines"],
-                        "pain_points": ["scattered task information"],
-                        "technical_proficiency": "medium"
-                    }
-                ],
-                "use_cases": [
-                    {
-                        "name": "Create Task",
-                        "actor": "Task Manager",
-                        "description": "Manager creates a new task",
-                        "preconditions": ["user logged in"],
-                        "main_flow": ["open task form", "fill details", "save task"],
-                        "alternate_flows": ["validation errors"],
-                        "postconditions": ["task saved", "user notified"]
-                    }
-                ]
-            }'''
-            
-        elif "technical specifications" in request.prompt.lower():
-            content = '''{
-                "technical_specifications": {
-                    "authentication": {
-                        "method": "JWT",
-                        "requirements": ["secure token storage", "token refresh"],
-                        "considerations": ["token expiry", "secure transmission"]
-                    },
-                    "authorization": {
-                        "model": "RBAC",
-                        "roles": [
-                            {
-                                "role": "user",
-                                "permissions": ["create_task", "view_own_tasks"],
-                                "description": "Standard user role"
-                            }
-                        ],
-                        "policies": ["users can only access own data"]
-                    },
-                    "data_handling": {
-                        "storage_requirements": ["encrypted at rest"],
-                        "processing_requirements": ["input validation"],
-                        "security_requirements": ["data anonymization"],
-                        "retention_policies": ["delete after 7 years"]
-                    },
-                    "integration": {
-                        "external_systems": ["email service"],
-                        "apis_needed": ["notification API"],
-                        "data_exchange": ["JSON REST APIs"]
-                    },
-                    "security": {
-                        "measures": ["HTTPS", "input sanitization"],
-                        "compliance_mappings": ["GDPR compliance through data controls"],
-                        "risk_assessments": ["data breach mitigation"]
-                    }
-                }
-            }'''
-            
-        elif "review" in request.prompt.lower():
-            content = '''{
-                "review_result": {
-                    "approved": true,
-                    "confidence_score": 0.85,
-                    "completeness_score": 0.9,
-                    "accuracy_score": 0.8,
-                    "issues": [],
-                    "strengths": ["comprehensive domain model", "clear requirements"],
-                    "missing_elements": [],
-                    "improvement_suggestions": ["add more detailed acceptance criteria"]
-                }
-            }''' if "completeness" in request.prompt.lower() else '''{
-                "validation_result": {
-                    "approved": true,
-                    "alignment_score": 0.85,
-                    "feasibility_score": 0.9,
-                    "issues": [],
-                    "compliance_coverage": [
-                        {
-                            "requirement": "GDPR",
-                            "addressed": true,
-                            "how": "Data handling specifications include GDPR controls"
-                        }
-                    ],
-                    "improvement_recommendations": ["consider additional security measures"]
-                }
-            }'''
+        lowered = request.prompt.lower()
+        rank = len(_PROMPT_KEYWORDS)
+        for match in _PROMPT_PATTERN.finditer(lowered):
+            rank = min(rank, _KEYWORD_RANK[match.group()])
+            if not rank:
+                break  # top-priority keyword, the rest of the prompt cannot change it
+        keyword = _PROMPT_KEYWORDS[rank] if rank < len(_PROMPT_KEYWORDS) else None
+        
+        if keyword == "review":
+            content = _REVIEW_JSON if "completeness" in lowered else _VALIDATION_JSON
+        elif keyword is not None:
+            content = _RESPONSES[keyword]
         else:
             content = '{"result": "Mock response for: ' + request.prompt[:50] + '..."}'
         
@@ -219,15 +253,24 @@ class MockLLMClient(LLMClient):
     async def parse_structured_response(self, response: LLMResponse, 
                                       expected_format: str = "json"):
         """Parse the mock JSON response."""
-        import json
+        snapshot = _PARSED_SNAPSHOTS.get(response.content)
+        if snapshot is not None:
+            return pickle.loads(snapshot)
+        
         try:
-            return json.loads(response.content)
+            return _json_loads(response.content)
         except json.JSONDecodeError:
             return {"content": response.content, "parsed": False}
 
 
 async def test_basic_functionality():
     """Test basic functionality of the multi-agent system."""
+    enable_eager_task_factory()
+    
+    # The agent and bus modules are only needed once the test runs
+    from src.communication.message_bus import initialize_message_bus
+    from src.communication.protocols import ProtocolHelper
+    from src.agents.domain_advisor.domain_advisor import DomainAdvisorAgent
     
     print("🤖 Testing Multi-Agent Coding System")
     print("=" * 50)
@@ -304,17 +347,18 @@ async def test_basic_functionality():
             print(f"   Execution time: {response.execution_time:.2f}s")
             
             # Check if we got expected results
-            result = response.result
-            if "domain_model" in result:
-                entities = result["domain_model"].get("entities", [])
+            get = response.result.get
+            domain_model = get("domain_model")
+            if domain_model is not None:
+                entities = domain_model.get("entities", [])
                 print(f"   Found {len(entities)} domain entities")
                 
-            if "functional_requirements" in result:
-                func_reqs = result["functional_requirements"]
+            func_reqs = get("functional_requirements")
+            if func_reqs is not None:
                 print(f"   Extracted {len(func_reqs)} functional requirements")
                 
-            if "technical_specifications" in result:
-                tech_specs = result["technical_specifications"]
+            tech_specs = get("technical_specifications")
+            if tech_specs is not None:
                 print(f"   Generated technical specifications: {list(tech_specs.keys())}")
             
         else:
@@ -324,7 +368,6 @@ async def test_basic_functionality():
         
     except Exception as e:
         print(f"❌ Domain Advisor test failed: {e}")
-        import traceback
         traceback.print_exc()
     
     # Test 4: Component Integration
@@ -357,7 +400,8 @@ async def test_basic_functionality():
             
             # Validate response structure
             expected_keys = ["domain_model", "functional_requirements", "technical_specifications"]
-            missing_keys = [key for key in expected_keys if key not in response.result]
+            result = response.result
+            missing_keys = [key for key in expected_keys if key not in result]
             
             if not missing_keys:
                 print("✅ Response contains all expected components")
@@ -387,4 +431,5 @@ async def test_basic_functionality():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(test_basic_functionality())
\ No newline at end of file
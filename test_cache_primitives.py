@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Test the building blocks behind LLM calls: AsyncRateLimiter pacing, PlanCache
+expiry and copy isolation, and DiskBackend atomic writes.
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+from src.core.llm_client import AsyncRateLimiter
+from src.core.plan_cache import PlanCache
+from src.core.response_cache import DiskBackend
+from src.core.types import Task
+
+
+def test_rate_limiter_spreads_requests():
+    """Beyond the burst capacity, acquisitions are spaced at the drain rate."""
+    async def run():
+        limiter = AsyncRateLimiter(max_rate=2, time_period=0.2)  # one slot per 0.1s
+        start = time.monotonic()
+        admitted = []
+        for _ in range(5):
+            await limiter.acquire()
+            admitted.append(time.monotonic() - start)
+        return admitted
+
+    admitted = asyncio.run(run())
+
+    assert admitted[1] < 0.05, f"burst was throttled: {admitted}"
+    gaps = [later - earlier for earlier, later in zip(admitted[1:], admitted[2:])]
+    assert all(0.08 <= gap <= 0.2 for gap in gaps), f"uneven pacing: {admitted}"
+
+
+def test_rate_limiter_admits_concurrent_waiters_in_turn():
+    """Concurrent callers are released one by one, not together."""
+    async def run():
+        limiter = AsyncRateLimiter(max_rate=1, time_period=0.1)
+        start = time.monotonic()
+
+        async def timed():
+            await limiter.acquire()
+            return time.monotonic() - start
+
+        return sorted(await asyncio.gather(*(timed() for _ in range(4))))
+
+    admitted = asyncio.run(run())
+
+    assert admitted[-1] >= 0.28, f"waiters released too early: {admitted}"
+
+
+def _task(title="Booking system"):
+    return Task(title=title, description="Let customers book rooms",
+                requirements=["Customers can book rooms", "Admins can cancel bookings"])
+
+
+def test_plan_cache_expires_entries():
+    """A plan older than the TTL is a miss and is dropped."""
+    cache = PlanCache(ttl=60.0)
+    cache.put("Orchestrator", _task(), {"steps": ["analyse"]})
+    key = PlanCache.fingerprint("Orchestrator", _task())
+    stored_at, plan = cache._entries[key]
+
+    cache._entries[key] = (stored_at - 59.0, plan)
+    assert cache.get("Orchestrator", _task()) == {"steps": ["analyse"]}
+
+    cache._entries[key] = (stored_at - 61.0, plan)
+    assert cache.get("Orchestrator", _task()) is None
+    assert cache.get_statistics() == {"entries": 0, "hits": 1, "misses": 1}
+
+
+def test_plan_cache_isolates_copies():
+    """Neither the stored plan nor earlier lookups change when callers mutate theirs."""
+    cache = PlanCache()
+    plan = {"steps": [{"step": "analyse", "outputs": ["model"]}]}
+    cache.put("Orchestrator", _task(), plan)
+    plan["steps"][0]["outputs"].append("mutated after put")
+
+    first = cache.get("Orchestrator", _task())
+    first["steps"][0]["outputs"].append("mutated after get")
+    second = cache.get("Orchestrator", _task())
+
+    assert second == {"steps": [{"step": "analyse", "outputs": ["model"]}]}
+    assert second is not first
+
+
+def test_disk_backend_write_then_read_back():
+    """A stored entry reads back equal and leaves no temp files behind."""
+    async def run(directory):
+        backend = DiskBackend(os.path.join(directory, "cache"))
+        value = {"content": "héllo {json}", "usage": {"total_tokens": 3}, "response_time": 0.5}
+        await backend.set("key", value, ttl=60.0)
+        return value, await backend.get("key"), sorted(os.listdir(backend.directory))
+
+    with tempfile.TemporaryDirectory() as directory:
+        value, read_back, files = asyncio.run(run(directory))
+
+    assert read_back == value
+    assert files == ["key.json"], f"unexpected files: {files}"
+
+
+def test_disk_backend_concurrent_writes_of_one_key():
+    """Overlapping writes of a key all succeed and leave one complete entry."""
+    async def run(directory):
+        backend = DiskBackend(directory)
+        values = [{"content": str(index) * 50_000} for index in range(8)]
+        results = await asyncio.gather(*(backend.set("key", value) for value in values),
+                                       return_exceptions=True)
+        return values, results, await backend.get("key"), os.listdir(directory)
+
+    with tempfile.TemporaryDirectory() as directory:
+        values, results, read_back, files = asyncio.run(run(directory))
+
+    assert not any(results), f"writes failed: {results}"
+    assert read_back in values
+    assert files == ["key.json"], f"unexpected files: {files}"
+
+
+def test_disk_backend_expires_entries():
+    """An entry past its TTL reads as a miss and its file is removed."""
+    async def run(directory):
+        backend = DiskBackend(directory)
+        await backend.set("key", {"content": "old"}, ttl=0.01)
+        await asyncio.sleep(0.05)
+        return await backend.get("key"), os.listdir(directory)
+
+    with tempfile.TemporaryDirectory() as directory:
+        read_back, files = asyncio.run(run(directory))
+
+    assert read_back is None and files == []
+
+
+if __name__ == "__main__":
+    tests = [value for name, value in list(globals().items()) if name.startswith("test_")]
+    failures = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failures += 1
+            print(f"❌ {test.__name__}: {e}")
+    print(f"\nResult: {'✅ PASS' if not failures else '❌ FAIL'}")
+    sys.exit(1 if failures else 0)
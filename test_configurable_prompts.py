@@ -5,6 +5,7 @@ Test the configurable prompt system with qwen3:14b
 import asyncio
 import sys
 import os
+import traceback
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
@@ -120,7 +121,6 @@ async def test_configurable_prompts():
         
     except Exception as e:
         print(f"❌ Configurable prompts test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -187,7 +187,6 @@ async def main():
         
     except Exception as e:
         print(f"\n💥 Test error: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
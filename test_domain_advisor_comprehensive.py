@@ -4,17 +4,353 @@ Tests both mock and real scenarios to ensure proper functionality.
 """
 
 import asyncio
-import sys
-import os
+import itertools
 import json
-
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+import pickle
+from typing import Dict, Tuple
 
 from src.core.types import Task, AgentRole, TaskPriority, LLMRequest, LLMResponse
+from src.core.base_agent import enable_eager_task_factory, install_uvloop
 from src.core.llm_client import LLMClient, initialize_llm_client
 from src.agents.domain_advisor.domain_advisor import DomainAdvisorAgent
 
+try:
+    import orjson
+    _json_loads = orjson.loads  # raises a json.JSONDecodeError subclass
+except ImportError:
+    _json_loads = json.loads
+
+
+_PLAN_JSON = '''{
+    "execution_plan": {
+        "analysis_type": "comprehensive_business_analysis",
+        "focus_areas": ["domain_modeling", "requirements_analysis", "compliance_assessment", "technical_specification"],
+        "extraction_steps": [
+            {
+                "step": "domain_analysis",
+                "description": "Extract entities, relationships, and business rules",
+                "outputs": ["domain_model", "business_rules", "processes"]
+            },
+            {
+                "step": "requirements_analysis",
+                "description": "Categorize and analyze all requirements",
+                "outputs": ["functional_requirements", "non_functional_requirements", "user_personas", "use_cases"]
+            },
+            {
+                "step": "technical_specification",
+                "description": "Generate technical specifications based on analysis",
+                "outputs": ["authentication_spec", "authorization_spec", "data_handling_spec"]
+            }
+        ],
+        "quality_gates": ["completeness_check", "consistency_validation", "technical_feasibility"],
+        "estimated_duration": 15,
+        "required_resources": ["business_requirements", "domain_expertise", "compliance_knowledge"]
+    },
+    "success_criteria": ["all_requirements_addressed", "clear_technical_specs", "compliance_mapped"]
+}'''
+
+_PLAN_VALIDATION_JSON = '''{
+    "valid": true,
+    "confidence": 0.9,
+    "issues": [],
+    "suggestions": ["Consider adding security analysis as a focus area"]
+}'''
+
+_DOMAIN_JSON = '''{
+    "domain_model": {
+        "entities": [
+            {
+                "name": "User",
+                "description": "System user who creates and manages tasks",
+                "attributes": ["id", "name", "email", "role", "created_at"],
+                "constraints": ["unique email", "valid email format", "role must be defined"]
+            },
+            {
+                "name": "Task",
+                "description": "Work item that users create and track",
+                "attributes": ["id", "title", "description", "status", "priority", "assignee_id", "project_id", "created_at", "updated_at"],
+                "constraints": ["title required", "valid status", "valid priority"]
+            },
+            {
+                "name": "Project", 
+                "description": "Container for organizing related tasks",
+                "attributes": ["id", "name", "description", "owner_id", "team_members"],
+                "constraints": ["unique name per user", "at least one member"]
+            },
+            {
+                "name": "Notification",
+                "description": "System notifications for task updates",
+                "attributes": ["id", "recipient_id", "type", "content", "read", "created_at"],
+                "constraints": ["valid recipient", "valid notification type"]
+            }
+        ],
+        "relationships": [
+            {
+                "from_entity": "User",
+                "to_entity": "Task",
+                "relationship_type": "one-to-many",
+                "description": "Users can create multiple tasks"
+            },
+            {
+                "from_entity": "Project",
+                "to_entity": "Task",
+                "relationship_type": "one-to-many",
+                "description": "Projects contain multiple tasks"
+            },
+            {
+                "from_entity": "User",
+                "to_entity": "Project",
+                "relationship_type": "many-to-many",
+                "description": "Users can be members of multiple projects"
+            },
+            {
+                "from_entity": "User",
+                "to_entity": "Notification",
+                "relationship_type": "one-to-many",
+                "description": "Users receive notifications"
+            }
+        ],
+        "business_rules": [
+            {
+                "rule": "Users can only edit their own tasks or tasks in projects they belong to",
+                "category": "authorization",
+                "entities_affected": ["User", "Task", "Project"],
+                "priority": "critical"
+            },
+            {
+                "rule": "Task status must follow workflow: created -> in_progress -> completed",
+                "category": "business_logic",
+                "entities_affected": ["Task"],
+                "priority": "high"
+            },
+            {
+                "rule": "Notifications must be sent when tasks are updated",
+                "category": "business_logic",
+                "entities_affected": ["Task", "Notification", "User"],
+                "priority": "medium"
+            },
+            {
+                "rule": "User data must be encrypted and GDPR compliant",
+                "category": "compliance",
+                "entities_affected": ["User"],
+                "priority": "critical"
+            }
+        ],
+        "processes": [
+            {
+                "name": "Task Creation",
+                "description": "Process for creating new tasks",
+                "steps": ["authenticate user", "validate input", "create task", "assign to project", "notify team members"],
+                "entities_involved": ["User", "Task", "Project", "Notification"],
+                "triggers": ["user initiates task creation"]
+            },
+            {
+                "name": "User Authentication",
+                "description": "Process for authenticating users",
+                "steps": ["validate credentials", "check account status", "generate session", "log activity"],
+                "entities_involved": ["User"],
+                "triggers": ["login attempt"]
+            }
+        ]
+    }
+}'''
+
+_REQS_JSON = '''{
+    "functional_requirements": [
+        {
+            "id": "FR001",
+            "requirement": "Users can create and manage tasks",
+            "priority": "must-have",
+            "user_story": "As a user, I want to create tasks so that I can track my work",
+            "acceptance_criteria": ["Task creation form available", "All task fields can be edited", "Tasks persist in database"]
+        },
+        {
+            "id": "FR002", 
+            "requirement": "System supports user authentication",
+            "priority": "must-have",
+            "user_story": "As a user, I want to securely log in so that I can access my tasks",
+            "acceptance_criteria": ["Login form with email/password", "Session management", "Password reset functionality"]
+        },
+        {
+            "id": "FR003",
+            "requirement": "Tasks organized in projects",
+            "priority": "must-have",
+            "user_story": "As a user, I want to organize tasks in projects for better management",
+            "acceptance_criteria": ["Create/edit projects", "Assign tasks to projects", "View tasks by project"]
+        },
+        {
+            "id": "FR004",
+            "requirement": "Send notifications for task updates",
+            "priority": "should-have",
+            "user_story": "As a user, I want to receive notifications when tasks are updated",
+            "acceptance_criteria": ["Email notifications", "In-app notifications", "Notification preferences"]
+        }
+    ],
+    "non_functional_requirements": [
+        {
+            "category": "security",
+            "requirement": "Data must be stored securely",
+            "measurable_criteria": "AES-256 encryption at rest, TLS 1.3 in transit",
+            "priority": "critical"
+        },
+        {
+            "category": "performance",
+            "requirement": "System must be responsive",
+            "measurable_criteria": "95% of requests complete within 2 seconds",
+            "priority": "high"
+        },
+        {
+            "category": "scalability",
+            "requirement": "Support multiple concurrent users",
+            "measurable_criteria": "Handle 10,000 concurrent users",
+            "priority": "medium"
+        },
+        {
+            "category": "usability",
+            "requirement": "Interface must be intuitive",
+            "measurable_criteria": "New users can create first task within 2 minutes",
+            "priority": "high"
+        }
+    ],
+    "compliance_requirements": [
+        {
+            "standard": "GDPR",
+            "requirements": ["User consent for data processing", "Right to data deletion", "Data portability", "Privacy by design"],
+            "impact": "Must implement data protection measures and user rights management"
+        }
+    ],
+    "user_personas": [
+        {
+            "name": "Project Manager",
+            "role": "Team Lead",
+            "goals": ["Track team progress", "Manage multiple projects", "Assign tasks efficiently"],
+            "pain_points": ["Scattered information", "No real-time updates", "Manual status tracking"],
+            "technical_proficiency": "medium"
+        },
+        {
+            "name": "Team Member",
+            "role": "Individual Contributor",
+            "goals": ["Complete assigned tasks", "Update task status", "Collaborate with team"],
+            "pain_points": ["Unclear priorities", "Missing notifications", "Complex interfaces"],
+            "technical_proficiency": "low"
+        }
+    ],
+    "use_cases": [
+        {
+            "name": "Create New Task",
+            "actor": "Project Manager",
+            "description": "Project manager creates a new task and assigns it to team member",
+            "preconditions": ["User is authenticated", "Project exists"],
+            "main_flow": ["Navigate to project", "Click create task", "Fill task details", "Assign to team member", "Save task"],
+            "alternate_flows": ["Validation error - show error message", "Network error - retry or save draft"],
+            "postconditions": ["Task created in database", "Assignee notified", "Task appears in project"]
+        }
+    ]
+}'''
+
+_SPECS_JSON = '''{
+    "technical_specifications": {
+        "authentication": {
+            "method": "JWT with refresh tokens",
+            "requirements": ["Secure token storage", "Token refresh mechanism", "Session timeout after 30 minutes", "Multi-factor authentication support"],
+            "considerations": ["Token rotation strategy", "Secure cookie handling", "CSRF protection"]
+        },
+        "authorization": {
+            "model": "Role-Based Access Control (RBAC)",
+            "roles": [
+                {
+                    "role": "admin",
+                    "permissions": ["manage_all_projects", "manage_all_users", "view_analytics"],
+                    "description": "System administrator with full access"
+                },
+                {
+                    "role": "project_manager",
+                    "permissions": ["create_projects", "manage_project_tasks", "invite_members"],
+                    "description": "Can manage projects and assign tasks"
+                },
+                {
+                    "role": "team_member",
+                    "permissions": ["view_assigned_tasks", "update_task_status", "create_personal_tasks"],
+                    "description": "Regular user with task access"
+                }
+            ],
+            "policies": ["Users can only access their projects", "Task visibility based on project membership", "Audit log for all actions"]
+        },
+        "data_handling": {
+            "storage_requirements": ["PostgreSQL for relational data", "Redis for session cache", "S3 for file attachments"],
+            "processing_requirements": ["Input sanitization", "SQL injection prevention", "XSS protection"],
+            "security_requirements": ["Encryption at rest (AES-256)", "Encryption in transit (TLS 1.3)", "Regular security audits"],
+            "retention_policies": ["Active data retained indefinitely", "Deleted user data purged after 30 days", "Audit logs retained for 1 year"]
+        },
+        "integration": {
+            "external_systems": ["Email service (SendGrid/AWS SES)", "Calendar integration (Google/Outlook)", "Slack/Teams for notifications"],
+            "apis_needed": ["REST API for web/mobile clients", "WebSocket for real-time updates", "Webhook support for integrations"],
+            "data_exchange": ["JSON for API responses", "JWT for authentication", "OAuth2 for third-party integrations"]
+        },
+        "security": {
+            "measures": ["OWASP Top 10 compliance", "Regular dependency updates", "Security headers (CSP, HSTS)", "Rate limiting on APIs"],
+            "compliance_mappings": ["GDPR Article 25 - Data protection by design", "GDPR Article 32 - Security of processing"],
+            "risk_assessments": ["SQL injection - mitigated by parameterized queries", "XSS - mitigated by input sanitization", "CSRF - mitigated by CSRF tokens"]
+        }
+    }
+}'''
+
+_REVIEW_JSON = '''{
+    "review_result": {
+        "approved": true,
+        "confidence_score": 0.9,
+        "completeness_score": 0.95,
+        "accuracy_score": 0.9,
+        "issues": [],
+        "strengths": ["Comprehensive entity model", "Clear business rules", "Well-defined relationships", "Security considerations included"],
+        "missing_elements": [],
+        "improvement_suggestions": ["Consider adding more detailed error handling scenarios", "Define data validation rules more explicitly"]
+    }
+}'''
+
+_SPECS_VALIDATION_JSON = '''{
+    "validation_result": {
+        "approved": true,
+        "alignment_score": 0.92,
+        "feasibility_score": 0.95,
+        "issues": [],
+        "compliance_coverage": [
+            {
+                "requirement": "GDPR",
+                "addressed": true,
+                "how": "Data encryption, retention policies, and user rights implementation specified"
+            },
+            {
+                "requirement": "Security",
+                "addressed": true,
+                "how": "JWT authentication, RBAC authorization, and OWASP compliance specified"
+            }
+        ],
+        "improvement_recommendations": ["Consider implementing API versioning strategy", "Add more details on monitoring and logging"]
+    }
+}'''
+
+# Returned when no prompt keywords match
+_FALLBACK_JSON = '{"result": "Mock response for unmatched prompt"}'
+
+# Required prompt keywords -> canned response, checked in order
+_PROMPT_TABLE = (
+    (("execution plan", "analyze this business requirements"), _PLAN_JSON),
+    (("review this execution plan",), _PLAN_VALIDATION_JSON),
+    (("perform comprehensive domain analysis",), _DOMAIN_JSON),
+    (("analyze and categorize these business requirements",), _REQS_JSON),
+    (("create technical specifications",), _SPECS_JSON),
+    (("review this domain analysis", "completeness"), _REVIEW_JSON),
+    (("validate these technical specifications",), _SPECS_VALIDATION_JSON),
+)
+# Canned payloads parsed once at import. Callers may mutate parsed results and
+# the test cases run concurrently, so each parse returns a fresh copy;
+# unpickling a snapshot is cheaper than both json.loads and copy.deepcopy.
+_PARSED_SNAPSHOTS = {
+    payload: pickle.dumps(_json_loads(payload))
+    for payload in (*(payload for _, payload in _PROMPT_TABLE), _FALLBACK_JSON)
+}
+
 
 class ImprovedMockLLMClient(LLMClient):
     """Improved mock LLM client with more accurate responses."""
@@ -23,353 +359,51 @@ class ImprovedMockLLMClient(LLMClient):
         self.config = config
         self.max_retries = config.get("max_retries", 3)
         self.call_count = 0
+        self._calls = itertools.count(1)  # next() is atomic, unlike +=
+        # (payload, model) -> response; callers only read mock responses, so
+        # each combination is built once and handed out again
+        self._responses: Dict[Tuple[str, str], LLMResponse] = {}
         
     async def generate_response(self, request: LLMRequest) -> LLMResponse:
         """Generate more accurate mock responses."""
-        self.call_count += 1
+        self.call_count = next(self._calls)
         
-        # Orchestrator planning response
-        if "execution plan" in request.prompt.lower() and "analyze this business requirements" in request.prompt.lower():
-            content = '''{
-                "execution_plan": {
-                    "analysis_type": "comprehensive_business_analysis",
-                    "focus_areas": ["domain_modeling", "requirements_analysis", "compliance_assessment", "technical_specification"],
-                    "extraction_steps": [
-                        {
-                            "step": "domain_analysis",
-                            "description": "Extract entities, relationships, and business rules",
-                            "outputs": ["domain_model", "business_rules", "processes"]
-                        },
-                        {
-                            "step": "requirements_analysis",
-                            "description": "Categorize and analyze all requirements",
-                            "outputs": ["functional_requirements", "non_functional_requirements", "user_personas", "use_cases"]
-                        },
-                        {
-                            "step": "technical_specification",
-                            "description": "Generate technical specifications based on analysis",
-                            "outputs": ["authentication_spec", "authorization_spec", "data_handling_spec"]
-                        }
-                    ],
-                    "quality_gates": ["completeness_check", "consistency_validation", "technical_feasibility"],
-                    "estimated_duration": 15,
-                    "required_resources": ["business_requirements", "domain_expertise", "compliance_knowledge"]
-                },
-                "success_criteria": ["all_requirements_addressed", "clear_technical_specs", "compliance_mapped"]
-            }'''
-            
-        # Validation of execution plan
-        elif "review this execution plan" in request.prompt.lower():
-            content = '''{
-                "valid": true,
-                "confidence": 0.9,
-                "issues": [],
-                "suggestions": ["Consider adding security analysis as a focus area"]
-            }'''
-            
-        # Domain analysis response
-        elif "perform comprehensive domain analysis" in request.prompt.lower():
-            content = '''{
-                "domain_model": {
-                    "entities": [
-                        {
-                            "name": "User",
-                            "description": "System user who creates and manages tasks",
-                            "attributes": ["id", "name", "email", "role", "created_at"],
-                            "constraints": ["unique email", "valid email format", "role must be defined"]
-                        },
-                        {
-                            "name": "Task",
-                            "description": "Work item that users create and track",
-                            "attributes": ["id", "title", "description", "status", "priority", "assignee_id", "project_id", "created_at", "updated_at"],
-                            "constraints": ["title required", "valid status", "valid priority"]
-                        },
-                        {
-                            "name": "Project", 
-                            "description": "Container for organizing related tasks",
-                            "attributes": ["id", "name", "description", "owner_id", "team_members"],
-                            "constraints": ["unique name per user", "at least one member"]
-                        },
-                        {
-                            "name": "Notification",
-                            "description": "System notifications for task updates",
-                            "attributes": ["id", "recipient_id", "type", "content", "read", "created_at"],
-                            "constraints": ["valid recipient", "valid notification type"]
-                        }
-                    ],
-                    "relationships": [
-                        {
-                            "from_entity": "User",
-                            "to_entity": "Task",
-                            "relationship_type": "one-to-many",
-                            "description": "Users can create multiple tasks"
-                        },
-                        {
-                            "from_entity": "Project",
-                            "to_entity": "Task",
-                            "relationship_type": "one-to-many",
-                            "description": "Projects contain multiple tasks"
-                        },
-                        {
-                            "from_entity": "User",
-                            "to_entity": "Project",
-                            "relationship_type": "many-to-many",
-                            "description": "Users can be members of multiple projects"
-                        },
-                        {
-                            "from_entity": "User",
-                            "to_entity": "Notification",
-                            "relationship_type": "one-to-many",
-                            "description": "Users receive notifications"
-                        }
-                    ],
-                    "business_rules": [
-                        {
-                            "rule": "Users can only edit their own tasks or tasks in projects they belong to",
-                            "category": "authorization",
-                            "entities_affected": ["User", "Task", "Project"],
-                            "priority": "critical"
-                        },
-                        {
-                            "rule": "Task status must follow workflow: created -> in_progress -> completed",
-                            "category": "business_logic",
-                            "entities_affected": ["Task"],
-                            "priority": "high"
-                        },
-                        {
-                            "rule": "Notifications must be sent when tasks are updated",
-                            "category": "business_logic",
-                            "entities_affected": ["Task", "Notification", "User"],
-                            "priority": "medium"
-                        },
-                        {
-                            "rule": "User data must be encrypted and GDPR compliant",
-                            "category": "compliance",
-                            "entities_affected": ["User"],
-                            "priority": "critical"
-                        }
-                    ],
-                    "processes": [
-                        {
-                            "name": "Task Creation",
-                            "description": "Process for creating new tasks",
-                            "steps": ["authenticate user", "validate input", "create task", "assign to project", "notify team members"],
-                            "entities_involved": ["User", "Task", "Project", "Notification"],
-                            "triggers": ["user initiates task creation"]
-                        },
-                        {
-                            "name": "User Authentication",
-                            "description": "Process for authenticating users",
-                            "steps": ["validate credentials", "check account status", "generate session", "log activity"],
-                            "entities_involved": ["User"],
-                            "triggers": ["login attempt"]
-                        }
-                    ]
-                }
-            }'''
-            
-        # Requirements analysis response
-        elif "analyze and categorize these business requirements" in request.prompt.lower():
-            content = '''{
-                "functional_requirements": [
-                    {
-                        "id": "FR001",
-                        "requirement": "Users can create and manage tasks",
-                        "priority": "must-have",
-                        "user_story": "As a user, I want to create tasks so that I can track my work",
-                        "acceptance_criteria": ["Task creation form available", "All task fields can be edited", "Tasks persist in database"]
-                    },
-                    {
-                        "id": "FR002", 
-                        "requirement": "System supports user authentication",
-                        "priority": "must-have",
-                        "user_story": "As a user, I want to securely log in so that I can access my tasks",
-                        "acceptance_criteria": ["Login form with email/password", "Session management", "Password reset functionality"]
-                    },
-                    {
-                        "id": "FR003",
-                        "requirement": "Tasks organized in projects",
-                        "priority": "must-have",
-                        "user_story": "As a user, I want to organize tasks in projects for better management",
-                        "acceptance_criteria": ["Create/edit projects", "Assign tasks to projects", "View tasks by project"]
-                    },
-                    {
-                        "id": "FR004",
-                        "requirement": "Send notifications for task updates",
-                        "priority": "should-have",
-                        "user_story": "As a user, I want to receive notifications when tasks are updated",
-                        "acceptance_criteria": ["Email notifications", "In-app notifications", "Notification preferences"]
-                    }
-                ],
-                "non_functional_requirements": [
-                    {
-                        "category": "security",
-                        "requirement": "Data must be stored securely",
-                        "measurable_criteria": "AES-256 encryption at rest, TLS 1.3 in transit",
-                        "priority": "critical"
-                    },
-                    {
-                        "category": "performance",
-                        "requirement": "System must be responsive",
-                        "measurable_criteria": "95% of requests complete within 2 seconds",
-                        "priority": "high"
-                    },
-                    {
-                        "category": "scalability",
-                        "requirement": "Support multiple concurrent users",
-                        "measurable_criteria": "Handle 10,000 concurrent users",
-                        "priority": "medium"
-                    },
-                    {
-                        "category": "usability",
-                        "requirement": "Interface must be intuitive",
-                        "measurable_criteria": "New users can create first task within 2 minutes",
-                        "priority": "high"
-                    }
-                ],
-                "compliance_requirements": [
-                    {
-                        "standard": "GDPR",
-                        "requirements": ["User consent for data processing", "Right to data deletion", "Data portability", "Privacy by design"],
-                        "impact": "Must implement data protection measures and user rights management"
-                    }
-                ],
-                "user_personas": [
-                    {
-                        "name": "Project Manager",
-                        "role": "Team Lead",
-                        "goals": ["Track team progress", "Manage multiple projects", "Assign tasks efficiently"],
-                        "pain_points": ["Scattered information", "No real-time updates", "Manual status tracking"],
-                        "technical_proficiency": "medium"
-                    },
-                    {
-                        "name": "Team Member",
-                        "role": "Individual Contributor",
-                        "goals": ["Complete assigned tasks", "Update task status", "Collaborate with team"],
-                        "pain_points": ["Unclear priorities", "Missing notifications", "Complex interfaces"],
-                        "technical_proficiency": "low"
-                    }
-                ],
-                "use_cases": [
-                    {
-                        "name": "Create New Task",
-                        "actor": "Project Manager",
-                        "description": "Project manager creates a new task and assigns it to team member",
-                        "preconditions": ["User is authenticated", "Project exists"],
-                        "main_flow": ["Navigate to project", "Click create task", "Fill task details", "Assign to team member", "Save task"],
-                        "alternate_flows": ["Validation error - show error message", "Network error - retry or save draft"],
-                        "postconditions": ["Task created in database", "Assignee notified", "Task appears in project"]
-                    }
-                ]
-            }'''
-            
-        # Technical specification response
-        elif "create technical specifications" in request.prompt.lower():
-            content = '''{
-                "technical_specifications": {
-                    "authentication": {
-                        "method": "JWT with refresh tokens",
-                        "requirements": ["Secure token storage", "Token refresh mechanism", "Session timeout after 30 minutes", "Multi-factor authentication support"],
-                        "considerations": ["Token rotation strategy", "Secure cookie handling", "CSRF protection"]
-                    },
-                    "authorization": {
-                        "model": "Role-Based Access Control (RBAC)",
-                        "roles": [
-                            {
-                                "role": "admin",
-                                "permissions": ["manage_all_projects", "manage_all_users", "view_analytics"],
-                                "description": "System administrator with full access"
-                            },
-                            {
-                                "role": "project_manager",
-                                "permissions": ["create_projects", "manage_project_tasks", "invite_members"],
-                                "description": "Can manage projects and assign tasks"
-                            },
-                            {
-                                "role": "team_member",
-                                "permissions": ["view_assigned_tasks", "update_task_status", "create_personal_tasks"],
-                                "description": "Regular user with task access"
-                            }
-                        ],
-                        "policies": ["Users can only access their projects", "Task visibility based on project membership", "Audit log for all actions"]
-                    },
-                    "data_handling": {
-                        "storage_requirements": ["PostgreSQL for relational data", "Redis for session cache", "S3 for file attachments"],
-                        "processing_requirements": ["Input sanitization", "SQL injection prevention", "XSS protection"],
-                        "security_requirements": ["Encryption at rest (AES-256)", "Encryption in transit (TLS 1.3)", "Regular security audits"],
-                        "retention_policies": ["Active data retained indefinitely", "Deleted user data purged after 30 days", "Audit logs retained for 1 year"]
-                    },
-                    "integration": {
-                        "external_systems": ["Email service (SendGrid/AWS SES)", "Calendar integration (Google/Outlook)", "Slack/Teams for notifications"],
-                        "apis_needed": ["REST API for web/mobile clients", "WebSocket for real-time updates", "Webhook support for integrations"],
-                        "data_exchange": ["JSON for API responses", "JWT for authentication", "OAuth2 for third-party integrations"]
-                    },
-                    "security": {
-                        "measures": ["OWASP Top 10 compliance", "Regular dependency updates", "Security headers (CSP, HSTS)", "Rate limiting on APIs"],
-                        "compliance_mappings": ["GDPR Article 25 - Data protection by design", "GDPR Article 32 - Security of processing"],
-                        "risk_assessments": ["SQL injection - mitigated by parameterized queries", "XSS - mitigated by input sanitization", "CSRF - mitigated by CSRF tokens"]
-                    }
-                }
-            }'''
-            
-        # Review responses
-        elif "review this domain analysis" in request.prompt.lower() and "completeness" in request.prompt.lower():
-            content = '''{
-                "review_result": {
-                    "approved": true,
-                    "confidence_score": 0.9,
-                    "completeness_score": 0.95,
-                    "accuracy_score": 0.9,
-                    "issues": [],
-                    "strengths": ["Comprehensive entity model", "Clear business rules", "Well-defined relationships", "Security considerations included"],
-                    "missing_elements": [],
-                    "improvement_suggestions": ["Consider adding more detailed error handling scenarios", "Define data validation rules more explicitly"]
-                }
-            }'''
-            
-        elif "validate these technical specifications" in request.prompt.lower():
-            content = '''{
-                "validation_result": {
-                    "approved": true,
-                    "alignment_score": 0.92,
-                    "feasibility_score": 0.95,
-                    "issues": [],
-                    "compliance_coverage": [
-                        {
-                            "requirement": "GDPR",
-                            "addressed": true,
-                            "how": "Data encryption, retention policies, and user rights implementation specified"
-                        },
-                        {
-                            "requirement": "Security",
-                            "addressed": true,
-                            "how": "JWT authentication, RBAC authorization, and OWASP compliance specified"
-                        }
-                    ],
-                    "improvement_recommendations": ["Consider implementing API versioning strategy", "Add more details on monitoring and logging"]
-                }
-            }'''
+        # One lowered copy, probed with C-level substring searches
+        contains = request.prompt.lower().__contains__
+        for keywords, payload in _PROMPT_TABLE:
+            if all(map(contains, keywords)):
+                content = payload
+                break
         else:
             # Generic fallback
-            content = '{"result": "Mock response for unmatched prompt"}'
+            content = _FALLBACK_JSON
         
-        return LLMResponse(
-            content=content,
-            model=request.model,
-            provider="mock",
-            success=True
-        )
+        key = (content, request.model)
+        response = self._responses.get(key)
+        if response is None:
+            response = self._responses[key] = LLMResponse(
+                content=content,
+                model=request.model,
+                provider="mock",
+                success=True
+            )
+        return response
     
     async def parse_structured_response(self, response: LLMResponse, expected_format: str = "json"):
         """Parse the mock JSON response."""
+        snapshot = _PARSED_SNAPSHOTS.get(response.content)
+        if snapshot is not None:
+            return pickle.loads(snapshot)
+        
         try:
-            return json.loads(response.content)
+            return _json_loads(response.content)
         except json.JSONDecodeError:
             return {"content": response.content, "parsed": False}
 
 
 async def test_domain_advisor_comprehensively():
     """Comprehensive test suite for Domain Advisor Agent."""
+    enable_eager_task_factory()
     
     print("🧪 Comprehensive Domain Advisor Agent Testing")
     print("=" * 60)
@@ -389,12 +423,11 @@ async def test_domain_advisor_comprehensively():
     # Initialize Domain Advisor Agent
     print("\n2. Creating Domain Advisor Agent...")
     domain_advisor = DomainAdvisorAgent("test_domain_advisor")
+    # The e-commerce case runs alongside the batch, so it gets its own agent
+    ecommerce_advisor = DomainAdvisorAgent("test_domain_advisor_ecommerce")
     print("✅ Domain Advisor Agent created")
     
-    # Test Case 1: Basic Requirements Analysis
-    print("\n3. Test Case 1: Basic Task Management Requirements")
-    print("-" * 40)
-    
+    # Test case inputs
     basic_requirements = [
         "Users should be able to create and manage tasks",
         "System should support user authentication",
@@ -403,13 +436,56 @@ async def test_domain_advisor_comprehensively():
         "Data should be stored securely and comply with GDPR"
     ]
     
-    response1 = await domain_advisor.analyze_business_requirements(
-        requirements=basic_requirements,
-        domain="task_management",
-        stakeholders=["project_managers", "team_members"],
-        compliance_needs=["GDPR"]
+    ecommerce_task = Task(
+        title="E-commerce Platform Analysis",
+        description="Analyze requirements for a comprehensive e-commerce platform",
+        requirements=[
+            "Users can browse and search products",
+            "Users can add items to shopping cart",
+            "Secure checkout with multiple payment options",
+            "Admin can manage inventory and orders",
+            "Real-time inventory tracking",
+            "Customer reviews and ratings",
+            "Multi-currency support",
+            "Mobile-responsive design",
+            "PCI-DSS compliance for payments",
+            "GDPR compliance for EU customers"
+        ],
+        required_agent_role=AgentRole.DOMAIN_ADVISOR,
+        metadata={
+            "domain": "e-commerce",
+            "stakeholders": ["customers", "administrators", "merchants", "payment_processors"],
+            "compliance_needs": ["PCI-DSS", "GDPR", "CCPA"]
+        }
+    )
+    
+    large_requirements = [f"Requirement {i}: System should handle feature {i}" for i in range(50)]
+    
+    # Concurrent cases use separate agents (the batch overlaps its own tasks
+    # through process_tasks); results are reported in order
+    (response1, response3, response4), response2 = await asyncio.gather(
+        domain_advisor.analyze_business_requirements_batch([
+            {
+                "requirements": basic_requirements,
+                "domain": "task_management",
+                "stakeholders": ["project_managers", "team_members"],
+                "compliance_needs": ["GDPR"]
+            },
+            # Empty requirements
+            {"requirements": [], "domain": "test"},
+            # Very long requirement list
+            {
+                "requirements": large_requirements[:10],  # Use first 10 to keep test reasonable
+                "domain": "large_system"
+            }
+        ]),
+        ecommerce_advisor.process_task(ecommerce_task)
     )
     
+    # Test Case 1: Basic Requirements Analysis
+    print("\n3. Test Case 1: Basic Task Management Requirements")
+    print("-" * 40)
+    
     if response1.success:
         print("✅ Basic requirements analysis successful")
         print(f"   Confidence: {response1.confidence:.2f}")
@@ -450,47 +526,23 @@ async def test_domain_advisor_comprehensively():
     print("\n4. Test Case 2: Complex E-commerce Requirements")
     print("-" * 40)
     
-    ecommerce_task = Task(
-        title="E-commerce Platform Analysis",
-        description="Analyze requirements for a comprehensive e-commerce platform",
-        requirements=[
-            "Users can browse and search products",
-            "Users can add items to shopping cart",
-            "Secure checkout with multiple payment options",
-            "Admin can manage inventory and orders",
-            "Real-time inventory tracking",
-            "Customer reviews and ratings",
-            "Multi-currency support",
-            "Mobile-responsive design",
-            "PCI-DSS compliance for payments",
-            "GDPR compliance for EU customers"
-        ],
-        required_agent_role=AgentRole.DOMAIN_ADVISOR,
-        metadata={
-            "domain": "e-commerce",
-            "stakeholders": ["customers", "administrators", "merchants", "payment_processors"],
-            "compliance_needs": ["PCI-DSS", "GDPR", "CCPA"]
-        }
-    )
-    
-    response2 = await domain_advisor.process_task(ecommerce_task)
-    
     if response2.success:
         print("✅ E-commerce requirements analysis successful")
         print(f"   Confidence: {response2.confidence:.2f}")
         print(f"   Processing stages:")
         
-        # Check metadata for processing details
-        if "metadata" in response2.__dict__ and response2.metadata:
-            if "orchestration" in response2.metadata:
-                plan = response2.metadata["orchestration"].get("execution_plan", {})
+        # Check the workflow trace for processing details
+        trace = response2.full_trace()
+        if trace:
+            if "orchestration" in trace:
+                plan = trace["orchestration"].get("execution_plan", {})
                 print(f"      - Analysis type: {plan.get('analysis_type', 'N/A')}")
                 print(f"      - Focus areas: {plan.get('focus_areas', [])}")
             
-            if "review" in response2.metadata:
-                review = response2.metadata["review"]
-                print(f"      - Review approved: {review.approved}")
-                print(f"      - Review score: {review.score:.2f}")
+            if trace.get("review_results"):
+                review = trace["review_results"][-1]
+                print(f"      - Review approved: {review['approved']}")
+                print(f"      - Review score: {review['score']:.2f}")
     else:
         print(f"❌ E-commerce requirements analysis failed: {response2.error}")
     
@@ -500,19 +552,10 @@ async def test_domain_advisor_comprehensively():
     
     # Empty requirements
     print("   Testing empty requirements...")
-    response3 = await domain_advisor.analyze_business_requirements(
-        requirements=[],
-        domain="test"
-    )
     print(f"   Empty requirements handled: {'✅' if response3.success else '❌'}")
     
     # Very long requirement list
     print("   Testing large requirement set...")
-    large_requirements = [f"Requirement {i}: System should handle feature {i}" for i in range(50)]
-    response4 = await domain_advisor.analyze_business_requirements(
-        requirements=large_requirements[:10],  # Use first 10 to keep test reasonable
-        domain="large_system"
-    )
     print(f"   Large requirements handled: {'✅' if response4.success else '❌'}")
     
     # Test Case 4: Validate Complete Workflow
@@ -563,4 +606,5 @@ async def test_domain_advisor_comprehensively():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(test_domain_advisor_comprehensively())
\ No newline at end of file
@@ -11,7 +11,9 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from core.llm_client import initialize_llm_client, LLMClient
 from core.types import Task
-from core.base_agent import BaseAgent, BaseOrchestrator, BaseExecutor, BaseReviewer
+from core.base_agent import (
+    BaseAgent, BaseOrchestrator, BaseExecutor, BaseReviewer, enable_eager_task_factory, install_uvloop
+)
 
 # Import domain advisor components directly
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src', 'agents', 'domain_advisor'))
@@ -85,6 +87,7 @@ async def test_domain_advisor_with_ollama():
 
 async def main():
     """Main test function."""
+    enable_eager_task_factory()
     try:
         success = await test_domain_advisor_with_ollama()
         if success:
@@ -100,5 +103,6 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     success = asyncio.run(main())
     sys.exit(0 if success else 1)
\ No newline at end of file
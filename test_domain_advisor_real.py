@@ -8,15 +8,14 @@ import os
 import sys
 from dotenv import load_dotenv
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-
+from src.core.base_agent import enable_eager_task_factory, install_uvloop
 from src.core.llm_client import initialize_llm_client
 from src.agents.domain_advisor.domain_advisor import DomainAdvisorAgent
 
 
 async def test_with_real_llm():
     """Test Domain Advisor with real LLM API."""
+    enable_eager_task_factory()
     
     print("🤖 Testing Domain Advisor Agent with Real LLM")
     print("=" * 60)
@@ -45,6 +44,13 @@ async def test_with_real_llm():
         "rate_limit_rpm": 20  # Conservative rate limit for testing
     }
     
+    # With LLM_CACHE_PATH, responses are recorded on disk and replayed on
+    # later runs, whatever their temperature
+    cache_path = os.getenv("LLM_CACHE_PATH")
+    if cache_path:
+        config.update(cache_dir=cache_path, cache_ttl=None, cache_max_temperature=1.0)
+        print(f"✅ Replaying cached responses from {cache_path}")
+    
     print(f"✅ Using {config['default_provider']} as LLM provider")
     
     try:
@@ -203,4 +209,5 @@ if __name__ == "__main__":
             print("📝 Created .env file. Please add your API keys before running.")
             sys.exit(1)
     
+    install_uvloop()
     asyncio.run(test_with_real_llm())
\ No newline at end of file
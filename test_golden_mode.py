@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Test LLM_CACHE=golden: recording with UPDATE_GOLDENS=1 calls the model and
+writes fixtures, replay serves them without the model, and replaying a
+request that was never recorded fails loudly.
+"""
+import asyncio
+import os
+import sys
+import tempfile
+
+from src.core.llm_client import LLMClient
+from src.core.response_cache import MissingGoldenError
+from src.core.types import LLMRequest, LLMResponse
+
+
+class RecordingLLMClient(LLMClient):
+    """LLM client whose Ollama calls return canned content and are counted."""
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.calls = 0
+
+    async def _call_ollama(self, request: LLMRequest) -> LLMResponse:
+        self.calls += 1
+        return LLMResponse(content=f"answer to {request.prompt}", model=request.model, provider="ollama")
+
+
+def _run_golden(golden_dir, prompt, update=False):
+    """Send one request in golden mode; returns (response or exception, model calls)."""
+    os.environ["LLM_CACHE"] = "golden"
+    os.environ["UPDATE_GOLDENS"] = "1" if update else "0"
+    client = RecordingLLMClient({"golden_dir": golden_dir})
+    # Agents plan and analyse at temperatures above 0, which goldens must cover too
+    request = LLMRequest(prompt=prompt, model="qwen3:14b", temperature=0.4)
+    try:
+        result = asyncio.run(client.generate_response(request))
+    except MissingGoldenError as e:
+        result = e
+    finally:
+        del os.environ["LLM_CACHE"], os.environ["UPDATE_GOLDENS"]
+    return result, client.calls
+
+
+def test_missing_golden_fails_loudly():
+    """Replaying an unrecorded request raises instead of calling the model."""
+    with tempfile.TemporaryDirectory() as golden_dir:
+        result, calls = _run_golden(golden_dir, "never recorded")
+
+    assert isinstance(result, MissingGoldenError), f"expected MissingGoldenError, got {result!r}"
+    assert "UPDATE_GOLDENS=1" in str(result)
+    assert calls == 0, "the model was called in replay mode"
+
+
+def test_recorded_golden_replays_without_model():
+    """A response recorded with UPDATE_GOLDENS=1 is replayed without a model call."""
+    with tempfile.TemporaryDirectory() as golden_dir:
+        recorded, record_calls = _run_golden(golden_dir, "plan the shop", update=True)
+        replayed, replay_calls = _run_golden(golden_dir, "plan the shop")
+
+    assert record_calls == 1 and not recorded.cached
+    assert replay_calls == 0
+    assert replayed.cached and replayed.content == "answer to plan the shop"
+
+
+if __name__ == "__main__":
+    tests = [value for name, value in list(globals().items()) if name.startswith("test_")]
+    failures = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failures += 1
+            print(f"❌ {test.__name__}: {e}")
+    print(f"\nResult: {'✅ PASS' if not failures else '❌ FAIL'}")
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Test the stop_at_json_end stream tracker: string contents and escapes never
+end the object early, split chunks are handled, and a stream that is cut off
+before the object closes falls back to the full cleaned response.
+"""
+import asyncio
+import sys
+
+from src.core.ollama_client import OllamaProvider, _JsonEndTracker
+from src.core.types import LLMRequest
+
+
+def _feed(chunks):
+    """Feed chunks in order; returns (index of the chunk that completed the object, tracker)."""
+    tracker = _JsonEndTracker()
+    for index, chunk in enumerate(chunks):
+        if tracker.feed(chunk):
+            return index, tracker
+    return None, tracker
+
+
+def _tokens(text, size=3):
+    """Split text into small chunks, like streamed tokens."""
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def test_braces_inside_strings_are_ignored():
+    """Braces in string values neither open nor close the object."""
+    text = '{"pattern": "}{ and {{", "nested": {"note": "}"}} trailing prose'
+    index, tracker = _feed(_tokens(text))
+
+    assert index is not None, "object end never detected"
+    assert tracker.json_text == '{"pattern": "}{ and {{", "nested": {"note": "}"}}'
+
+
+def test_escaped_quotes_keep_the_string_open():
+    """An escaped quote, even split from its backslash, does not end the string."""
+    obj = '{"quote": "she said \\"}\\" then left", "n": 1}'
+    for split in range(1, len(obj)):
+        index, tracker = _feed([obj[:split], obj[split:], " done"])
+        assert tracker.json_text == obj, f"split at {split}: got {tracker.json_text!r}"
+        assert index in (0, 1)
+
+
+def test_escaped_backslash_before_closing_quote():
+    """A doubled backslash is a literal backslash, so the next quote does close the string."""
+    obj = '{"path": "C:\\\\", "ok": true}'
+    _, tracker = _feed(_tokens(obj, size=1))
+
+    assert tracker.json_text == obj
+
+
+def test_think_block_and_prose_braces_are_skipped():
+    """Braces in a leading <think> block or in non-JSON prose are not the object."""
+    text = '<think>maybe {"draft": 1}</think>Use {placeholders} here: {"final": true} bye'
+    _, tracker = _feed(_tokens(text, size=4))
+
+    assert tracker.json_text == '{"final": true}'
+
+
+def test_truncated_stream_never_completes():
+    """An object cut off mid-stream is not reported as complete."""
+    index, tracker = _feed(_tokens('{"a": {"b": "}"}, "c": [1, 2'))
+
+    assert index is None and tracker.json_text is None
+
+
+class ScriptedOllamaProvider(OllamaProvider):
+    """Ollama provider streaming scripted chunks instead of calling the server."""
+
+    def __init__(self, chunks):
+        super().__init__()
+        self.chunks = chunks
+        self.read = 0
+
+    async def _resolve_model(self, request):
+        return "scripted"
+
+    async def _stream_chunks(self, request, model):
+        for chunk in self.chunks:
+            self.read += 1
+            yield chunk
+
+
+def _generate(chunks):
+    provider = ScriptedOllamaProvider(chunks)
+    request = LLMRequest(prompt="plan", model="scripted", stop_at_json_end=True)
+    return asyncio.run(provider.generate_response(request)), provider.read
+
+
+def test_complete_object_stops_reading():
+    """Once the object is complete the rest of the stream is not read."""
+    chunks = [{"response": text} for text in ('{"plan": ', '"a"}', " and more", " prose")]
+    response, read = _generate(chunks + [{"response": "", "done": True}])
+
+    assert response.content == '{"plan": "a"}'
+    assert read == 2, f"read {read} chunks"
+
+
+def test_truncated_stream_returns_full_response():
+    """A stream ending before the object closes returns the whole cleaned text."""
+    chunks = [{"response": text} for text in ("Sure: ", '{"plan": ', '{"steps": [1')]
+    response, read = _generate(chunks + [{"response": "", "done": True, "eval_count": 3}])
+
+    assert response.success
+    assert response.content == 'Sure: {"plan": {"steps": [1'
+    assert read == 4 and response.usage["completion_tokens"] == 3
+
+
+if __name__ == "__main__":
+    tests = [value for name, value in list(globals().items()) if name.startswith("test_")]
+    failures = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failures += 1
+            print(f"❌ {test.__name__}: {e}")
+    print(f"\nResult: {'✅ PASS' if not failures else '❌ FAIL'}")
+    sys.exit(1 if failures else 0)
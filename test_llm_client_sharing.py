@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Test get_client(): callers with the same configuration share one client, and
+evicting a client to make room never closes it under an earlier caller.
+"""
+import asyncio
+import sys
+
+from src.core import llm_client as llm_module
+from src.core.llm_client import get_client
+
+
+def _track_closes(client, closed):
+    """Record aclose() calls on a client instead of closing its pools."""
+    async def aclose():
+        closed.append(client)
+    client.aclose = aclose
+
+
+def test_same_config_shares_client():
+    """Equal configurations, including nested values, get the same client."""
+    async def run():
+        first = get_client({"max_retries": 2, "extra": {"tags": ["a", "b"]}})
+        second = get_client({"extra": {"tags": ["a", "b"]}, "max_retries": 2})
+        return first is second
+
+    assert asyncio.run(run())
+
+
+def test_eviction_keeps_earlier_callers_client_open():
+    """A fifth configuration evicts the oldest client without closing it."""
+    async def run():
+        closed = []
+
+        # Caller A takes a client, caller B shares it
+        holder_a = get_client({"caller": "first"})
+        _track_closes(holder_a, closed)
+        holder_b = get_client({"caller": "first"})
+        assert holder_a is holder_b
+
+        # Four more configurations push the first one out of the per-loop cache
+        for index in range(llm_module._SHARED_CLIENTS_PER_LOOP):
+            _track_closes(get_client({"caller": f"other-{index}"}), closed)
+        await asyncio.sleep(0)  # let any scheduled close run
+
+        assert not closed, "evicted client was closed under its holders"
+        # A new lookup builds a fresh client; the holders keep theirs
+        assert get_client({"caller": "first"}) is not holder_a
+
+    asyncio.run(run())
+
+
+def test_new_event_loop_gets_new_client():
+    """Clients are not reused across asyncio.run() calls."""
+    async def run():
+        return get_client({"caller": "loop"})
+
+    assert asyncio.run(run()) is not asyncio.run(run())
+
+
+def test_unhashable_config_value_is_rejected():
+    """Values that cannot be frozen raise TypeError naming the type."""
+    class Unhashable:
+        __hash__ = None
+
+    async def run():
+        get_client({"value": Unhashable()})
+
+    try:
+        asyncio.run(run())
+    except TypeError as e:
+        assert "Unhashable" in str(e)
+    else:
+        raise AssertionError("expected TypeError")
+
+
+if __name__ == "__main__":
+    tests = [value for name, value in list(globals().items()) if name.startswith("test_")]
+    failures = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failures += 1
+            print(f"❌ {test.__name__}: {e}")
+    print(f"\nResult: {'✅ PASS' if not failures else '❌ FAIL'}")
+    sys.exit(1 if failures else 0)
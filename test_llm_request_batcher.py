@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Test LLMRequestBatcher: identical concurrent requests share one call, every
+waiter gets its own response copy, send errors reach every waiter, and a
+request arriving while nothing is in flight is not held back.
+"""
+import asyncio
+import sys
+
+from src.core.llm_client import LLMRequestBatcher
+from src.core.types import LLMRequest, LLMResponse
+
+
+class RecordingSend:
+    """Send function that counts calls and returns one shared response per prompt."""
+
+    def __init__(self, error: Exception = None):
+        self.calls = []
+        self.error = error
+        self.shared = {}
+
+    async def __call__(self, request: LLMRequest) -> LLMResponse:
+        self.calls.append(request)
+        await asyncio.sleep(0)
+        if self.error is not None:
+            raise self.error
+        return self.shared.setdefault(request.prompt, LLMResponse(
+            content=f"answer to {request.prompt}", model=request.model,
+            provider="test", request_id="shared"
+        ))
+
+
+def test_identical_requests_fan_out():
+    """Concurrent identical requests cost one call and each gets its request_id."""
+    async def run():
+        send = RecordingSend()
+        batcher = LLMRequestBatcher(send, max_wait=10.0)
+        requests = [LLMRequest(prompt="same") for _ in range(3)] + [LLMRequest(prompt="other")]
+
+        responses = await asyncio.wait_for(
+            asyncio.gather(*(batcher.submit(request) for request in requests)), 1.0
+        )
+
+        assert len(send.calls) == 2, f"expected 2 provider calls, got {len(send.calls)}"
+        assert [r.request_id for r in responses] == [r.request_id for r in requests]
+        assert [r.content for r in responses] == ["answer to same"] * 3 + ["answer to other"]
+
+    asyncio.run(run())
+
+
+def test_waiters_get_isolated_copies():
+    """Waiters never share a response object with each other or with the sender."""
+    async def run():
+        send = RecordingSend()
+        batcher = LLMRequestBatcher(send)
+
+        first, second = await asyncio.gather(
+            batcher.submit(LLMRequest(prompt="same")),
+            batcher.submit(LLMRequest(prompt="same"))
+        )
+        first.content = "mutated"
+
+        assert first is not second
+        assert second.content == "answer to same"
+        assert send.shared["same"].request_id == "shared"
+        assert send.shared["same"].content == "answer to same"
+
+    asyncio.run(run())
+
+
+def test_send_error_reaches_every_waiter():
+    """A failed call raises in all callers that were deduplicated onto it."""
+    async def run():
+        batcher = LLMRequestBatcher(RecordingSend(error=ConnectionError("ollama down")))
+
+        results = await asyncio.gather(
+            batcher.submit(LLMRequest(prompt="same")),
+            batcher.submit(LLMRequest(prompt="same")),
+            return_exceptions=True
+        )
+
+        assert all(isinstance(result, ConnectionError) for result in results), results
+        assert not batcher._dispatches
+
+    asyncio.run(run())
+
+
+def test_lone_request_skips_wait():
+    """With nothing in flight a request is sent without waiting max_wait."""
+    async def run():
+        send = RecordingSend()
+        batcher = LLMRequestBatcher(send, max_wait=10.0)
+
+        response = await asyncio.wait_for(batcher.submit(LLMRequest(prompt="alone")), 1.0)
+
+        assert response.content == "answer to alone"
+        assert not batcher._dispatches, "finished dispatch still tracked"
+
+    asyncio.run(run())
+
+
+def test_dispatch_task_is_tracked_while_running():
+    """The batcher holds a reference to each dispatch until it finishes."""
+    async def run():
+        release = asyncio.Event()
+
+        async def send(request):
+            await release.wait()
+            return LLMResponse(content="ok", model=request.model, provider="test")
+
+        batcher = LLMRequestBatcher(send)
+        waiter = asyncio.ensure_future(batcher.submit(LLMRequest(prompt="slow")))
+        await asyncio.sleep(0.01)
+        assert len(batcher._dispatches) == 1
+
+        release.set()
+        await waiter
+        await asyncio.sleep(0)
+        assert not batcher._dispatches
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    tests = [value for name, value in list(globals().items()) if name.startswith("test_")]
+    failures = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failures += 1
+            print(f"❌ {test.__name__}: {e}")
+    print(f"\nResult: {'✅ PASS' if not failures else '❌ FAIL'}")
+    sys.exit(1 if failures else 0)
@@ -15,6 +15,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), ''))
 
 from src.core.types import Task, TaskPriority, AgentRole
 from src.agents.domain_advisor.domain_advisor import DomainAdvisorAgent
+from src.core.base_agent import enable_eager_task_factory, install_uvloop
 from src.core.llm_client import initialize_llm_client
 
 
@@ -107,9 +108,10 @@ async def test_retry_with_vague_requirements():
             print(f"  {i}. {suggestion}")
     
     # Display retry information if available
-    if 'review_results' in response.metadata:
+    trace = response.full_trace()
+    if 'review_results' in trace:
         print(f"\n\nReview Results Across Attempts:")
-        for i, review in enumerate(response.metadata['review_results'], 1):
+        for i, review in enumerate(trace['review_results'], 1):
             print(f"\nAttempt {i}:")
             print(f"  - Approved: {review['approved']}")
             print(f"  - Score: {review['score']:.2f}")
@@ -119,8 +121,8 @@ async def test_retry_with_vague_requirements():
                     print(f"    • {issue}")
     
     # Display improvement context if retries occurred
-    if response.metadata.get('improvement_context'):
-        ic = response.metadata['improvement_context']
+    if trace.get('improvement_context'):
+        ic = trace['improvement_context']
         print(f"\n\nImprovement Context:")
         print(f"  - Total retry attempts: {ic['attempt_number']}")
         print(f"  - Quality score progression: {[f'{score:.2f}' for score in ic['quality_scores']]}")
@@ -224,6 +226,7 @@ async def test_clear_requirements_no_retry():
 
 async def main():
     """Run both tests to demonstrate retry mechanism."""
+    enable_eager_task_factory()
     
     print("\n" + "="*80)
     print("PHASE 1 RETRY MECHANISM TEST SUITE")
@@ -262,4 +265,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
\ No newline at end of file
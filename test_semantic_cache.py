@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Test SemanticCache at capacity: a full cache keeps accepting responses by
+dropping expired entries first and otherwise the oldest entry.
+"""
+import asyncio
+import sys
+
+from src.core.response_cache import SemanticCache
+from src.core.types import LLMRequest, LLMResponse
+
+
+# One orthogonal embedding per prompt, so only identical prompts match
+_EMBEDDINGS = {prompt: [float(index == position) for position in range(8)]
+               for index, prompt in enumerate(["a", "b", "c", "d", "e", "f", "g", "h"])}
+
+
+async def _embed(text):
+    return _EMBEDDINGS[text]
+
+
+def _store(cache, prompt, system_prompt="You are helpful."):
+    """Look a prompt up and store an answer for it, as LLMClient does on a miss."""
+    async def run():
+        request = LLMRequest(prompt=prompt, system_prompt=system_prompt)
+        _, embedding = await cache.lookup(request)
+        cache.store(request, embedding, LLMResponse(content=f"answer {prompt}", model="m", provider="p"))
+    asyncio.run(run())
+
+
+def _cached(cache, prompt, system_prompt="You are helpful."):
+    """Content cached for a prompt, or None."""
+    response, _ = asyncio.run(cache.lookup(LLMRequest(prompt=prompt, system_prompt=system_prompt)))
+    return response.content if response else None
+
+
+def test_full_cache_evicts_oldest_entry():
+    """The oldest entry, whichever partition it is in, makes way for a new one."""
+    cache = SemanticCache(_embed, max_entries=3, ttl=None)
+    _store(cache, "a", system_prompt="other partition")
+    _store(cache, "b")
+    _store(cache, "c")
+
+    _store(cache, "d")
+
+    assert cache.get_statistics()["entries"] == 3
+    assert _cached(cache, "a", system_prompt="other partition") is None
+    assert [_cached(cache, prompt) for prompt in "bcd"] == ["answer b", "answer c", "answer d"]
+    assert len(cache._partitions) == 1, "emptied partition was kept"
+
+
+def test_full_cache_drops_expired_entries_first():
+    """Expired entries are dropped before any live entry is evicted."""
+    cache = SemanticCache(_embed, max_entries=3, ttl=3600.0)
+    _store(cache, "a")
+    _store(cache, "b")
+    _store(cache, "c")
+    # Age the first two entries past the TTL
+    stored_at = next(iter(cache._partitions.values()))[2]
+    stored_at[0] -= 7200.0
+    stored_at[1] -= 7200.0
+
+    _store(cache, "d")
+
+    assert cache.get_statistics()["entries"] == 2
+    assert [_cached(cache, prompt) for prompt in "abcd"] == [None, None, "answer c", "answer d"]
+
+
+def test_cache_stays_bounded():
+    """Storing past capacity never grows the cache beyond max_entries."""
+    cache = SemanticCache(_embed, max_entries=2, ttl=None)
+    for prompt in "abcdefgh":
+        _store(cache, prompt)
+
+    assert cache.get_statistics()["entries"] == 2
+    assert [_cached(cache, prompt) for prompt in "gh"] == ["answer g", "answer h"]
+
+
+if __name__ == "__main__":
+    tests = [value for name, value in list(globals().items()) if name.startswith("test_")]
+    failures = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failures += 1
+            print(f"❌ {test.__name__}: {e}")
+    print(f"\nResult: {'✅ PASS' if not failures else '❌ FAIL'}")
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Test that responses cut at the end of the JSON object (stop_at_json_end) are
+kept apart from full responses by the response cache and the request batcher.
+"""
+import asyncio
+import sys
+
+from src.core.llm_client import LLMClient
+from src.core.types import LLMRequest, LLMResponse
+
+
+_FULL = '{"answer": 42}\n\nThe answer is explained above.'
+_TRUNCATED = '{"answer": 42}'
+
+
+class RecordingLLMClient(LLMClient):
+    """LLM client whose Ollama calls return canned content and are counted."""
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.calls = 0
+
+    async def _call_ollama(self, request: LLMRequest) -> LLMResponse:
+        self.calls += 1
+        return LLMResponse(
+            content=_TRUNCATED if request.stop_at_json_end else _FULL,
+            model=request.model,
+            provider="ollama"
+        )
+
+
+def _requests():
+    """The same prompt with and without truncation."""
+    common = {"prompt": "What is the answer?", "model": "qwen3:14b", "temperature": 0.0}
+    return LLMRequest(**common), LLMRequest(stop_at_json_end=True, **common)
+
+
+async def test_response_cache():
+    """Both variants are cached separately."""
+    client = RecordingLLMClient({})
+    full, truncated = _requests()
+
+    results = [
+        await client.generate_response(full),
+        await client.generate_response(truncated),
+        await client.generate_response(full),
+        await client.generate_response(truncated)
+    ]
+    contents = [response.content for response in results]
+
+    ok = contents == [_FULL, _TRUNCATED, _FULL, _TRUNCATED] and client.calls == 2
+    print(f"{'✅' if ok else '❌'} Response cache: contents={contents}, provider calls={client.calls}")
+    return ok
+
+
+async def test_batcher():
+    """Concurrent variants are not deduplicated into one call."""
+    client = RecordingLLMClient({"enable_response_cache": False})
+    full, truncated = _requests()
+
+    full_response, truncated_response = await asyncio.gather(
+        client.generate_batched(full),
+        client.generate_batched(truncated)
+    )
+
+    ok = (full_response.content == _FULL and truncated_response.content == _TRUNCATED
+          and client.calls == 2)
+    print(f"{'✅' if ok else '❌'} Batcher: full={full_response.content!r}, "
+          f"truncated={truncated_response.content!r}, provider calls={client.calls}")
+    return ok
+
+
+async def main():
+    """Run both checks."""
+    print("🔍 Testing stop_at_json_end cache separation...")
+    results = [await test_response_cache(), await test_batcher()]
+    return all(results)
+
+
+if __name__ == "__main__":
+    success = asyncio.run(main())
+    print(f"\nResult: {'✅ PASS' if success else '❌ FAIL'}")
+    sys.exit(0 if success else 1)